@@ -0,0 +1,151 @@
+import numbers
+from array import array
+
+import eigen
+import matrix_io
+from matrix import Matrix, LUDecomposition
+from vector_view import VectorView
+
+
+class SharedBuffer(object):
+    # The flat buffer shared by a matrix and all of its views. version is increased by every write through
+    # any of them, so each one can tell whether its cached decomposition is still valid.
+    def __init__(self, data):
+        self.data = data
+        self.version = 0
+
+
+class ArrayMatrix(Matrix):
+    # Matrix stored in a flat buffer (array('d') by default) addressed through row and column strides.
+    # Rows, columns, the transpose and submatrices are views that share the buffer. data is a flat
+    # sequence, or the SharedBuffer of the matrix the new one is a view of.
+    def __init__(self, elements, data=None, offset=0, row_stride=None, col_stride=1):
+        if data is None:
+            row_count = self.check_positive_length(elements)
+            col_count = self.check_positive_length(elements[0])
+            data = array("d")
+            for row in elements:
+                data.extend(self.check_equal_length(row, col_count))
+        else:
+            row_count, col_count = elements
+        self.buffer = data if isinstance(data, SharedBuffer) else SharedBuffer(data)
+        self.row_count = row_count
+        self.col_count = col_count
+        self.data = self.buffer.data
+        self.offset = offset
+        self.row_stride = col_count*col_stride if row_stride is None else row_stride
+        self.col_stride = col_stride
+        self.lu_decomposition = None
+        self.lu_version = None
+        self.eigen_decomposition = None
+        self.eigen_version = None
+
+    @property
+    def elements(self):
+        return [self.get_row(i) for i in range(self.row_count)]
+
+    def get_index(self, i, j):
+        if i < 0:
+            i += self.row_count
+        if j < 0:
+            j += self.col_count
+        return self.offset + i*self.row_stride + j*self.col_stride
+
+    def get_element(self, i, j):
+        return self.data[self.get_index(i, j)]
+
+    def set_element(self, i, j, value):
+        self.data[self.get_index(i, j)] = value
+        self.invalidate_decomposition()
+
+    def get_row(self, i):
+        return VectorView(self.data, self.get_index(i, 0), self.col_stride, self.col_count, self.buffer)
+
+    def get_col(self, j):
+        return VectorView(self.data, self.get_index(0, j), self.row_stride, self.row_count, self.buffer)
+
+    def set_row(self, i, elements):
+        assert len(elements) == self.col_count
+        start = self.get_index(i, 0)
+        for j, element in enumerate(list(elements)):
+            self.data[start + j*self.col_stride] = element
+        self.invalidate_decomposition()
+
+    def write_row(self, i, row):
+        self.set_row(i, row)
+
+    def set_col(self, j, elements):
+        assert len(elements) == self.row_count
+        start = self.get_index(0, j)
+        for i, element in enumerate(list(elements)):
+            self.data[start + i*self.row_stride] = element
+        self.invalidate_decomposition()
+
+    def invalidate_decomposition(self):
+        self.buffer.version += 1
+
+    def get_lu_decomposition(self):
+        assert self.row_count == self.col_count
+        if self.lu_decomposition is None or self.lu_version != self.buffer.version:
+            self.lu_decomposition = LUDecomposition(self.elements)
+            self.lu_version = self.buffer.version
+        return self.lu_decomposition
+
+    def get_eigen_decomposition(self):
+        if self.eigen_decomposition is None or self.eigen_version != self.buffer.version:
+            self.eigen_decomposition = eigen.eigen(self)
+            self.eigen_version = self.buffer.version
+        return self.eigen_decomposition
+
+    def transposed(self):
+        return ArrayMatrix((self.col_count, self.row_count), self.buffer, self.offset, self.col_stride, self.row_stride)
+
+    def submatrix(self, rows, cols):
+        row_start, row_stop, row_step = rows.indices(self.row_count)
+        col_start, col_stop, col_step = cols.indices(self.col_count)
+        shape = (len(range(row_start, row_stop, row_step)), len(range(col_start, col_stop, col_step)))
+        assert shape[0] > 0 and shape[1] > 0
+        offset = self.get_index(row_start, col_start)
+        return ArrayMatrix(shape, self.buffer, offset, self.row_stride*row_step, self.col_stride*col_step)
+
+    def __getitem__(self, key):
+        rows, cols = key if isinstance(key, tuple) else (key, slice(None))
+        if isinstance(rows, slice) and isinstance(cols, slice):
+            return self.submatrix(rows, cols)
+        if isinstance(rows, numbers.Integral) and isinstance(cols, numbers.Integral):
+            if not (-self.row_count <= rows < self.row_count and -self.col_count <= cols < self.col_count):
+                raise IndexError("matrix index out of range")
+            return self.get_element(rows, cols)
+        return Matrix.__getitem__(self, key)
+
+    def copy(self):
+        return ArrayMatrix(self.elements)
+
+    @staticmethod
+    def load(path, mmap=True):
+        shape, data = matrix_io.read(path, mmap)
+        return ArrayMatrix(shape, data)
+
+    def compact(self, rows, cols):
+        data = array("d")
+        for i in rows:
+            start = self.get_index(i, 0)
+            data.extend(self.data[start + j*self.col_stride] for j in cols)
+        self.buffer = SharedBuffer(data)
+        self.data = data
+        self.offset = 0
+        self.row_count = len(rows)
+        self.col_count = len(cols)
+        self.row_stride = self.col_count
+        self.col_stride = 1
+        self.invalidate_decomposition()
+
+    def delete_row(self, i):
+        rows = list(range(self.row_count))
+        del rows[i]
+        self.compact(rows, range(self.col_count))
+
+    def delete_col(self, i):
+        cols = list(range(self.col_count))
+        del cols[i]
+        self.compact(range(self.row_count), cols)
@@ -0,0 +1,71 @@
+import array_matrix
+import matrix
+import unittest
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.elements = [
+            [1,2,3],
+            [4,5,6],
+            [7,8,10]
+        ]
+        self.matrix = array_matrix.ArrayMatrix(self.elements)
+
+    def test_elements(self):
+        self.assertEqual(self.matrix.elements, self.elements)
+        self.assertEqual(self.matrix, matrix.Matrix(self.elements))
+        self.assertEqual(str(self.matrix), "[1.0, 2.0, 3.0]\n[4.0, 5.0, 6.0]\n[7.0, 8.0, 10.0]")
+
+    def test_row_and_col_views(self):
+        row = self.matrix.get_row(1)
+        col = self.matrix.get_col(2)
+        self.assertEqual(row, [4,5,6])
+        self.assertEqual(col, [3,6,10])
+        self.assertEqual(col[1:], [6,10])
+        self.assertEqual(row + col, [4,5,6,3,6,10])
+        self.matrix.set_row(1, [0,0,0])
+        self.assertEqual(row, [0,0,0])
+        self.assertEqual(col, [3,0,10])
+
+    def test_transposed_view(self):
+        transposed = self.matrix.transposed()
+        self.assertEqual(transposed, matrix.Matrix(self.elements).transposed())
+        transposed.set_element(0, 2, 0)
+        self.assertEqual(self.matrix.get_element(2, 0), 0)
+
+    def test_submatrix_view(self):
+        submatrix = self.matrix.submatrix(slice(1, 3), slice(0, 3, 2))
+        self.assertEqual(submatrix.elements, [[4,6],[7,10]])
+        submatrix.set_col(1, [-1,-2])
+        self.assertEqual(self.matrix.get_col(2), [3,-1,-2])
+
+    def test_writes_through_views_invalidate_decomposition(self):
+        square = array_matrix.ArrayMatrix([[4,2],[1,3]])
+        self.assertEqual(square.determinant(), 10)
+        square.transposed().set_element(0, 1, 0)
+        self.assertEqual(square.elements, [[4,2],[0,3]])
+        self.assertEqual(square.determinant(), 12)
+        square.get_row(0)[0] = 0
+        self.assertEqual(square.determinant(), 0)
+        transposed = square.transposed()
+        self.assertEqual(transposed.determinant(), 0)
+        square.submatrix(slice(0, 1), slice(0, 1)).set_row(0, [1])
+        self.assertEqual(transposed.determinant(), 3)
+
+    def test_delete(self):
+        self.matrix.delete_row(0)
+        self.matrix.delete_col(-1)
+        self.assertEqual(self.matrix.elements, [[4,5],[7,8]])
+
+    def test_operations(self):
+        dense = matrix.Matrix(self.elements)
+        self.assertEqual(self.matrix*self.matrix.transposed(), dense*dense.transposed())
+        self.assertAlmostEqual(self.matrix.determinant(), dense.determinant())
+        for row1, row2 in zip(self.matrix.row_echelon_form().elements, dense.row_echelon_form().elements):
+            for element1, element2 in zip(row1, row2):
+                self.assertAlmostEqual(element1, element2)
+
+
+if __name__ == '__main__':
+    unittest.main()
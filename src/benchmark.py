@@ -0,0 +1,230 @@
+import json
+import os
+import random
+import sys
+import timeit
+from fractions import Fraction
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+try:
+    import resource
+except ImportError:
+    resource = None
+
+import multiplication
+from complex_numbers import ComplexNumber
+from matrix import Matrix
+
+
+REGRESSION_THRESHOLD = 0.25
+# Cases faster than this or using less memory than this in the baseline are dominated by noise and are not
+# compared. The resident size of a forked child grows by about a hundred kilobytes even for an empty call.
+MIN_COMPARED_TIME = 1e-3
+MIN_COMPARED_MEMORY = {"tracemalloc": 4096, "fork": 1 << 20}
+
+ELEMENT_GENERATORS = {
+    "int": lambda: random.randint(-9, 9) or 1,
+    "float": lambda: random.uniform(-1, 1),
+    "Fraction": lambda: Fraction(random.randint(-9, 9) or 1, random.randint(1, 9)),
+    "ComplexNumber": lambda: ComplexNumber(random.uniform(-1, 1), random.uniform(-1, 1)),
+}
+
+# Every call builds a new Matrix, so cached decompositions never leak from one repetition into the next.
+OPERATIONS = {
+    "__mul__": lambda elements: Matrix(elements)*Matrix(elements),
+    "determinant": lambda elements: Matrix(elements).determinant(),
+    "inverse": lambda elements: Matrix(elements).inverse(),
+    "row_echelon_form": lambda elements: Matrix(elements).row_echelon_form(),
+}
+# Operations that are only defined for non-singular matrices. Singular samples of them are not timed.
+NON_SINGULAR_OPERATIONS = ("inverse",)
+
+
+def random_elements(row_count, col_count, generator=random.random):
+    return [[generator() for _ in range(col_count)] for _ in range(row_count)]
+
+
+def time_call(function, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = timeit.default_timer()
+        function()
+        best = min(best, timeit.default_timer() - start)
+    return best
+
+
+def sparse_elements(size, element_type, density):
+    # Off-diagonal elements are non-zero with the given probability; the diagonal always is, which keeps
+    # most sparse samples non-singular.
+    generator = ELEMENT_GENERATORS[element_type]
+    return [[generator() if i == j or random.random() < density else 0 for j in range(size)] for i in range(size)]
+
+
+def measure_child_peak_memory(function):
+    # Growth of the peak resident size (ru_maxrss) of a forked child while it makes the call, in bytes, or
+    # None when the call failed in the child.
+    read_end, write_end = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        status = 1
+        try:
+            os.close(read_end)
+            before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            function()
+            after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            os.write(write_end, str((after - before)*1024).encode())
+            status = 0
+        finally:
+            os._exit(status)
+    os.close(write_end)
+    with os.fdopen(read_end) as f:
+        output = f.read()
+    os.waitpid(pid, 0)
+    return int(output) if output else None
+
+
+def measure_peak_memory(function):
+    # (bytes, source) for the call. With tracemalloc the bytes are the peak allocated during the call. On
+    # Python 2 the call is made in a forked child and the growth of its peak resident size is used. Without
+    # either, memory is not measured and not compared.
+    if tracemalloc is not None:
+        tracemalloc.start()
+        try:
+            function()
+            return tracemalloc.get_traced_memory()[1], "tracemalloc"
+        finally:
+            tracemalloc.stop()
+    if resource is not None and hasattr(os, "fork"):
+        return measure_child_peak_memory(function), "fork"
+    return None, None
+
+
+def run_case(operation, size, element_type, density, repeat=3):
+    elements = sparse_elements(size, element_type, density)
+    function = lambda: OPERATIONS[operation](elements)
+    if operation in NON_SINGULAR_OPERATIONS and Matrix(elements).is_singular():
+        peak_memory = memory_source = time = None
+    else:
+        peak_memory, memory_source = measure_peak_memory(function)
+        time = time_call(function, repeat)
+    return {
+        "operation": operation,
+        "size": size,
+        "type": element_type,
+        "density": density,
+        "time": time,
+        "peak_memory": peak_memory,
+        "memory_source": memory_source,
+    }
+
+
+def run_suite(sizes, element_types=None, densities=(1.0,), operations=None, repeat=3, seed=0):
+    random.seed(seed)
+    records = []
+    for operation in sorted(operations or OPERATIONS):
+        for element_type in sorted(element_types or ELEMENT_GENERATORS):
+            for density in densities:
+                for size in sizes:
+                    records.append(run_case(operation, size, element_type, density, repeat))
+    return records
+
+
+def save_results(records, path):
+    with open(path, "w") as f:
+        json.dump(records, f, indent=1, sort_keys=True)
+
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def get_case(record):
+    return record["operation"], record["size"], record["type"], record["density"]
+
+
+def is_compared_memory(record):
+    return record.get("memory_source") in MIN_COMPARED_MEMORY and record["peak_memory"] is not None
+
+
+def is_memory_comparable(record, baseline_record):
+    return is_compared_memory(record) and is_compared_memory(baseline_record) \
+        and record["memory_source"] == baseline_record["memory_source"]
+
+
+def find_regressions(records, baseline, threshold=REGRESSION_THRESHOLD):
+    # Cases whose time or peak memory grew by more than threshold over the baseline, as (case, key,
+    # baseline value, value). Peak memory is only compared when both runs measured it the same way, with
+    # tracemalloc or in a forked child.
+    baseline_records = dict((get_case(record), record) for record in baseline)
+    regressions = []
+    for record in records:
+        baseline_record = baseline_records.get(get_case(record))
+        if baseline_record is None:
+            continue
+        baseline_time, time = baseline_record["time"], record["time"]
+        if baseline_time is not None and baseline_time >= MIN_COMPARED_TIME and time is not None \
+                and time > baseline_time*(1 + threshold):
+            regressions.append((get_case(record), "time", baseline_time, time))
+        baseline_memory, memory = baseline_record.get("peak_memory"), record["peak_memory"]
+        if is_memory_comparable(record, baseline_record) and baseline_memory >= MIN_COMPARED_MEMORY[record["memory_source"]] \
+                and memory > baseline_memory*(1 + threshold):
+            regressions.append((get_case(record), "peak_memory", baseline_memory, memory))
+    return regressions
+
+
+def multiplication_crossover(sizes, repeat=3):
+    # One level of Strassen recursion against the blocked kernel for each size. The threshold should
+    # sit just below the first size where Strassen wins.
+    rows = []
+    for size in sizes:
+        a = random_elements(size, size)
+        b = random_elements(size, size)
+        blocked = time_call(lambda: multiplication.blocked_multiply(a, b), repeat)
+        strassen = time_call(lambda: multiplication.strassen_multiply(a, b, size-1), repeat)
+        rows.append((size, blocked, strassen))
+    return rows
+
+
+def find_crossover(rows):
+    for size, blocked, strassen in rows:
+        if strassen < blocked:
+            return size
+    return None
+
+
+def print_crossover():
+    rows = multiplication_crossover([32, 64, 128, 192, 256, 384, 512])
+    print "size  blocked (s)  strassen (s)"
+    for size, blocked, strassen in rows:
+        print "%4d  %11.4f  %12.4f" % (size, blocked, strassen)
+    print "crossover:", find_crossover(rows)
+
+
+def run_and_compare(output_path, baseline_path=None):
+    # python benchmark.py suite results.json [baseline.json]; exits with 1 when a case regressed.
+    records = run_suite([4, 8, 16, 32], densities=(0.1, 0.5, 1.0))
+    save_results(records, output_path)
+    if baseline_path is None:
+        return 0
+    baseline = load_results(baseline_path)
+    regressions = find_regressions(records, baseline)
+    baseline_records = dict((get_case(record), record) for record in baseline)
+    if not any(get_case(record) in baseline_records and is_memory_comparable(record, baseline_records[get_case(record)]) for record in records):
+        print "peak memory not compared: it was not measured the same way per call in both runs"
+    for case, key, baseline_value, value in regressions:
+        if key == "time":
+            print "%s size %d %s density %.2f: %.4f s -> %.4f s" % (case + (baseline_value, value))
+        else:
+            print "%s size %d %s density %.2f: %d bytes -> %d bytes" % (case + (baseline_value, value))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 2 and sys.argv[1] == "suite":
+        sys.exit(run_and_compare(*sys.argv[2:4]))
+    else:
+        print_crossover()
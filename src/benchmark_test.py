@@ -0,0 +1,64 @@
+import benchmark
+import unittest
+
+
+class MyTestCase(unittest.TestCase):
+    def test_run_suite(self):
+        records = benchmark.run_suite([2, 3], densities=(0.5, 1.0), repeat=1)
+        self.assertEqual(len(records), 4*4*2*2)
+        for record in records:
+            if record["operation"] != "inverse":
+                self.assertGreaterEqual(record["time"], 0)
+
+    def test_singular_samples_skipped(self):
+        record = benchmark.run_case("inverse", 2, "int", 0.0)
+        self.assertIsNotNone(record["time"])
+        singular = [[1, 2], [2, 4]]
+        original = benchmark.sparse_elements
+        benchmark.sparse_elements = lambda size, element_type, density: singular
+        try:
+            record = benchmark.run_case("inverse", 2, "int", 1.0)
+            self.assertIsNone(record["time"])
+            self.assertIsNone(record["peak_memory"])
+        finally:
+            benchmark.sparse_elements = original
+
+    def test_failures_not_hidden(self):
+        def fail(elements):
+            assert False
+        benchmark.OPERATIONS["fail"] = fail
+        try:
+            self.assertRaises(AssertionError, benchmark.run_case, "fail", 2, "int", 1.0)
+        finally:
+            del benchmark.OPERATIONS["fail"]
+
+    def test_find_regressions(self):
+        baseline = [
+            {"operation": "determinant", "size": 4, "type": "int", "density": 1.0, "time": 1.0, "peak_memory": 10**5, "memory_source": "tracemalloc"},
+            {"operation": "inverse", "size": 4, "type": "int", "density": 1.0, "time": 1.0, "peak_memory": 10**5, "memory_source": "tracemalloc"},
+            {"operation": "__mul__", "size": 4, "type": "int", "density": 1.0, "time": 1.0, "peak_memory": 10**5, "memory_source": "ru_maxrss"},
+        ]
+        records = [
+            {"operation": "determinant", "size": 4, "type": "int", "density": 1.0, "time": 1.1, "peak_memory": 2*10**5, "memory_source": "tracemalloc"},
+            {"operation": "inverse", "size": 4, "type": "int", "density": 1.0, "time": 2.0, "peak_memory": 10**5, "memory_source": "tracemalloc"},
+            {"operation": "inverse", "size": 8, "type": "int", "density": 1.0, "time": 9.0, "peak_memory": 10**6, "memory_source": "tracemalloc"},
+            {"operation": "__mul__", "size": 4, "type": "int", "density": 1.0, "time": 1.0, "peak_memory": 10**6, "memory_source": "ru_maxrss"},
+        ]
+        self.assertEqual(benchmark.find_regressions(records, baseline), [
+            (("determinant", 4, "int", 1.0), "peak_memory", 10**5, 2*10**5),
+            (("inverse", 4, "int", 1.0), "time", 1.0, 2.0),
+        ])
+        self.assertEqual(len(benchmark.find_regressions(records, baseline, threshold=0.05)), 3)
+        records[0]["memory_source"] = "fork"
+        self.assertEqual(len(benchmark.find_regressions(records, baseline)), 1)
+
+    def test_peak_memory(self):
+        size, source = benchmark.measure_peak_memory(lambda: [[1.0]*500 for _ in range(2000)])
+        self.assertIn(source, ("tracemalloc", "fork"))
+        self.assertGreater(size, 10**6)
+        if source == "fork":
+            self.assertIsNone(benchmark.measure_child_peak_memory(lambda: 1/0))
+
+
+if __name__ == '__main__':
+    unittest.main()
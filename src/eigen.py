@@ -0,0 +1,397 @@
+import math
+
+from complex_numbers import ComplexNumber
+
+
+EPSILON = 2.0**-52
+MAX_QR_ITERATIONS = 30
+INVERSE_ITERATIONS = 3
+
+
+def to_float_rows(matrix):
+    return [[float(element) for element in row] for row in matrix.elements]
+
+
+def get_norm(rows):
+    return max(sum(abs(element) for element in row) for row in rows) or 1.0
+
+
+def sign(a, b):
+    return abs(a) if b >= 0 else -abs(a)
+
+
+def to_result(value):
+    if isinstance(value, complex):
+        return ComplexNumber(value.real, value.imag)
+    return value
+
+
+def sort_key(value):
+    return (value.real, value.imag)
+
+
+def normalise(vector):
+    # Unit length, with the largest component made real and positive so the result is deterministic.
+    length = math.sqrt(sum(abs(element)**2 for element in vector))
+    largest = max(vector, key=abs)
+    factor = abs(largest)/(largest*length)
+    return [element*factor for element in vector]
+
+
+def reduce_to_hessenberg(rows):
+    # Householder reduction in place, H = Q^T A Q. Returns the reflectors (k, v) with P_k = I - 2vv^T/v^Tv
+    # acting on rows and columns k+1..n-1.
+    n = len(rows)
+    reflectors = []
+    for k in range(n-2):
+        x = [rows[i][k] for i in range(k+1, n)]
+        length = math.sqrt(sum(element*element for element in x))
+        if length == 0:
+            continue
+        v = list(x)
+        v[0] += sign(length, x[0])
+        v_length = sum(element*element for element in v)
+        for j in range(k, n):
+            s = 2*sum(v[t]*rows[k+1+t][j] for t in range(len(v)))/v_length
+            for t in range(len(v)):
+                rows[k+1+t][j] -= s*v[t]
+        for row in rows:
+            s = 2*sum(v[t]*row[k+1+t] for t in range(len(v)))/v_length
+            for t in range(len(v)):
+                row[k+1+t] -= s*v[t]
+        for i in range(k+2, n):
+            rows[i][k] = 0.0
+        reflectors.append((k, v, v_length))
+    return reflectors
+
+
+def apply_reflectors(reflectors, vector):
+    vector = list(vector)
+    for k, v, v_length in reversed(reflectors):
+        s = 2*sum(v[t]*vector[k+1+t] for t in range(len(v)))/v_length
+        for t in range(len(v)):
+            vector[k+1+t] -= s*v[t]
+    return vector
+
+
+def hessenberg_qr(a):
+    # Francis double shift QR iterations on an upper Hessenberg matrix, in place. Returns the eigenvalues
+    # as floats and complex numbers.
+    n = len(a)
+    values = [None]*n
+    norm = sum(abs(a[i][j]) for i in range(n) for j in range(max(i-1, 0), n))
+    nn = n-1
+    t = 0.0
+    while nn >= 0:
+        iterations = 0
+        while True:
+            l = nn
+            while l > 0:
+                s = abs(a[l-1][l-1]) + abs(a[l][l])
+                if s == 0.0:
+                    s = norm
+                if abs(a[l][l-1]) <= EPSILON*s:
+                    a[l][l-1] = 0.0
+                    break
+                l -= 1
+            x = a[nn][nn]
+            if l == nn:
+                values[nn] = x + t
+                nn -= 1
+            else:
+                y = a[nn-1][nn-1]
+                w = a[nn][nn-1]*a[nn-1][nn]
+                if l == nn-1:
+                    p = 0.5*(y - x)
+                    q = p*p + w
+                    z = math.sqrt(abs(q))
+                    x += t
+                    if q >= 0.0:
+                        z = p + sign(z, p)
+                        values[nn-1] = values[nn] = x + z
+                        if z != 0.0:
+                            values[nn] = x - w/z
+                    else:
+                        values[nn] = complex(x + p, -z)
+                        values[nn-1] = complex(x + p, z)
+                    nn -= 2
+                else:
+                    assert iterations < MAX_QR_ITERATIONS
+                    if iterations == 10 or iterations == 20:
+                        # Exceptional shift.
+                        t += x
+                        for i in range(nn+1):
+                            a[i][i] -= x
+                        s = abs(a[nn][nn-1]) + abs(a[nn-1][nn-2])
+                        y = x = 0.75*s
+                        w = -0.4375*s*s
+                    iterations += 1
+                    m = nn-2
+                    while m >= l:
+                        z = a[m][m]
+                        r = x - z
+                        s = y - z
+                        p = (r*s - w)/a[m+1][m] + a[m][m+1]
+                        q = a[m+1][m+1] - z - r - s
+                        r = a[m+2][m+1]
+                        s = abs(p) + abs(q) + abs(r)
+                        p /= s
+                        q /= s
+                        r /= s
+                        if m == l:
+                            break
+                        u = abs(a[m][m-1])*(abs(q) + abs(r))
+                        v = abs(p)*(abs(a[m-1][m-1]) + abs(z) + abs(a[m+1][m+1]))
+                        if u <= EPSILON*v:
+                            break
+                        m -= 1
+                    for i in range(m, nn-1):
+                        a[i+2][i] = 0.0
+                        if i != m:
+                            a[i+2][i-1] = 0.0
+                    for k in range(m, nn):
+                        if k != m:
+                            p = a[k][k-1]
+                            q = a[k+1][k-1]
+                            r = a[k+2][k-1] if k+1 != nn else 0.0
+                            x = abs(p) + abs(q) + abs(r)
+                            if x != 0.0:
+                                p /= x
+                                q /= x
+                                r /= x
+                        s = sign(math.sqrt(p*p + q*q + r*r), p)
+                        if s != 0.0:
+                            if k == m:
+                                if l != m:
+                                    a[k][k-1] = -a[k][k-1]
+                            else:
+                                a[k][k-1] = -s*x
+                            p += s
+                            x = p/s
+                            y = q/s
+                            z = r/s
+                            q /= p
+                            r /= p
+                            for j in range(k, nn+1):
+                                p = a[k][j] + q*a[k+1][j]
+                                if k+1 != nn:
+                                    p += r*a[k+2][j]
+                                    a[k+2][j] -= p*z
+                                a[k+1][j] -= p*y
+                                a[k][j] -= p*x
+                            for i in range(l, min(nn, k+3)+1):
+                                p = x*a[i][k] + y*a[i][k+1]
+                                if k+1 != nn:
+                                    p += z*a[i][k+2]
+                                    a[i][k+2] -= p*r
+                                a[i][k+1] -= p*q
+                                a[i][k] -= p
+            if not l+1 < nn:
+                break
+    return values
+
+
+def factorise_hessenberg(h, shift, tiny):
+    # LU of H - shift*I with partial pivoting between neighbouring rows, O(n^2). Zero pivots are replaced
+    # by tiny, so shifts equal to an eigenvalue still give a usable factorisation for inverse iteration.
+    n = len(h)
+    rows = [[element - shift if i == j else element for j, element in enumerate(row)] for i, row in enumerate(h)]
+    steps = []
+    for k in range(n-1):
+        swap = abs(rows[k+1][k]) > abs(rows[k][k])
+        if swap:
+            rows[k], rows[k+1] = rows[k+1], rows[k]
+        if rows[k][k] == 0:
+            rows[k][k] = tiny
+        multiplier = rows[k+1][k]/rows[k][k]
+        for j in range(k+1, n):
+            rows[k+1][j] -= multiplier*rows[k][j]
+        rows[k+1][k] = 0.0
+        steps.append((swap, multiplier))
+    if rows[n-1][n-1] == 0:
+        rows[n-1][n-1] = tiny
+    return rows, steps
+
+
+def solve_factorised(rows, steps, b):
+    n = len(rows)
+    y = list(b)
+    for k, (swap, multiplier) in enumerate(steps):
+        if swap:
+            y[k], y[k+1] = y[k+1], y[k]
+        y[k+1] -= multiplier*y[k]
+    for i in range(n-1, -1, -1):
+        row = rows[i]
+        y[i] = (y[i] - sum(row[j]*y[j] for j in range(i+1, n)))/row[i]
+    return y
+
+
+def hessenberg_eigenvectors(h, values, norm):
+    # Inverse iteration on H for every eigenvalue, one O(n^2) factorisation each. Repeated eigenvalues
+    # start from different vectors, so a diagonalisable eigenspace gives independent vectors.
+    n = len(h)
+    vectors = []
+    for index, value in enumerate(values):
+        rows, steps = factorise_hessenberg(h, value, EPSILON*norm)
+        repeat = sum(1 for i in range(index) if abs(values[i] - value) <= 1e-8*norm)
+        vector = [1.0]*n
+        if repeat > 0:
+            vector[(repeat-1) % n] += n
+        for _ in range(INVERSE_ITERATIONS):
+            vector = normalise(solve_factorised(rows, steps, vector))
+        vectors.append(vector)
+    return vectors
+
+
+def tridiagonalise(z):
+    # Householder reduction of a symmetric matrix, in place; z becomes the orthogonal transformation.
+    # Returns the diagonal and the subdiagonal (e[i] couples rows i and i+1).
+    n = len(z)
+    d = [0.0]*n
+    e = [0.0]*n
+    for i in range(n-1, 0, -1):
+        l = i-1
+        h = scale = 0.0
+        if l > 0:
+            for k in range(i):
+                scale += abs(z[i][k])
+            if scale == 0.0:
+                e[i] = z[i][l]
+            else:
+                for k in range(i):
+                    z[i][k] /= scale
+                    h += z[i][k]*z[i][k]
+                f = z[i][l]
+                g = -math.sqrt(h) if f >= 0 else math.sqrt(h)
+                e[i] = scale*g
+                h -= f*g
+                z[i][l] = f - g
+                f = 0.0
+                for j in range(i):
+                    z[j][i] = z[i][j]/h
+                    g = 0.0
+                    for k in range(j+1):
+                        g += z[j][k]*z[i][k]
+                    for k in range(j+1, i):
+                        g += z[k][j]*z[i][k]
+                    e[j] = g/h
+                    f += e[j]*z[i][j]
+                hh = f/(h + h)
+                for j in range(i):
+                    f = z[i][j]
+                    e[j] = g = e[j] - hh*f
+                    for k in range(j+1):
+                        z[j][k] -= f*e[k] + g*z[i][k]
+        else:
+            e[i] = z[i][l]
+        d[i] = h
+    d[0] = 0.0
+    e[0] = 0.0
+    for i in range(n):
+        if d[i] != 0.0:
+            for j in range(i):
+                g = 0.0
+                for k in range(i):
+                    g += z[i][k]*z[k][j]
+                for k in range(i):
+                    z[k][j] -= g*z[k][i]
+        d[i] = z[i][i]
+        z[i][i] = 1.0
+        for j in range(i):
+            z[j][i] = z[i][j] = 0.0
+    return d, e[1:] + [0.0]
+
+
+def tridiagonal_ql(d, e, z, vectors=True):
+    # Implicitly shifted QL iterations on the tridiagonal matrix, in place. d becomes the eigenvalues and
+    # the columns of z the eigenvectors.
+    n = len(d)
+    for l in range(n):
+        iterations = 0
+        while True:
+            for m in range(l, n-1):
+                if abs(e[m]) <= EPSILON*(abs(d[m]) + abs(d[m+1])):
+                    break
+            else:
+                m = n-1
+            if m == l:
+                break
+            assert iterations < MAX_QR_ITERATIONS
+            iterations += 1
+            g = (d[l+1] - d[l])/(2.0*e[l])
+            r = math.hypot(g, 1.0)
+            g = d[m] - d[l] + e[l]/(g + sign(r, g))
+            s = c = 1.0
+            p = 0.0
+            i = m-1
+            while i >= l:
+                f = s*e[i]
+                b = c*e[i]
+                r = math.hypot(f, g)
+                e[i+1] = r
+                if r == 0.0:
+                    d[i+1] -= p
+                    e[m] = 0.0
+                    break
+                s = f/r
+                c = g/r
+                g = d[i+1] - p
+                r = (d[i] - g)*s + 2.0*c*b
+                p = s*r
+                d[i+1] = g + p
+                g = c*r - b
+                if vectors:
+                    for row in z:
+                        f = row[i+1]
+                        row[i+1] = s*row[i] + c*f
+                        row[i] = c*row[i] - s*f
+                i -= 1
+            if r == 0.0 and i >= l:
+                continue
+            d[l] -= p
+            e[l] = g
+            e[m] = 0.0
+    return d
+
+
+def symmetric_eigen(matrix, vectors=True):
+    z = to_float_rows(matrix)
+    d, e = tridiagonalise(z)
+    values = tridiagonal_ql(d, e, z, vectors)
+    order = sorted(range(len(values)), key=lambda i: values[i])
+    if not vectors:
+        return [values[i] for i in order], None
+    return [values[i] for i in order], [normalise([row[i] for row in z]) for i in order]
+
+
+def general_eigen(matrix, vectors=True):
+    h = to_float_rows(matrix)
+    reflectors = reduce_to_hessenberg(h)
+    hessenberg = [list(row) for row in h] if vectors else None
+    values = sorted(hessenberg_qr(h), key=sort_key)
+    if not vectors:
+        return values, None
+    result = hessenberg_eigenvectors(hessenberg, values, get_norm(hessenberg))
+    return values, [normalise(apply_reflectors(reflectors, vector)) for vector in result]
+
+
+def eigen(matrix, vectors=True):
+    # Eigenvalues in ascending order of real and then imaginary part. Complex eigenvalues and the
+    # components of their eigenvectors are ComplexNumbers.
+    assert matrix.row_count == matrix.col_count
+    if matrix.is_symmetric():
+        values, result = symmetric_eigen(matrix, vectors)
+    else:
+        values, result = general_eigen(matrix, vectors)
+    values = [to_result(value) for value in values]
+    if result is not None:
+        result = [[to_result(element) for element in vector] for vector in result]
+    return values, result
+
+
+def eigenvalues(matrix):
+    return eigen(matrix, vectors=False)[0]
+
+
+def eigenvectors(matrix):
+    return eigen(matrix)[1]
@@ -0,0 +1,87 @@
+import random
+from complex_numbers import ComplexNumber
+import eigen
+import matrix
+import unittest
+
+
+def to_complex(element):
+    if isinstance(element, ComplexNumber):
+        return complex(element.a, element.b)
+    return element
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        random.seed(3)
+        self.elements1 = [
+            [2,0,0],
+            [0,3,4],
+            [0,4,9]
+        ]
+        self.elements2 = [[random.uniform(-5, 5) for _ in range(12)] for _ in range(12)]
+        self.matrix1 = matrix.Matrix(self.elements1)
+        self.matrix2 = matrix.Matrix(self.elements2)
+
+    def assertEigenpairs(self, elements, values, vectors):
+        n = len(elements)
+        for value, vector in zip(values, vectors):
+            value = to_complex(value)
+            vector = [to_complex(element) for element in vector]
+            self.assertAlmostEqual(sum(abs(element)**2 for element in vector), 1)
+            for i in range(n):
+                self.assertAlmostEqual(abs(sum(elements[i][j]*vector[j] for j in range(n)) - value*vector[i]), 0)
+
+    def test_symmetric(self):
+        values = self.matrix1.eigenvalues()
+        for value, expected in zip(values, [1,2,11]):
+            self.assertAlmostEqual(value, expected)
+        vectors = self.matrix1.eigenvectors()
+        self.assertEigenpairs(self.elements1, values, vectors)
+        for element, expected in zip(vectors[1], [1,0,0]):
+            self.assertAlmostEqual(element, expected)
+
+    def test_cached(self):
+        vectors = self.matrix2.eigenvectors()
+        decomposition = self.matrix2.eigen_decomposition
+        self.assertIs(self.matrix2.get_eigen_decomposition(), decomposition)
+        self.assertEqual(self.matrix2.eigenvalues(), decomposition[0])
+        self.assertEqual(self.matrix2.eigenvectors(), vectors)
+        self.matrix2.set_row(0, [0]*12)
+        self.assertIsNone(self.matrix2.eigen_decomposition)
+        self.assertEigenpairs(self.matrix2.elements, self.matrix2.eigenvalues(), self.matrix2.eigenvectors())
+
+    def test_rotation(self):
+        rotation = matrix.Matrix([[0,-1],[1,0]])
+        self.assertEqual(rotation.eigenvalues(), [ComplexNumber(0.0, -1.0), ComplexNumber(0.0, 1.0)])
+        self.assertEigenpairs(rotation.elements, rotation.eigenvalues(), rotation.eigenvectors())
+
+    def test_general(self):
+        values = self.matrix2.eigenvalues()
+        self.assertEqual(len(values), 12)
+        self.assertEigenpairs(self.elements2, values, self.matrix2.eigenvectors())
+        total = sum(map(to_complex, values))
+        self.assertAlmostEqual(abs(total - sum(self.elements2[i][i] for i in range(12))), 0)
+        product = 1
+        for value in values:
+            product *= to_complex(value)
+        self.assertAlmostEqual(abs(product - self.matrix2.determinant())/abs(product), 0)
+
+    def test_repeated(self):
+        elements = [[2,0,1],[0,2,0],[0,0,3]]
+        values, vectors = eigen.eigen(matrix.Matrix(elements))
+        for value, expected in zip(values, [2,2,3]):
+            self.assertAlmostEqual(value, expected)
+        self.assertEigenpairs(elements, values, vectors)
+        self.assertNotAlmostEqual(abs(sum(x*y for x, y in zip(vectors[0], vectors[1]))), 1)
+
+    def test_triangular(self):
+        elements = [[1,5,7],[0,4,2],[0,0,-3]]
+        values, vectors = eigen.eigen(matrix.Matrix(elements))
+        for value, expected in zip(values, [-3,1,4]):
+            self.assertAlmostEqual(value, expected)
+        self.assertEigenpairs(elements, values, vectors)
+
+
+if __name__ == '__main__':
+    unittest.main()
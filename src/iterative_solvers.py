@@ -0,0 +1,116 @@
+import math
+
+from sparse_matrix import SparseMatrix
+
+
+DEFAULT_TOLERANCE = 1e-10
+
+
+class IterativeResult(object):
+    # history holds residual norms: for conjugate gradient the initial one and one after each iteration,
+    # for SOR and Gauss-Seidel the one seen during each sweep.
+    def __init__(self, solution, converged, iterations, history):
+        self.solution = solution
+        self.converged = converged
+        self.iterations = iterations
+        self.history = history
+
+    def __repr__(self):
+        return str(self.solution) + "\nconverged: " + str(self.converged) + " iterations: " + str(self.iterations)
+
+
+def get_rows(matrix):
+    # (col_indices, values) for every row. Sparse rows only hold the non-zeros; dense rows share one index
+    # list and the matrix's own row lists, so nothing is copied.
+    if isinstance(matrix, SparseMatrix):
+        return [matrix.get_sparse_row(i) for i in range(matrix.row_count)]
+    cols = list(range(matrix.col_count))
+    return [(cols, row) for row in matrix.elements]
+
+
+def get_diagonal(rows):
+    diagonal = []
+    for i, (indices, values) in enumerate(rows):
+        element = next((value for j, value in zip(indices, values) if j == i), 0)
+        assert element != 0
+        diagonal.append(float(element))
+    return diagonal
+
+
+def multiply_vector(rows, vector):
+    return [sum(value*vector[j] for j, value in zip(indices, values)) for indices, values in rows]
+
+
+def dot(a, b):
+    return sum(x*y for x, y in zip(a, b))
+
+
+def norm(vector):
+    return math.sqrt(dot(vector, vector))
+
+
+def get_start(matrix, b, x0, max_iterations):
+    assert matrix.row_count == matrix.col_count == len(b)
+    x = [0.0]*len(b) if x0 is None else [float(element) for element in x0]
+    assert len(x) == len(b)
+    if max_iterations is None:
+        max_iterations = 10*len(b)
+    return x, max_iterations
+
+
+def conjugate_gradient(matrix, b, x0=None, tolerance=DEFAULT_TOLERANCE, max_iterations=None, jacobi=False):
+    # For symmetric positive definite matrices. Stops when the residual norm is at most tolerance*|b|.
+    # With jacobi=True the residual is preconditioned with the inverse of the diagonal.
+    x, max_iterations = get_start(matrix, b, x0, max_iterations)
+    rows = get_rows(matrix)
+    inverse_diagonal = [1/element for element in get_diagonal(rows)] if jacobi else None
+    threshold = tolerance*(norm(b) or 1.0)
+    r = [b_i - element for b_i, element in zip(b, multiply_vector(rows, x))]
+    z = [element*d for element, d in zip(r, inverse_diagonal)] if jacobi else r
+    p = list(z)
+    rz = dot(r, z)
+    history = [norm(r)]
+    iterations = 0
+    while history[-1] > threshold and iterations < max_iterations:
+        ap = multiply_vector(rows, p)
+        p_ap = dot(p, ap)
+        if p_ap == 0:
+            break
+        alpha = rz/p_ap
+        x = [x_i + alpha*p_i for x_i, p_i in zip(x, p)]
+        r = [r_i - alpha*ap_i for r_i, ap_i in zip(r, ap)]
+        z = [element*d for element, d in zip(r, inverse_diagonal)] if jacobi else r
+        new_rz = dot(r, z)
+        beta = new_rz/rz
+        rz = new_rz
+        p = [z_i + beta*p_i for z_i, p_i in zip(z, p)]
+        iterations += 1
+        history.append(norm(r))
+    return IterativeResult(x, history[-1] <= threshold, iterations, history)
+
+
+def sor(matrix, b, omega=1.5, x0=None, tolerance=DEFAULT_TOLERANCE, max_iterations=None):
+    # Successive over-relaxation sweeps, updating x in place. The residual of each row is formed during
+    # the sweep from the current x, so an iteration reads every non-zero once.
+    assert 0 < omega < 2
+    x, max_iterations = get_start(matrix, b, x0, max_iterations)
+    rows = get_rows(matrix)
+    diagonal = get_diagonal(rows)
+    threshold = tolerance*(norm(b) or 1.0)
+    history = []
+    iterations = 0
+    while iterations < max_iterations:
+        residual = 0.0
+        for i, (indices, values) in enumerate(rows):
+            r_i = b[i] - sum(value*x[j] for j, value in zip(indices, values))
+            residual += r_i*r_i
+            x[i] += omega*r_i/diagonal[i]
+        iterations += 1
+        history.append(math.sqrt(residual))
+        if history[-1] <= threshold:
+            break
+    return IterativeResult(x, len(history) > 0 and history[-1] <= threshold, iterations, history)
+
+
+def gauss_seidel(matrix, b, x0=None, tolerance=DEFAULT_TOLERANCE, max_iterations=None):
+    return sor(matrix, b, 1, x0, tolerance, max_iterations)
@@ -0,0 +1,51 @@
+import iterative_solvers
+import matrix
+import sparse_matrix
+import unittest
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        n = 30
+        self.elements = [[4 if i == j else -1 if abs(i-j) == 1 else 0 for j in range(n)] for i in range(n)]
+        self.solution = [float(i % 7 - 3) for i in range(n)]
+        self.b = [sum(a*x for a, x in zip(row, self.solution)) for row in self.elements]
+        self.matrix = matrix.Matrix(self.elements)
+        self.sparse = sparse_matrix.to_sparse(self.matrix)
+
+    def assertSolution(self, result):
+        self.assertTrue(result.converged)
+        for element, expected in zip(result.solution, self.solution):
+            self.assertAlmostEqual(element, expected)
+
+    def test_conjugate_gradient(self):
+        result = iterative_solvers.conjugate_gradient(self.matrix, self.b)
+        self.assertSolution(result)
+        self.assertEqual(len(result.history), result.iterations + 1)
+        self.assertLessEqual(result.iterations, 30)
+        self.assertSolution(iterative_solvers.conjugate_gradient(self.sparse, self.b, jacobi=True))
+
+    def test_gauss_seidel(self):
+        result = iterative_solvers.gauss_seidel(self.sparse, self.b)
+        self.assertSolution(result)
+        self.assertEqual(len(result.history), result.iterations)
+        self.assertLess(result.history[-1], result.history[0])
+        self.assertSolution(iterative_solvers.gauss_seidel(self.matrix, self.b))
+
+    def test_sor(self):
+        gauss_seidel = iterative_solvers.gauss_seidel(self.sparse, self.b)
+        result = iterative_solvers.sor(self.sparse, self.b, omega=1.1)
+        self.assertSolution(result)
+        self.assertLess(result.iterations, gauss_seidel.iterations)
+
+    def test_max_iterations(self):
+        result = iterative_solvers.sor(self.matrix, self.b, max_iterations=3)
+        self.assertFalse(result.converged)
+        self.assertEqual(result.iterations, 3)
+        result = iterative_solvers.conjugate_gradient(self.matrix, self.b, x0=self.solution)
+        self.assertTrue(result.converged)
+        self.assertEqual(result.iterations, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+import operator
+
+import multiplication
+from matrix import Matrix, wrap_elements
+
+
+def lazy(matrix):
+    return Leaf(matrix)
+
+
+def as_node(other):
+    if isinstance(other, LazyMatrix):
+        return other
+    else:
+        return Leaf(other)
+
+
+class LazyMatrix(object):
+    # Node of an expression tree. Operators only build nodes; the tree is evaluated once, on evaluate()
+    # or on element access. Elementwise chains are computed row by row in one pass and transposes are
+    # read as columns of their operand, so no intermediate matrices are allocated.
+    # A node either computes its rows and columns directly or overrides evaluate; by default rows and
+    # columns are read from the evaluated result.
+    def __init__(self, row_count, col_count):
+        self.row_count = row_count
+        self.col_count = col_count
+        self.result = None
+
+    def get_row(self, i):
+        return self.evaluate().get_row(i)
+
+    def get_col(self, j):
+        return self.evaluate().get_col(j)
+
+    def get_rows(self):
+        return [self.get_row(i) for i in range(self.row_count)]
+
+    def get_cols(self):
+        return [self.get_col(j) for j in range(self.col_count)]
+
+    def evaluate(self):
+        if self.result is None:
+            self.result = wrap_elements([list(row) for row in self.get_rows()])
+        return self.result
+
+    @property
+    def elements(self):
+        return self.evaluate().elements
+
+    def get_element(self, i, j):
+        return self.evaluate().elements[i][j]
+
+    def __repr__(self):
+        return repr(self.evaluate())
+
+    def __eq__(self, other):
+        return self.evaluate() == as_node(other).evaluate()
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def check_matrix_size(self, other):
+        assert self.row_count == other.row_count
+        assert self.col_count == other.col_count
+
+    def __add__(self, other):
+        other = as_node(other)
+        self.check_matrix_size(other)
+        return Elementwise(operator.add, self, other)
+
+    def __radd__(self, other):
+        return as_node(other).__add__(self)
+
+    def __sub__(self, other):
+        other = as_node(other)
+        self.check_matrix_size(other)
+        return Elementwise(operator.sub, self, other)
+
+    def __rsub__(self, other):
+        return as_node(other).__sub__(self)
+
+    def __mul__(self, other):
+        other = as_node(other)
+        assert self.col_count == other.row_count
+        return Product(self, other)
+
+    def __rmul__(self, other):
+        return as_node(other).__mul__(self)
+
+    def scalar_muliplication(self, scalar):
+        return Scale(self, scalar)
+
+    def transposed(self):
+        return Transpose(self)
+
+
+class Leaf(LazyMatrix):
+    def __init__(self, matrix):
+        assert isinstance(matrix, Matrix)
+        LazyMatrix.__init__(self, matrix.row_count, matrix.col_count)
+        self.matrix = matrix
+
+    def get_row(self, i):
+        return self.matrix.get_row(i)
+
+    def get_col(self, j):
+        return self.matrix.get_col(j)
+
+    def evaluate(self):
+        return self.matrix
+
+
+class Elementwise(LazyMatrix):
+    def __init__(self, op, left, right):
+        LazyMatrix.__init__(self, left.row_count, left.col_count)
+        self.op = op
+        self.left = left
+        self.right = right
+
+    def get_row(self, i):
+        return list(map(self.op, self.left.get_row(i), self.right.get_row(i)))
+
+    def get_col(self, j):
+        return list(map(self.op, self.left.get_col(j), self.right.get_col(j)))
+
+
+class Scale(LazyMatrix):
+    def __init__(self, child, scalar):
+        LazyMatrix.__init__(self, child.row_count, child.col_count)
+        self.child = child
+        self.scalar = scalar
+
+    def get_row(self, i):
+        return [element*self.scalar for element in self.child.get_row(i)]
+
+    def get_col(self, j):
+        return [element*self.scalar for element in self.child.get_col(j)]
+
+
+class Transpose(LazyMatrix):
+    def __init__(self, child):
+        LazyMatrix.__init__(self, child.col_count, child.row_count)
+        self.child = child
+
+    def get_row(self, i):
+        return self.child.get_col(i)
+
+    def get_col(self, j):
+        return self.child.get_row(j)
+
+    def get_rows(self):
+        return self.child.get_cols()
+
+    def get_cols(self):
+        return self.child.get_rows()
+
+    def transposed(self):
+        return self.child
+
+
+class Product(LazyMatrix):
+    # The right operand is read column by column; for a transposed operand those are the rows of its child.
+    def __init__(self, left, right):
+        LazyMatrix.__init__(self, left.row_count, right.col_count)
+        self.left = left
+        self.right = right
+
+    def evaluate(self):
+        if self.result is None:
+            self.result = wrap_elements(multiplication.packed_multiply(self.left.get_rows(), self.right.get_cols()))
+        return self.result
+
+    def get_rows(self):
+        return self.evaluate().elements
@@ -0,0 +1,59 @@
+import lazy_matrix
+import matrix
+import unittest
+
+
+class CountingMatrix(matrix.Matrix):
+    transpose_count = 0
+
+    def transposed(self):
+        CountingMatrix.transpose_count += 1
+        return matrix.Matrix.transposed(self)
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.A = matrix.Matrix([[1,2,3],[4,5,6]])
+        self.B = matrix.Matrix([[4,2],[1,11],[3,12]])
+        self.C = matrix.Matrix([[0,1],[1,0]])
+        self.D = matrix.Matrix([[2,2],[3,3]])
+
+    def test_expression(self):
+        expected = self.A*self.B + self.C - self.D.scalar_muliplication(3)
+        A, B, C, D = map(lazy_matrix.lazy, (self.A, self.B, self.C, self.D))
+        expression = A*B + C - D.scalar_muliplication(3)
+        self.assertIsInstance(expression, lazy_matrix.LazyMatrix)
+        self.assertEqual(expression.evaluate(), expected)
+        self.assertEqual(expression.get_element(1, 0), expected.elements[1][0])
+        self.assertEqual(str(expression), str(expected))
+
+    def test_evaluated_once(self):
+        expression = lazy_matrix.lazy(self.A) + self.A
+        self.assertIs(expression.evaluate(), expression.evaluate())
+        self.assertEqual(expression, self.A.scalar_muliplication(2))
+        self.assertEqual(expression.elements, [[2,4,6],[8,10,12]])
+
+    def test_rows_of_evaluated_node(self):
+        expected = self.A*self.B
+        product = lazy_matrix.lazy(self.A)*self.B
+        self.assertEqual(product.get_row(1), expected.get_row(1))
+        result = product.result
+        self.assertEqual(product.get_col(0), expected.get_col(0))
+        self.assertIs(product.result, result)
+        self.assertEqual(product.transposed().get_row(1), expected.get_col(1))
+
+    def test_transpose_folded_into_product(self):
+        counting = CountingMatrix([[1,2,3],[4,5,6]])
+        CountingMatrix.transpose_count = 0
+        expression = lazy_matrix.lazy(counting)*lazy_matrix.lazy(counting).transposed()
+        expression = expression + lazy_matrix.lazy(counting).transposed().transposed()*lazy_matrix.lazy(self.B)
+        self.assertEqual(expression, self.A*self.A.transposed() + self.A*self.B)
+        self.assertEqual(CountingMatrix.transpose_count, 0)
+
+    def test_transposed_elementwise(self):
+        expression = (lazy_matrix.lazy(self.A) - self.B.transposed()).transposed()
+        self.assertEqual(expression, (self.A - self.B.transposed()).transposed())
+
+
+if __name__ == '__main__':
+    unittest.main()
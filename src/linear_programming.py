@@ -1,9 +1,13 @@
 
-from matrix import Matrix, get_unit_matrix, get_row_matrix, IndexElementPair
+from matrix import Matrix, get_row_matrix, IdentityBlock, DiagonalBlock, ColumnBlock
+from pivot_rules import PivotSelector
+from numpy_matrix import create_matrix
+from linear_programming_result import LinearProgrammingResult, coefficients_to_formula
+import revised_simplex
+import warm_start
 
 
-def coefficients_to_formula(coefficients, variable):
-    return "+".join(map(lambda x: "(" + str(x[1]) + "*" + variable + str(x[0]) + ")", enumerate(coefficients)))
+PIVOT_TOLERANCE = 1e-9
 
 
 def get_formula(objective, c, A, b, variable, inequality):
@@ -13,31 +17,17 @@ def get_formula(objective, c, A, b, variable, inequality):
     return result
 
 
-class LinearProgrammingResult(object):
-    def __init__(self, objective_function_value, x_values, c):
-        self.value = objective_function_value
-        self.x_values = x_values
-        self.status = "SUCCESSFUL"
-        self.c = c
-
-    def set_status(self, status):
-        self.status = status
-
-    def __repr__(self):
-        result = ", ".join(map(lambda x: "x" + str(x[0]) + "=" + str(x[1]), enumerate(self.x_values)))
-        result += "\nmax" + coefficients_to_formula(self.c, "x") + " = " + str(self.value)
-        result += "\nStatus: " + str(self.status)
-        return result
-
-
 class LinearProgramming(object):
-    def __init__(self, c, A, b):
+    # With use_numpy the tableau is pivoted with NumpyMatrix kernels when numpy is installed.
+    def __init__(self, c, A, b, pivot_selector=None, use_numpy=False):
         assert isinstance(A, Matrix)
         assert A.row_count == len(b)
         assert A.col_count == len(c)
         self.A = A
         self.b = b
         self.c = c
+        self.pivot_selector = pivot_selector or PivotSelector()
+        self.use_numpy = use_numpy
 
     def __repr__(self):
         return get_formula("max", self.c, self.A.elements, self.b, "x", "<")
@@ -45,129 +35,120 @@ class LinearProgramming(object):
     def dual(self):
         return get_formula("min", self.b, self.A.transposed().elements, self.c, "y", ">")
 
-    def pick_first_positive(self, elements):
-        for i, element in enumerate(elements):
-            if element > 0:
-                return i
-        return None
-
     def build_matrix(self):
-        A_and_unit = self.A.merge_horisontal(get_unit_matrix(self.A.row_count)).merge_horisontal(Matrix([self.b]).transposed())
-        c_and_zero = Matrix([self.c]).merge_horisontal(get_row_matrix(0, self.A.row_count+1))
-        return A_and_unit.merge_vertical(c_and_zero)
-
-    def all_zeros_except_one_one(self, elements):
-        i = None
-        for j, element in enumerate(elements):
-            if i is None and element == 1:
-                i = j
-            elif i is not None and element == 1:
-                return None
-            elif element != 0 and element != 1:
-                return None
-        return i
-
-    def update_x_values(self, matrix, one_index, x_values):
-        if one_index is None:
-            x_values.append(0)
-        else:
-            x_values.append(matrix.elements[one_index][-1])
-
-    def get_result(self, matrix, variable_locations, coefficients):
-        x_values = []
-        for i in variable_locations:
-            col = matrix.get_col(i)
-            one_index = self.all_zeros_except_one_one(col)
-            self.update_x_values(matrix, one_index, x_values)
-        return LinearProgrammingResult(-matrix.elements[-1][-1], x_values, coefficients)
-
-    def calculate_ratio(self, chosen, last):
-        if chosen > 0:
-            return last/chosen
-        else:
-            return float("inf")
-
-    def first_smallest_ratio(self, chosen_col, last_col):
-        minimum_ratio = float("inf")
-        index = None
-        element = None
-        for i, chosen, last in zip(range(len(chosen_col)-1), chosen_col[:-1], last_col[:-1]):
-            ratio = self.calculate_ratio(chosen, last)
-            if ratio < minimum_ratio:
-                element = chosen
-                minimum_ratio = ratio
-                index = i
-        return IndexElementPair(index, element)
+        return Matrix.block([
+            [self.A, IdentityBlock(), ColumnBlock(self.b)],
+            [self.c, 0, 0]
+        ])
+
+    def get_result(self, matrix, basis, variable_locations, coefficients):
+        # basis[i] is the basic variable of row i; every other variable is zero.
+        rows = dict((j, i) for i, j in enumerate(basis))
+        last = matrix.get_col(-1)
+        x_values = [last[rows[j]] if j in rows else 0 for j in variable_locations]
+        return LinearProgrammingResult(-last[-1], x_values, coefficients)
 
     def build_phase_one_matrix(self):
-        A_and_unit = self.A.merge_horisontal(get_unit_matrix(self.A.row_count)).merge_horisontal(Matrix([self.b]).transposed())
-        c_and_zero = Matrix([self.c]).merge_horisontal(get_row_matrix(0, self.A.row_count+1))
-        new_objective = get_row_matrix(0, self.A.col_count).merge_horisontal(get_row_matrix(-1, self.A.row_count)).merge_horisontal(Matrix([[0]]))
-        return A_and_unit.merge_vertical(c_and_zero).merge_vertical(new_objective)#.merge_horisontal(Matrix([([0]*(self.A.row_count+1))+[1]]).transposed())
+        return Matrix.block([
+            [self.A, IdentityBlock(), ColumnBlock(self.b)],
+            [self.c, 0, 0],
+            [0, -1, 0]
+        ])
 
     def build_phase_one_matrix2(self):
-        A_and_unit = []
-        for row_index in range(self.A.row_count):
-            row = self.A.get_row(row_index)
-            if self.b[row_index] < 0:
-                A_elements = list(map(lambda x: -1*x, row))
-                b_element = -self.b[row_index]
-                identity_matrix_row = [0] * row_index + [-1] + [0] * (self.A.row_count - 1 - row_index)
-            else:
-                A_elements = row
-                b_element = self.b[row_index]
-                identity_matrix_row = [0] * row_index + [1] + [0] * (self.A.row_count - 1 - row_index)
-            # identity_matrix_row2 = [0] * row_index + [1] + [0] * (self.A.row_count - 1 - row_index)
-            new_row = A_elements + identity_matrix_row + identity_matrix_row + [b_element]
-            A_and_unit.append(new_row)
-        new_objective = get_row_matrix(0, self.A.col_count+self.A.row_count).merge_horisontal(get_row_matrix(-1, self.A.row_count)).merge_horisontal(Matrix([[0]]))
-        return Matrix(A_and_unit).merge_vertical(new_objective)
+        # Rows with negative b are negated, so every right hand side is non-negative and the artificial
+        # variables (the identity block after the slacks) form a feasible starting basis.
+        signs = [-1 if element < 0 else 1 for element in self.b]
+        A_rows = self.A.elements
+        signed_A = [A_rows[i] if sign > 0 else list(map(lambda x: -1*x, A_rows[i])) for i, sign in enumerate(signs)]
+        return Matrix.block([
+            [signed_A, DiagonalBlock(signs), IdentityBlock(), ColumnBlock([sign*element for sign, element in zip(signs, self.b)])],
+            [0, 0, -1, 0]
+        ])
+
+    def create_tableau(self, matrix):
+        return create_matrix(matrix.elements) if self.use_numpy else matrix
 
     def price_out(self, matrix, indices):
         for row, col in enumerate(indices):
             matrix.make_elements_zero_using_row(row, col)
 
-    def run(self):
-        matrix = self.build_phase_one_matrix2()
-        basic_variable_locations = range(self.A.col_count+self.A.row_count, self.A.col_count+self.A.row_count*2)
-        self.price_out(matrix, basic_variable_locations)
-        basic_variable_count = self.A.row_count
-        result, matrix = self.optimise(matrix, basic_variable_locations, [-1]*basic_variable_count)
-        if not all(map(lambda x: x == 0, result.x_values)) or round(result.value,7) != 0:
+    def pivot(self, matrix, basis, row, col, element):
+        matrix.scale_row(element, row)
+        matrix.make_elements_zero_using_row(row, col)
+        basis[row] = col
+
+    def remove_artificials(self, matrix, basis, artificial_start):
+        # Artificials still basic after phase one are zero. Each is replaced by a variable with a non-zero
+        # element in its row; one exists because the slack columns keep the rows independent.
+        for row, j in enumerate(basis):
+            if j >= artificial_start:
+                elements = matrix.get_row(row)[:artificial_start]
+                col = max(range(artificial_start), key=lambda k: abs(elements[k]))
+                assert abs(elements[col]) > PIVOT_TOLERANCE
+                self.pivot(matrix, basis, row, col, elements[col])
+
+    def run(self, callback=None):
+        # callback(iteration, get_result) is called after every pivot of both phases; get_result() reads the
+        # current solution from the basis header.
+        n, m = self.A.col_count, self.A.row_count
+        matrix = self.create_tableau(self.build_phase_one_matrix2())
+        basis = list(range(n+m, n+2*m))
+        self.price_out(matrix, basis)
+        result, matrix = self.optimise(matrix, basis, list(basis), [-1]*m, callback)
+        if any(round(x, 7) != 0 for x in result.x_values) or round(result.value, 7) != 0:
             result.set_status("UNFEASIBLE")
             return result
-        else:
-            matrix.delete_row(-1)
-            for i in range(self.A.col_count+self.A.row_count-1, self.A.col_count-1, -1):
-                matrix.delete_col(i)
-            matrix = matrix.merge_vertical(Matrix([self.c]).merge_horisontal(get_row_matrix(0, self.A.row_count+1)))
-            for i in range(self.A.col_count+self.A.row_count):
-                col = matrix.get_col(i)[:-1]
-                if sum(map(lambda x: x == 1, col)) == 1 and sum(map(lambda x: x == 0, col)) == matrix.row_count - 2:
-                    matrix.make_elements_zero_using_row(col.index(1), i, [matrix.row_count-1])
-            result = self.optimise(matrix, range(self.A.col_count), self.c)
-            return result[0]
-
-    def optimise(self, matrix, variable_locations, coefficients):
-        max_result = LinearProgrammingResult(-float("inf"), [], [])
+        self.remove_artificials(matrix, basis, n+m)
+        # The artificial columns and the phase one objective row are left out through a view, so the
+        # constraint rows are copied once, by merge_vertical. A numpy tableau does not store its rows and
+        # is converted to lists first.
+        if self.use_numpy:
+            matrix = Matrix(matrix.elements)
+        matrix = matrix[:-1, list(range(n+m)) + [-1]]
+        matrix = self.create_tableau(matrix.merge_vertical(Matrix([self.c]).merge_horisontal(get_row_matrix(0, m+1))))
+        for row, j in enumerate(basis):
+            matrix.make_elements_zero_using_row(row, j, [matrix.row_count-1])
+        return self.optimise(matrix, basis, range(n), self.c, callback)[0]
+
+    def run_revised(self):
+        return revised_simplex.RevisedSimplex(self.c, self.A, self.b, pivot_selector=self.pivot_selector).run()
+
+    def warm_start_solver(self):
+        return warm_start.WarmStartSolver(self.c, self.A, self.b, pivot_selector=self.pivot_selector)
+
+    def get_column_products(self, matrix, vector):
+        # Dot product of vector with every column of the tableau without the objective row.
+        products = [0.0]*(matrix.col_count-1)
+        for i, element in enumerate(vector):
+            if element != 0:
+                row = matrix.get_row(i)
+                for j in range(len(products)):
+                    products[j] += element*row[j]
+        return products
+
+    def optimise(self, matrix, basis, variable_locations, coefficients, callback=None):
+        # basis is updated in place on every pivot; the result is only read from it at the end.
+        self.pivot_selector.reset(matrix.col_count-1)
+        iteration = 0
         while True:
             last_row = matrix.get_row(-1)[:-1]
-            chosen_col = self.pick_first_positive(last_row)
+            chosen_col = self.pivot_selector.choose_entering(last_row, lambda j: matrix.get_col(j)[:-1], PIVOT_TOLERANCE)
             if chosen_col is None:
-                return self.get_result(matrix, variable_locations, coefficients), matrix
-            else:
-                smallest_ratio = self.first_smallest_ratio(matrix.get_col(chosen_col), matrix.get_col(-1))
-                if smallest_ratio.is_none():
-                    max_result.set_status("UNBOUNDED")
-                    return max_result, matrix
-                matrix.scale_row(smallest_ratio.element, smallest_ratio.index)
-                matrix.make_elements_zero_using_row(smallest_ratio.index, chosen_col)
-                result = self.get_result(matrix, variable_locations, coefficients)
-                if result.value >= max_result.value:
-                    max_result = result
-                # else:
-                #     max_result.set_status("UNBOUNDED")
-                #     return max_result, matrix
+                return self.get_result(matrix, basis, variable_locations, coefficients), matrix
+            chosen = matrix.get_col(chosen_col)[:-1]
+            last = matrix.get_col(-1)[:-1]
+            row = self.pivot_selector.choose_leaving(chosen, last, PIVOT_TOLERANCE, basis)
+            if row is None:
+                result = self.get_result(matrix, basis, variable_locations, coefficients)
+                result.set_status("UNBOUNDED")
+                return result, matrix
+            self.pivot_selector.record_pivot(last[row]/float(chosen[row]), chosen_col, basis[row], chosen, row, lambda: matrix.get_row(row)[:-1],
+                                             lambda vector: self.get_column_products(matrix, vector))
+            self.pivot(matrix, basis, row, chosen_col, chosen[row])
+            iteration += 1
+            if callback is not None:
+                callback(iteration, lambda: self.get_result(matrix, basis, variable_locations, coefficients))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,19 @@
+def coefficients_to_formula(coefficients, variable):
+    return "+".join(map(lambda x: "(" + str(x[1]) + "*" + variable + str(x[0]) + ")", enumerate(coefficients)))
+
+
+class LinearProgrammingResult(object):
+    def __init__(self, objective_function_value, x_values, c):
+        self.value = objective_function_value
+        self.x_values = x_values
+        self.status = "SUCCESSFUL"
+        self.c = c
+
+    def set_status(self, status):
+        self.status = status
+
+    def __repr__(self):
+        result = ", ".join(map(lambda x: "x" + str(x[0]) + "=" + str(x[1]), enumerate(self.x_values)))
+        result += "\nmax" + coefficients_to_formula(self.c, "x") + " = " + str(self.value)
+        result += "\nStatus: " + str(self.status)
+        return result
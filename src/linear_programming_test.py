@@ -112,6 +112,52 @@ y0, y1 >= 0"""
         result = lp.run()
         self.assertEqual(result.status, "UNFEASIBLE")
 
+    def test_callback(self):
+        A = matrix.Matrix([
+            [2, -1],
+            [1, 2],
+            [-1, 2]
+        ])
+        lp = linear_programming.LinearProgramming([2, 5], A, [4, 9, 3])
+        iterations = []
+        values = []
+        result = lp.run(lambda iteration, get_result: (iterations.append(iteration), values.append(get_result().value)))
+        # Phase one ends at the optimal vertex, so phase two makes no pivots.
+        self.assertEqual(iterations, [1, 2, 3])
+        self.assertAlmostEqual(values[0], -12)
+        self.assertAlmostEqual(values[-1], 0)
+        self.assertAlmostEqual(result.value, 21)
+
+    def test_numpy_tableau(self):
+        negative_b = matrix.Matrix([
+            [-1,0,-1,0,0],
+            [-1,0,0,-1,0],
+            [-1,-1,0,0,-1],
+            [0,-1,0,0,0],
+            [0,-1,0,0,0]
+        ]).transposed()
+        problems = [
+            ([2, 5], matrix.Matrix([[2, -1], [1, 2], [-1, 2]]), [4, 9, 3], 21),
+            ([-1]*5, negative_b, [-1]*5, -3),
+        ]
+        for c, A, b, value in problems:
+            result = linear_programming.LinearProgramming(c, A, b, use_numpy=True).run()
+            self.assertEqual(result.status, "SUCCESSFUL")
+            self.assertAlmostEqual(result.value, value)
+        result = linear_programming.LinearProgramming([-1, 2, -2], matrix.Matrix([[1, 1, 1], [-1, -1, 1]]), [-5, -5], use_numpy=True).run()
+        self.assertEqual(result.status, "UNFEASIBLE")
+
+    def test_get_result(self):
+        tableau = matrix.Matrix([
+            [0, 1, 1, 2],
+            [1, 0, 3, 4],
+            [0, 0, -1, -10]
+        ])
+        lp = linear_programming.LinearProgramming([1, 1], matrix.Matrix([[1, 0], [0, 1]]), [1, 1])
+        result = lp.get_result(tableau, [1, 0], range(3), [1, 1, 0])
+        self.assertEqual(result.x_values, [4, 2, 0])
+        self.assertEqual(result.value, 10)
+
 
 class WikipediaTestCase(unittest.TestCase):
     def setUp(self):
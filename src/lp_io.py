@@ -0,0 +1,371 @@
+import re
+
+from lp_model import SparseModel, OBJECTIVE_NAME
+
+
+# Readers take any iterable of lines, such as an open file, and build the model as they go, so only the
+# model itself is kept in memory.
+
+MPS_SECTIONS = ("NAME", "OBJSENSE", "ROWS", "COLUMNS", "RHS", "RANGES", "BOUNDS", "ENDATA")
+LP_SECTIONS = {
+    "maximize": "objective", "maximise": "objective", "max": "objective",
+    "minimize": "objective", "minimise": "objective", "min": "objective",
+    "subject to": "constraints", "such that": "constraints", "st": "constraints", "s.t.": "constraints",
+    "bounds": "bounds", "end": "end",
+}
+UNSUPPORTED_LP_SECTIONS = (
+    "general", "generals", "gen", "binary", "binaries", "bin", "semi-continuous", "semis", "semi", "sos",
+)
+NUMBER = r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+NAME = r"[A-Za-z_][\w.\[\]]*"
+OPERATOR = r"<=|>=|=<|=>|<|>|="
+LP_TOKEN = re.compile(r"\s*(%s|[-+]|:|(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?|%s)" % (OPERATOR, NAME))
+CONSTANT = re.compile(r"^%s$" % NUMBER)
+LP_BOUND = re.compile(r"^(?:(%s)\s*(%s)\s*)?(%s)\s*(?:(%s)\s*(%s))?$" % (NUMBER, OPERATOR, NAME, OPERATOR, NUMBER))
+NORMALISED_OPERATORS = {"<": "<=", "=<": "<=", ">": ">=", "=>": ">=", "<=": "<=", ">=": ">=", "=": "="}
+FLIPPED_OPERATORS = {"<=": ">=", ">=": "<=", "=": "="}
+SENSES = {"<=": "L", ">=": "G", "=": "E"}
+OPERATORS = {"L": "<=", "G": ">=", "E": "="}
+
+
+def format_number(value):
+    text = repr(float(value))
+    return text[:-2] if text.endswith(".0") else text
+
+
+def parse_number(text, line):
+    assert CONSTANT.match(text), "expected a number instead of %s in: %s" % (text, line.strip())
+    return float(text)
+
+
+def get_pairs(fields, line, set_name=True):
+    # Name, value pairs of a COLUMNS, RHS or RANGES line. The set name of RHS and RANGES lines is optional
+    # in free format.
+    if set_name and len(fields) % 2 == 1:
+        fields = fields[1:]
+    assert fields and len(fields) % 2 == 0, "expected name and value pairs in: " + line.strip()
+    return [(fields[k], parse_number(fields[k+1], line)) for k in range(0, len(fields), 2)]
+
+
+def check_field_count(fields, count, line):
+    assert len(fields) >= count, "expected at least %d fields in: %s" % (count, line.strip())
+
+
+def get_row_index(model, name, line):
+    assert name in model.row_indices, "unknown row %s in: %s" % (name, line.strip())
+    return model.row_indices[name]
+
+
+def get_existing_col_index(model, name, line):
+    assert name in model.col_indices, "unknown column %s in: %s" % (name, line.strip())
+    return model.col_indices[name]
+
+
+def read_mps(lines):
+    # Free format MPS. The first N row is the objective, other N rows are dropped. Bounds of type UP, LO,
+    # FX and PL are supported.
+    model = SparseModel()
+    model.objective_name = None
+    section = None
+    free_rows = set()
+    for line in lines:
+        if not line.strip() or line.startswith("*"):
+            continue
+        fields = line.split()
+        if not line[0].isspace():
+            section = fields[0].upper()
+            assert section in MPS_SECTIONS, "unknown MPS section " + section
+            if section == "NAME":
+                model.name = fields[1] if len(fields) > 1 else None
+            elif section == "OBJSENSE" and len(fields) > 1:
+                model.maximise = fields[1].upper() in ("MAX", "MAXIMIZE")
+            elif section == "ENDATA":
+                break
+        elif section == "OBJSENSE":
+            model.maximise = fields[0].upper() in ("MAX", "MAXIMIZE")
+        elif section == "ROWS":
+            check_field_count(fields, 2, line)
+            sense, name = fields[0].upper(), fields[1]
+            assert sense in ("L", "G", "E", "N"), "unknown row sense %s in: %s" % (fields[0], line.strip())
+            assert name not in model.row_indices and name not in free_rows, "duplicate row %s in: %s" % (name, line.strip())
+            if sense != "N":
+                model.add_row(name, sense)
+            else:
+                if not free_rows:
+                    model.objective_name = name
+                free_rows.add(name)
+        elif section == "COLUMNS":
+            if "'MARKER'" in fields:
+                continue
+            col = model.get_col_index(fields[0])
+            for row, value in get_pairs(fields[1:], line, set_name=False):
+                if row == model.objective_name:
+                    model.c[col] += value
+                elif row not in free_rows:
+                    model.add_coefficient(get_row_index(model, row, line), col, value)
+        elif section == "RHS":
+            for row, value in get_pairs(fields, line):
+                if row == model.objective_name:
+                    model.objective_offset = -value
+                elif row not in free_rows:
+                    model.rhs[get_row_index(model, row, line)] = value
+        elif section == "RANGES":
+            for row, value in get_pairs(fields, line):
+                model.ranges[get_row_index(model, row, line)] = value
+        elif section == "BOUNDS":
+            bound_type = fields[0].upper()
+            assert bound_type in ("UP", "LO", "FX", "PL"), "unsupported bound type " + bound_type
+            if bound_type == "PL":
+                continue
+            check_field_count(fields, 3, line)
+            col = get_existing_col_index(model, fields[-2], line)
+            value = parse_number(fields[-1], line)
+            if bound_type in ("LO", "FX"):
+                model.set_lower(col, value)
+            if bound_type in ("UP", "FX"):
+                model.set_upper(col, value)
+    if model.objective_name is None:
+        model.objective_name = OBJECTIVE_NAME
+    return model
+
+
+def write_mps(model, f):
+    if model.name is not None:
+        f.write("NAME %s\n" % model.name)
+    if model.maximise:
+        f.write("OBJSENSE\n    MAX\n")
+    f.write("ROWS\n N %s\n" % model.objective_name)
+    for name, sense in zip(model.row_names, model.senses):
+        f.write(" %s %s\n" % (sense, name))
+    f.write("COLUMNS\n")
+    for j, (name, column) in enumerate(zip(model.col_names, model.columns)):
+        if model.c[j] != 0:
+            f.write("    %s %s %s\n" % (name, model.objective_name, format_number(model.c[j])))
+        for i in sorted(column):
+            f.write("    %s %s %s\n" % (name, model.row_names[i], format_number(column[i])))
+    f.write("RHS\n")
+    if model.objective_offset != 0:
+        f.write("    RHS %s %s\n" % (model.objective_name, format_number(-model.objective_offset)))
+    for name, value in zip(model.row_names, model.rhs):
+        if value != 0:
+            f.write("    RHS %s %s\n" % (name, format_number(value)))
+    if model.ranges:
+        f.write("RANGES\n")
+        for i in sorted(model.ranges):
+            f.write("    RNG %s %s\n" % (model.row_names[i], format_number(model.ranges[i])))
+    if model.lower or model.upper:
+        f.write("BOUNDS\n")
+        for j in range(model.col_count):
+            lower, upper = model.lower.get(j), model.upper.get(j)
+            if lower is not None and lower == upper:
+                f.write(" FX BND %s %s\n" % (model.col_names[j], format_number(lower)))
+                continue
+            if lower is not None:
+                f.write(" LO BND %s %s\n" % (model.col_names[j], format_number(lower)))
+            if upper is not None:
+                f.write(" UP BND %s %s\n" % (model.col_names[j], format_number(upper)))
+    f.write("ENDATA\n")
+
+
+def get_lp_section(line):
+    # (keyword, rest of the line) when the line starts with a section keyword, otherwise (None, line).
+    words = line.split()
+    for count in (2, 1):
+        keyword = " ".join(words[:count]).lower()
+        if len(words) >= count and (keyword in LP_SECTIONS or keyword in UNSUPPORTED_LP_SECTIONS):
+            assert keyword not in UNSUPPORTED_LP_SECTIONS, "unsupported LP section: " + line.strip()
+            return keyword, line.split(None, count)[count] if len(words) > count else ""
+    return None, line
+
+
+def tokenize(text):
+    tokens = []
+    position = 0
+    text = text.rstrip()
+    while position < len(text):
+        match = LP_TOKEN.match(text, position)
+        assert match is not None, "cannot parse " + text[position:]
+        tokens.append(match.group(1))
+        position = match.end()
+    return tokens
+
+
+def is_name(token):
+    return token[0].isalpha() or token[0] == "_"
+
+
+def parse_expression(tokens, allow_constant=False):
+    # [(name, coefficient)], constant of a sum of terms such as "3 x - y + 2.5 z + 4". Constant terms are
+    # only allowed in the objective.
+    text = " ".join(tokens)
+    terms = []
+    constant = 0.0
+    sign = 1.0
+    coefficient = None
+    for token in tokens + ["+"]:
+        if token in ("+", "-"):
+            if coefficient is not None:
+                assert allow_constant, "constant terms are not supported: " + text
+                constant += sign*coefficient
+                sign = 1.0
+                coefficient = None
+            sign *= -1.0 if token == "-" else 1.0
+        elif CONSTANT.match(token):
+            assert coefficient is None, "expected an operator before %s in: %s" % (token, text)
+            coefficient = float(token)
+        else:
+            assert is_name(token), "unexpected %s in: %s" % (token, text)
+            terms.append((token, sign*(1.0 if coefficient is None else coefficient)))
+            sign = 1.0
+            coefficient = None
+    return terms, constant
+
+
+def parse_constant(tokens, text):
+    # The constant side of a constraint: a number with an optional sign.
+    number = tokens[-1] if tokens else ""
+    assert CONSTANT.match(number) and (len(tokens) == 1 or len(tokens) == 2 and tokens[0] in ("+", "-")), \
+        "expected a constant on one side of: " + text
+    return float("".join(tokens))
+
+
+def split_name(tokens):
+    if len(tokens) > 1 and tokens[1] == ":":
+        return tokens[0], tokens[2:]
+    return None, tokens
+
+
+def add_lp_constraint(model, tokens):
+    name, tokens = split_name(tokens)
+    position = next(k for k, token in enumerate(tokens) if token in NORMALISED_OPERATORS)
+    left, operator, right = tokens[:position], NORMALISED_OPERATORS[tokens[position]], tokens[position+1:]
+    text = " ".join(tokens)
+    if any(is_name(token) for token in right):
+        # "2 <= x + y"
+        assert not any(is_name(token) for token in left), "variables on both sides of: " + text
+        left, operator, right = right, FLIPPED_OPERATORS[operator], left
+    row = model.add_row(name or "c%d" % (model.row_count + 1), SENSES[operator], parse_constant(right, text))
+    for variable, coefficient in parse_expression(left)[0]:
+        model.add_coefficient(row, model.get_col_index(variable), coefficient)
+
+
+def add_lp_bound(model, line):
+    match = LP_BOUND.match(line.strip())
+    assert match is not None, "unsupported bound " + line.strip()
+    left, left_operator, variable, right_operator, right = match.groups()
+    col = model.get_col_index(variable)
+    bounds = []
+    if left is not None:
+        bounds.append((FLIPPED_OPERATORS[NORMALISED_OPERATORS[left_operator]], float(left)))
+    if right is not None:
+        bounds.append((NORMALISED_OPERATORS[right_operator], float(right)))
+    for operator, value in bounds:
+        if operator in (">=", "="):
+            model.set_lower(col, value)
+        if operator in ("<=", "="):
+            model.set_upper(col, value)
+
+
+def read_lp(lines):
+    # A small part of the CPLEX LP format: an objective, constraints and bounds, one of each per line or
+    # continued over several lines, and comments starting with a backslash. Text may follow a section
+    # keyword on the same line. Integer sections are not supported.
+    model = SparseModel()
+    section = None
+    pending = []
+    for line in lines:
+        line = line.split("\\", 1)[0]
+        if not line.strip():
+            continue
+        keyword, line = get_lp_section(line)
+        if keyword is not None:
+            if section == "objective" and pending:
+                name, tokens = split_name(pending)
+                model.objective_name = name or OBJECTIVE_NAME
+                terms, model.objective_offset = parse_expression(tokens, allow_constant=True)
+                for variable, coefficient in terms:
+                    model.c[model.get_col_index(variable)] += coefficient
+            assert section != "constraints" or not pending, "unfinished constraint: " + " ".join(pending)
+            pending = []
+            section = LP_SECTIONS[keyword]
+            if section == "objective":
+                model.maximise = keyword.startswith("max")
+            elif section == "end":
+                break
+            if not line.strip():
+                continue
+        if section == "objective":
+            pending += tokenize(line)
+        elif section == "constraints":
+            pending += tokenize(line)
+            if any(token in NORMALISED_OPERATORS for token in pending) and pending[-1] not in NORMALISED_OPERATORS and pending[-1] not in ("+", "-"):
+                add_lp_constraint(model, pending)
+                pending = []
+        elif section == "bounds":
+            add_lp_bound(model, line)
+        else:
+            assert False, "text outside of a section: " + line.strip()
+    return model
+
+
+def format_expression(terms):
+    text = ""
+    for name, coefficient in terms:
+        text += (" - " if coefficient < 0 else " + ") + format_number(abs(coefficient)) + " " + name
+    return text[3:] if text.startswith(" + ") else "-" + text[3:] if text else "0"
+
+
+def write_lp(model, f):
+    # Ranged rows are written as two constraints.
+    f.write("Maximize\n" if model.maximise else "Minimize\n")
+    objective = [(name, value) for name, value in zip(model.col_names, model.c) if value != 0]
+    expression = format_expression(objective)
+    if model.objective_offset != 0:
+        expression += (" - " if model.objective_offset < 0 else " + ") + format_number(abs(model.objective_offset))
+    f.write(" %s: %s\n" % (model.objective_name, expression))
+    f.write("Subject To\n")
+    rows = [[] for _ in range(model.row_count)]
+    for j, column in enumerate(model.columns):
+        for i, value in column.items():
+            rows[i].append((model.col_names[j], value))
+    for i, terms in enumerate(rows):
+        expression = format_expression(terms)
+        if i not in model.ranges:
+            f.write(" %s: %s %s %s\n" % (model.row_names[i], expression, OPERATORS[model.senses[i]], format_number(model.rhs[i])))
+            continue
+        lower, upper = model.get_row_bounds(i)
+        f.write(" %s_lower: %s >= %s\n" % (model.row_names[i], expression, format_number(lower)))
+        f.write(" %s_upper: %s <= %s\n" % (model.row_names[i], expression, format_number(upper)))
+    if model.lower or model.upper:
+        f.write("Bounds\n")
+        for j in range(model.col_count):
+            lower, upper = model.lower.get(j), model.upper.get(j)
+            if lower is not None and lower == upper:
+                f.write(" %s = %s\n" % (model.col_names[j], format_number(lower)))
+            elif lower is not None and upper is not None:
+                f.write(" %s <= %s <= %s\n" % (format_number(lower), model.col_names[j], format_number(upper)))
+            elif lower is not None:
+                f.write(" %s >= %s\n" % (model.col_names[j], format_number(lower)))
+            elif upper is not None:
+                f.write(" %s <= %s\n" % (model.col_names[j], format_number(upper)))
+    f.write("End\n")
+
+
+def load_mps(path):
+    with open(path) as f:
+        return read_mps(f)
+
+
+def save_mps(model, path):
+    with open(path, "w") as f:
+        write_mps(model, f)
+
+
+def load_lp(path):
+    with open(path) as f:
+        return read_lp(f)
+
+
+def save_lp(model, path):
+    with open(path, "w") as f:
+        write_lp(model, f)
@@ -0,0 +1,148 @@
+import StringIO
+import lp_io
+import os
+import revised_simplex
+import shutil
+import tempfile
+import unittest
+
+
+MPS = """* The same model as LP below.
+NAME example
+OBJSENSE
+    MAX
+ROWS
+ N cost
+ L c1
+ G c2
+ E c3
+ L c4
+ N unused
+COLUMNS
+    x cost 2 c1 2
+    x c2 1
+    MARKER 'MARKER' 'INTORG'
+    x c3 -1 unused 7
+    MARKER 'MARKER' 'INTEND'
+    y cost 5 c1 -1
+    y c2 2 c3 2
+    y c4 1
+RHS
+    RHS c1 4 c2 1
+    RHS c3 1 c4 10
+RANGES
+    RNG c4 8
+BOUNDS
+ UP BND x 3
+ LO BND y 0.5
+ENDATA
+"""
+
+LP = """\\ The same model as MPS above.
+Maximize
+ cost: 2 x + 5 y
+Subject To
+ c1: 2 x - y <= 4
+ c2: x + 2 y
+     >= 1
+ c3: -x + 2y = 1
+ c4: 2 <= y
+Bounds
+ x <= 3
+ 0.5 <= y <= 1e6
+End
+"""
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def solve(self, model):
+        return revised_simplex.RevisedSimplex(*model.to_standard_form()).run()
+
+    def test_read_mps(self):
+        model = lp_io.read_mps(StringIO.StringIO(MPS))
+        self.assertEqual((model.name, model.objective_name, model.maximise), ("example", "cost", True))
+        self.assertEqual(model.row_names, ["c1", "c2", "c3", "c4"])
+        self.assertEqual(model.columns, [{0: 2, 1: 1, 2: -1}, {0: -1, 1: 2, 2: 2, 3: 1}])
+        self.assertEqual(model.get_row_bounds(3), (2, 10))
+        self.assertEqual((model.upper, model.lower), ({0: 3}, {1: 0.5}))
+        result = self.solve(model)
+        self.assertAlmostEqual(result.value, 16)
+        for element, expected in zip(result.x_values, [3, 2]):
+            self.assertAlmostEqual(element, expected)
+
+    def test_read_lp(self):
+        model = lp_io.read_lp(StringIO.StringIO(LP))
+        self.assertEqual(model.row_names, ["c1", "c2", "c3", "c4"])
+        self.assertEqual(model.senses, ["L", "G", "E", "G"])
+        self.assertEqual(model.get_row_bounds(2), (1, 1))
+        self.assertEqual(model.c, [2, 5])
+        self.assertAlmostEqual(self.solve(model).value, 16)
+        model = lp_io.read_lp(["min", " -x", "st", " x + y <= 2", "end"])
+        self.assertEqual((model.maximise, model.objective_name, model.row_names), (False, "obj", ["c1"]))
+        self.assertAlmostEqual(self.solve(model).value, 2)
+
+    def test_round_trip(self):
+        model = lp_io.read_mps(StringIO.StringIO(MPS))
+        path = os.path.join(self.directory, "model.mps")
+        lp_io.save_mps(model, path)
+        loaded = lp_io.load_mps(path)
+        self.assertEqual(loaded.columns, model.columns)
+        self.assertEqual(loaded.ranges, model.ranges)
+        self.assertEqual(loaded.to_standard_form()[2], model.to_standard_form()[2])
+        path = os.path.join(self.directory, "model.lp")
+        lp_io.save_lp(model, path)
+        loaded = lp_io.load_lp(path)
+        self.assertEqual(loaded.row_count, 5)
+        self.assertAlmostEqual(self.solve(loaded).value, 16)
+
+    def test_unsupported(self):
+        self.assertRaises(AssertionError, lp_io.read_mps, ["ROWS", " N obj", "BOUNDS", " FR BND x"])
+        self.assertRaisesRegexp(AssertionError, "unsupported LP section", lp_io.read_lp, ["max", " x", "st", " x <= 2", "General", " x", "end"])
+        self.assertRaisesRegexp(AssertionError, "unsupported LP section", lp_io.read_lp, ["max", " x", "binaries", " x", "end"])
+
+    def test_parse_errors(self):
+        def read_constraint(line):
+            return lp_io.read_lp(["max", " x", "st", line, "end"])
+        self.assertRaisesRegexp(AssertionError, "variables on both sides", read_constraint, " x + 1 <= y")
+        self.assertRaisesRegexp(AssertionError, "constant terms", read_constraint, " x + 2 <= 5")
+        self.assertRaisesRegexp(AssertionError, "expected a constant", read_constraint, " x <= 3 4")
+        self.assertRaisesRegexp(AssertionError, "constant terms", read_constraint, " x + 0 <= 5")
+        self.assertRaisesRegexp(AssertionError, "expected an operator before 3", lp_io.read_lp, ["max", " 2 3 x", "end"])
+        rows = ["ROWS", " N obj", " L c1", " L c2"]
+        self.assertRaisesRegexp(AssertionError, "name and value pairs", lp_io.read_mps, rows + ["COLUMNS", "    x c1 2 c2"])
+        self.assertRaisesRegexp(AssertionError, "instead of c2", lp_io.read_mps, rows + ["COLUMNS", "    x c1 c2 c2 3"])
+        self.assertRaisesRegexp(AssertionError, "instead of c1", lp_io.read_mps, rows + ["RHS", "    RHS c1"])
+        columns = rows + ["COLUMNS", "    x c1 1"]
+        self.assertRaisesRegexp(AssertionError, "unknown row c3 in: x c3 1", lp_io.read_mps, rows + ["COLUMNS", "    x c3 1"])
+        self.assertRaisesRegexp(AssertionError, "unknown row c3 in: RHS c3 1", lp_io.read_mps, columns + ["RHS", "    RHS c3 1"])
+        self.assertRaisesRegexp(AssertionError, "unknown row c3 in: RNG c3 1", lp_io.read_mps, columns + ["RANGES", "    RNG c3 1"])
+        self.assertRaisesRegexp(AssertionError, "at least 2 fields in: L", lp_io.read_mps, ["ROWS", " L"])
+        self.assertRaisesRegexp(AssertionError, "unknown row sense X in: X c1", lp_io.read_mps, ["ROWS", " X c1"])
+        self.assertRaisesRegexp(AssertionError, "duplicate row c1", lp_io.read_mps, rows + [" G c1"])
+        self.assertRaisesRegexp(AssertionError, "at least 3 fields in: UP x", lp_io.read_mps, columns + ["BOUNDS", " UP x"])
+        self.assertRaisesRegexp(AssertionError, "unknown column y in: UP BND y 3", lp_io.read_mps, columns + ["BOUNDS", " UP BND y 3"])
+
+    def test_lp_header_line_and_offset(self):
+        model = lp_io.read_lp(["Maximize obj: 2 x + y - 3", "Subject To c1: x + y <= 4", "End"])
+        self.assertEqual((model.maximise, model.objective_name, model.c), (True, "obj", [2, 1]))
+        self.assertEqual(model.objective_offset, -3)
+        self.assertEqual((model.row_names, model.rhs), (["c1"], [4]))
+        output = StringIO.StringIO()
+        lp_io.write_lp(model, output)
+        loaded = lp_io.read_lp(StringIO.StringIO(output.getvalue()))
+        self.assertEqual((loaded.c, loaded.objective_offset), (model.c, -3))
+        model = lp_io.read_mps(StringIO.StringIO(MPS))
+        model.objective_offset = 1.5
+        output = StringIO.StringIO()
+        lp_io.write_lp(model, output)
+        self.assertEqual(lp_io.read_lp(StringIO.StringIO(output.getvalue())).objective_offset, 1.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
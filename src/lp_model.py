@@ -0,0 +1,116 @@
+from sparse_matrix import CooBuilder
+from linear_programming import LinearProgramming
+
+
+OBJECTIVE_NAME = "obj"
+
+
+class SparseModel(object):
+    # A linear program stored by column: columns[j] maps row indices to the non-zero coefficients of
+    # variable j, so memory grows with the number of non-zeros. Rows have a sense, "L" (<=), "G" (>=) or
+    # "E" (=), a right hand side and an optional range, as in MPS. Variables are non-negative and may have
+    # lower and upper bounds.
+    def __init__(self, name=None):
+        self.name = name
+        self.objective_name = OBJECTIVE_NAME
+        self.maximise = False
+        self.objective_offset = 0.0
+        self.row_names = []
+        self.row_indices = {}
+        self.senses = []
+        self.rhs = []
+        self.ranges = {}
+        self.col_names = []
+        self.col_indices = {}
+        self.columns = []
+        self.c = []
+        self.lower = {}
+        self.upper = {}
+
+    @property
+    def row_count(self):
+        return len(self.row_names)
+
+    @property
+    def col_count(self):
+        return len(self.col_names)
+
+    def nonzero_count(self):
+        return sum(len(column) for column in self.columns)
+
+    def add_row(self, name, sense, rhs=0.0):
+        assert sense in ("L", "G", "E")
+        assert name not in self.row_indices
+        self.row_indices[name] = len(self.row_names)
+        self.row_names.append(name)
+        self.senses.append(sense)
+        self.rhs.append(rhs)
+        return self.row_indices[name]
+
+    def get_col_index(self, name):
+        # Adds the variable the first time its name is seen.
+        if name not in self.col_indices:
+            self.col_indices[name] = len(self.col_names)
+            self.col_names.append(name)
+            self.columns.append({})
+            self.c.append(0.0)
+        return self.col_indices[name]
+
+    def add_coefficient(self, row, col, value):
+        column = self.columns[col]
+        column[row] = column.get(row, 0.0) + value
+        if column[row] == 0:
+            del column[row]
+
+    def set_lower(self, col, value):
+        assert value >= 0, "only non-negative variables are supported"
+        self.lower[col] = value
+
+    def set_upper(self, col, value):
+        self.upper[col] = value
+
+    def get_row_bounds(self, i):
+        # (lower, upper) of row i, None where there is no bound.
+        sense, rhs = self.senses[i], self.rhs[i]
+        if i not in self.ranges:
+            return {"L": (None, rhs), "G": (rhs, None), "E": (rhs, rhs)}[sense]
+        r = self.ranges[i]
+        if sense == "L":
+            return rhs - abs(r), rhs
+        elif sense == "G":
+            return rhs, rhs + abs(r)
+        return (rhs, rhs + r) if r > 0 else (rhs + r, rhs)
+
+    def to_standard_form(self):
+        # (c, A, b) for max c^T x, A x <= b, x >= 0 with a sparse A. Rows with a lower bound are negated,
+        # equalities and ranges become two rows and variable bounds become rows after the constraints.
+        # A minimised objective is negated and its offset is left out.
+        rows = []
+        b = []
+        for i in range(self.row_count):
+            lower, upper = self.get_row_bounds(i)
+            if upper is not None:
+                rows.append((i, 1.0))
+                b.append(upper)
+            if lower is not None:
+                rows.append((i, -1.0))
+                b.append(-lower)
+        bound_rows = [(j, -1.0, -value) for j, value in sorted(self.lower.items()) if value != 0]
+        bound_rows += [(j, 1.0, value) for j, value in sorted(self.upper.items())]
+        builder = CooBuilder(len(rows) + len(bound_rows), self.col_count)
+        signs_by_row = {}
+        for k, (i, sign) in enumerate(rows):
+            signs_by_row.setdefault(i, []).append((k, sign))
+        for j, column in enumerate(self.columns):
+            for i, value in column.items():
+                for k, sign in signs_by_row.get(i, []):
+                    builder.add(k, j, sign*value)
+        for k, (j, sign, value) in enumerate(bound_rows):
+            builder.add(len(rows) + k, j, sign)
+            b.append(value)
+        c = self.c if self.maximise else [-element for element in self.c]
+        return c, builder.to_csr(), b
+
+    def to_linear_programming(self, pivot_selector=None):
+        c, A, b = self.to_standard_form()
+        return LinearProgramming(c, A, b, pivot_selector)
@@ -0,0 +1,45 @@
+import lp_model
+import unittest
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.model = lp_model.SparseModel()
+        x = self.model.get_col_index("x")
+        y = self.model.get_col_index("y")
+        self.model.c[x] = 2
+        self.model.c[y] = 5
+        self.model.add_coefficient(self.model.add_row("c1", "L", 4), x, 2)
+        self.model.add_coefficient(0, y, -1)
+        self.model.add_coefficient(self.model.add_row("c2", "E", 1), x, -1)
+        self.model.add_coefficient(1, y, 2)
+        self.model.set_upper(x, 3)
+
+    def test_to_standard_form(self):
+        self.model.maximise = True
+        c, A, b = self.model.to_standard_form()
+        self.assertEqual(c, [2, 5])
+        self.assertEqual(A.elements, [[2, -1], [-1, 2], [1, -2], [1, 0]])
+        self.assertEqual(b, [4, 1, -1, 3])
+        self.assertEqual(A.nonzero_count(), self.model.nonzero_count()*2 - 1)
+        result = self.model.to_linear_programming().run()
+        self.assertAlmostEqual(result.value, 16)
+
+    def test_minimise(self):
+        c, A, b = self.model.to_standard_form()
+        self.assertEqual(c, [-2, -5])
+        result = self.model.to_linear_programming().run_revised()
+        self.assertAlmostEqual(result.value, -2.5)
+
+    def test_row_bounds(self):
+        self.assertEqual(self.model.get_row_bounds(0), (None, 4))
+        self.model.ranges[0] = -3
+        self.assertEqual(self.model.get_row_bounds(0), (1, 4))
+        self.model.ranges[1] = -2
+        self.assertEqual(self.model.get_row_bounds(1), (-1, 1))
+        self.model.add_coefficient(0, 0, -2)
+        self.assertEqual(self.model.columns[0], {1: -1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,14 @@
+import numbers
 import operator
 
+import eigen
+import matrix_io
+import multiplication
+from vector_view import VectorView, IndexedView
+
+
+SINGULARITY_TOLERANCE = 1e-12
+
 
 def get_unit_matrix(n):
     elements = []
@@ -16,6 +25,17 @@ def get_col_matrix(element, n):
     return get_row_matrix(element, n).transposed()
 
 
+def wrap_elements(elements):
+    # Builds a Matrix around already validated rows without copying them.
+    matrix = Matrix.__new__(Matrix)
+    matrix.row_count = len(elements)
+    matrix.col_count = len(elements[0])
+    matrix.elements = elements
+    matrix.lu_decomposition = None
+    matrix.eigen_decomposition = None
+    return matrix
+
+
 class IndexElementPair(object):
     def __init__(self, index, element):
         self.index = index
@@ -28,6 +48,271 @@ class IndexElementPair(object):
         return str(self.element) + " index: " + str(self.index)
 
 
+class IdentityBlock(object):
+    # Symbolic scaled identity for Matrix.block; its size is taken from the block row and column.
+    def __init__(self, value=1):
+        self.value = value
+
+    def get_row(self, i, width):
+        row = [0]*width
+        row[i] = self.value
+        return row
+
+
+class DiagonalBlock(object):
+    def __init__(self, values):
+        self.values = list(values)
+        self.row_count = self.col_count = len(self.values)
+
+    def get_row(self, i, width):
+        row = [0]*width
+        row[i] = self.values[i]
+        return row
+
+
+class ConstantBlock(object):
+    # Block filled with one value; plain numbers in Matrix.block are treated as constant blocks.
+    def __init__(self, value):
+        self.value = value
+
+    def get_row(self, i, width):
+        return [self.value]*width
+
+
+class ColumnBlock(object):
+    def __init__(self, values):
+        self.values = values
+        self.row_count = len(values)
+        self.col_count = 1
+
+    def get_row(self, i, width):
+        return [self.values[i]]
+
+
+class DenseBlock(object):
+    # Matrix, nested lists or a flat list (a single row); rows are read, never copied as a whole.
+    def __init__(self, block):
+        if isinstance(block, Matrix):
+            self.rows = block.elements
+        elif len(block) > 0 and isinstance(block[0], (list, tuple)):
+            self.rows = block
+        else:
+            self.rows = [block]
+        self.row_count = len(self.rows)
+        self.col_count = len(self.rows[0])
+
+    def get_row(self, i, width):
+        return self.rows[i]
+
+
+def as_block(block):
+    if isinstance(block, (IdentityBlock, DiagonalBlock, ConstantBlock, ColumnBlock)):
+        return block
+    if isinstance(block, numbers.Number):
+        return ConstantBlock(block)
+    return DenseBlock(block)
+
+
+def get_block_sizes(blocks):
+    # Identity blocks are square, so they link the height of their block row to the width of their block column.
+    # A block row or column made only of scalars and constants has size 1.
+    heights = [None]*len(blocks)
+    widths = [None]*len(blocks[0])
+
+    def set_size(sizes, index, size):
+        assert sizes[index] in (None, size)
+        sizes[index] = size
+
+    for i, block_row in enumerate(blocks):
+        for j, block in enumerate(block_row):
+            if hasattr(block, "row_count"):
+                set_size(heights, i, block.row_count)
+                set_size(widths, j, block.col_count)
+    for i, block_row in enumerate(blocks):
+        for j, block in enumerate(block_row):
+            if isinstance(block, IdentityBlock):
+                size = heights[i] if heights[i] is not None else widths[j]
+                assert size is not None
+                set_size(heights, i, size)
+                set_size(widths, j, size)
+    return [1 if size is None else size for size in heights], [1 if size is None else size for size in widths]
+
+
+class EliminationResult(object):
+    def __init__(self, matrix, rank, pivot_cols, nullspace):
+        self.matrix = matrix
+        self.rank = rank
+        self.pivot_cols = pivot_cols
+        self.nullspace = nullspace
+
+    def __repr__(self):
+        return str(self.matrix) + "\nrank: " + str(self.rank) + " pivot columns: " + str(self.pivot_cols)
+
+
+def get_nullspace(rows, pivot_cols, col_count):
+    # Back substitution through echelon rows with unit pivots, once per free column.
+    nullspace = []
+    pivot_col_set = set(pivot_cols)
+    for free_col in (j for j in range(col_count) if j not in pivot_col_set):
+        vector = [0]*col_count
+        vector[free_col] = 1
+        for row_index in range(len(pivot_cols)-1, -1, -1):
+            row = rows[row_index]
+            col = pivot_cols[row_index]
+            vector[col] = -sum(row[j]*vector[j] for j in range(col+1, col_count) if vector[j] != 0)
+        nullspace.append(vector)
+    return nullspace
+
+
+def bareiss_eliminate(rows):
+    # Fraction-free Gaussian elimination on integer rows, in place. Every entry stays a minor of the
+    # original matrix, so the divisions are exact and intermediate integers stay polynomially bounded.
+    row_count = len(rows)
+    col_count = len(rows[0])
+    previous_pivot = 1
+    sign = 1
+    pivot_cols = []
+    rank = 0
+    for col in range(col_count):
+        if rank == row_count:
+            break
+        pivot_index = next((i for i in range(rank, row_count) if rows[i][col] != 0), None)
+        if pivot_index is None:
+            continue
+        if pivot_index != rank:
+            rows[rank], rows[pivot_index] = rows[pivot_index], rows[rank]
+            sign = -sign
+        pivot_row = rows[rank]
+        pivot = pivot_row[col]
+        for i in range(rank+1, row_count):
+            row = rows[i]
+            multiplier = row[col]
+            for j in range(col+1, col_count):
+                row[j] = (pivot*row[j] - multiplier*pivot_row[j]) // previous_pivot
+            row[col] = 0
+        previous_pivot = pivot
+        pivot_cols.append(col)
+        rank += 1
+    return rank, pivot_cols, sign
+
+
+def is_integral(elements):
+    return all(isinstance(element, numbers.Integral) for row in elements for element in row)
+
+
+class LUDecomposition(object):
+    # A pivot within tolerance of the largest element of its original row marks the matrix singular, so
+    # scaling a row does not change the answer. That only decides is_singular: the determinant is the
+    # product of the pivots, and exact (by Bareiss elimination) for integer matrices.
+    def __init__(self, elements, tolerance=SINGULARITY_TOLERANCE):
+        self.size = len(elements)
+        self.lu = [list(row) for row in elements]
+        self.integer_rows = [list(row) for row in elements] if is_integral(elements) else None
+        self.exact_determinant = None
+        self.permutation = list(range(self.size))
+        self.row_scales = [tolerance*max(abs(element) for element in row) for row in self.lu]
+        self.sign = 1
+        self.singular = False
+        self.zero_pivot = False
+        for k in range(self.size):
+            self.eliminate_col(k)
+
+    def get_pivot_index(self, k):
+        return max(range(k, self.size), key=lambda i: abs(self.lu[i][k]))
+
+    def swap_rows(self, i, j):
+        self.lu[i], self.lu[j] = self.lu[j], self.lu[i]
+        self.permutation[i], self.permutation[j] = self.permutation[j], self.permutation[i]
+        self.sign = -self.sign
+
+    def eliminate_col(self, k):
+        pivot_index = self.get_pivot_index(k)
+        if self.lu[pivot_index][k] == 0:
+            self.singular = self.zero_pivot = True
+            return
+        if pivot_index != k:
+            self.swap_rows(pivot_index, k)
+        pivot_row = self.lu[k]
+        pivot = pivot_row[k]
+        if abs(pivot) <= self.row_scales[self.permutation[k]]:
+            self.singular = True
+        if isinstance(pivot, numbers.Integral):
+            pivot = float(pivot)
+        for i in range(k+1, self.size):
+            row = self.lu[i]
+            multiplier = row[k]/pivot
+            row[k] = multiplier
+            if multiplier != 0:
+                for j in range(k+1, self.size):
+                    row[j] -= multiplier*pivot_row[j]
+
+    def get_exact_determinant(self):
+        if self.exact_determinant is None:
+            rank, pivot_cols, sign = bareiss_eliminate(self.integer_rows)
+            self.exact_determinant = sign*self.integer_rows[-1][-1] if rank == self.size else 0
+            self.integer_rows = None
+        return self.exact_determinant
+
+    def is_singular(self):
+        if self.integer_rows is not None or self.exact_determinant is not None:
+            return self.get_exact_determinant() == 0
+        return self.singular
+
+    def determinant(self):
+        if self.integer_rows is not None or self.exact_determinant is not None:
+            return self.get_exact_determinant()
+        if self.zero_pivot:
+            return 0
+        result = self.sign
+        for i in range(self.size):
+            result *= self.lu[i][i]
+        return result
+
+    def solve_vector(self, b):
+        assert not self.zero_pivot
+        assert len(b) == self.size
+        y = [b[i] for i in self.permutation]
+        for i in range(self.size):
+            row = self.lu[i]
+            for j in range(i):
+                y[i] -= row[j]*y[j]
+        for i in range(self.size-1, -1, -1):
+            row = self.lu[i]
+            for j in range(i+1, self.size):
+                y[i] -= row[j]*y[j]
+            pivot = row[i]
+            if isinstance(pivot, numbers.Integral):
+                pivot = float(pivot)
+            y[i] = y[i]/pivot
+        return y
+
+    def solve_transposed_vector(self, b):
+        # Solves A^T x = b with the same factors: U^T w = b, L^T v = w and x = P^T v.
+        assert not self.zero_pivot
+        assert len(b) == self.size
+        y = list(b)
+        for i in range(self.size):
+            for j in range(i):
+                y[i] -= self.lu[j][i]*y[j]
+            pivot = self.lu[i][i]
+            if isinstance(pivot, numbers.Integral):
+                pivot = float(pivot)
+            y[i] = y[i]/pivot
+        for i in range(self.size-1, -1, -1):
+            for j in range(i+1, self.size):
+                y[i] -= self.lu[j][i]*y[j]
+        x = [None]*self.size
+        for i, index in enumerate(self.permutation):
+            x[index] = y[i]
+        return x
+
+    def solve_cols(self, cols):
+        return [list(row) for row in zip(*[self.solve_vector(col) for col in cols])]
+
+    def inverse_elements(self):
+        return self.solve_cols([int(i == j) for i in range(self.size)] for j in range(self.size))
+
+
 class Matrix(object):
     def __init__(self, elements):
         self.row_count = self.check_positive_length(elements)
@@ -35,6 +320,8 @@ class Matrix(object):
         self.elements = []
         for row in elements:
             self.elements.append(self.check_equal_length(row[:], self.col_count))
+        self.lu_decomposition = None
+        self.eigen_decomposition = None
 
     def check_positive_length(self, elements):
         assert len(elements) > 0
@@ -48,22 +335,51 @@ class Matrix(object):
         assert self.row_count == other.row_count
         assert self.col_count == other.col_count
 
-    def elementwise_binary_operator(self, op, this, other):
-        return Matrix([[op(a, b) for a, b in zip(row, other_row)] for row, other_row in zip(this, other)])
+    def write_rows(self, rows, out=None):
+        # rows are new lists built by the caller, so out keeps its own row lists and only their elements
+        # are overwritten.
+        if out is None:
+            return wrap_elements(list(rows))
+        for i, row in enumerate(rows):
+            out.write_row(i, row)
+        out.invalidate_decomposition()
+        return out
+
+    def write_row(self, i, row):
+        self.elements[i][:] = row
+
+    def elementwise_binary_operator(self, op, this, other, out=None):
+        if out is not None:
+            self.check_matrix_size(out)
+        return self.write_rows((list(map(op, row, other_row)) for row, other_row in zip(this, other)), out)
+
+    def elementwise_unary_operator(self, op, elements, out=None):
+        if out is not None:
+            self.check_matrix_size(out)
+        return self.write_rows((list(map(op, row)) for row in elements), out)
+
+    def add(self, other, out=None):
+        self.check_matrix_size(other)
+        return self.elementwise_binary_operator(operator.add, self.elements, other.elements, out)
 
-    def elementwise_unary_operator(self, op, elements):
-        return Matrix([[op(a) for a in row] for row in elements])
+    def subtract(self, other, out=None):
+        self.check_matrix_size(other)
+        return self.elementwise_binary_operator(operator.sub, self.elements, other.elements, out)
 
     def __add__(self, other):
-        self.check_matrix_size(other)
-        return self.elementwise_binary_operator(operator.add, self.elements, other.elements)
+        return self.add(other)
 
     def __radd__(self, other):
         return self.__add__(other)
 
+    def __iadd__(self, other):
+        return self.add(other, out=self)
+
     def __sub__(self, other):
-        self.check_matrix_size(other)
-        return self.elementwise_binary_operator(operator.sub, self.elements, other.elements)
+        return self.subtract(other)
+
+    def __isub__(self, other):
+        return self.subtract(other, out=self)
 
     def __rsub__(self, other):
         self.check_matrix_size(other)
@@ -77,7 +393,14 @@ class Matrix(object):
         for i in range(self.row_count):
             for j in range(self.col_count):
                 new_elements[j][i] = self.elements[i][j]
-        return Matrix(new_elements)
+        return wrap_elements(new_elements)
+
+    def __getitem__(self, key):
+        # matrix[i, j] is an element; any slice or index list gives a MatrixView sharing the elements.
+        rows, cols = key if isinstance(key, tuple) else (key, slice(None))
+        if isinstance(rows, numbers.Integral) and isinstance(cols, numbers.Integral):
+            return self.elements[rows][cols]
+        return MatrixView(self, get_indices(rows, self.row_count), get_indices(cols, self.col_count))
 
     def get_row(self, i):
         return self.elements[i][:]
@@ -88,42 +411,58 @@ class Matrix(object):
     def set_row(self, i, elements):
         assert len(elements) == self.col_count
         self.elements[i] = list(elements)
+        self.invalidate_decomposition()
 
     def set_col(self, i, elements):
         assert len(elements) == self.row_count
         for j in range(self.row_count):
             self.elements[j][i] = elements[j]
+        self.invalidate_decomposition()
 
     def delete_row(self, i):
         del self.elements[i]
         self.row_count -= 1
+        self.invalidate_decomposition()
 
     def delete_col(self, i):
         for j in range(self.row_count):
             del self.elements[j][i]
         self.col_count -= 1
+        self.invalidate_decomposition()
+
+    def invalidate_decomposition(self):
+        self.lu_decomposition = None
+        self.eigen_decomposition = None
+
+    def get_lu_decomposition(self):
+        assert self.row_count == self.col_count
+        if self.lu_decomposition is None:
+            self.lu_decomposition = LUDecomposition(self.elements)
+        return self.lu_decomposition
 
     def __mul__(self, other):
         assert self.col_count == other.row_count
-        result = []
-        for i in range(self.row_count):
-            result.append([])
-            for j in range(other.col_count):
-                result[i].append(sum(map(lambda x: x[0]*x[1], zip(self.get_row(i), other.get_col(j)))))
-        return Matrix(result)
+        return wrap_elements(multiplication.multiply(self.elements, other.elements))
 
     def __rmul__(self, other):
         return other.__mul__(self)
 
-    def scalar_muliplication(self, scalar):
-        return self.elementwise_unary_operator(lambda x: x*scalar, self.elements)
+    def __imul__(self, other):
+        if isinstance(other, Matrix):
+            assert other.row_count == other.col_count
+            assert self.col_count == other.row_count
+            return self.write_rows(multiplication.multiply(self.elements, other.elements), self)
+        else:
+            return self.scale(other)
+
+    def scalar_muliplication(self, scalar, out=None):
+        return self.elementwise_unary_operator(lambda x: x*scalar, self.elements, out)
+
+    def scale(self, scalar):
+        return self.scalar_muliplication(scalar, out=self)
 
     def determinant(self):
-        assert self.row_count == self.col_count
-        if self.row_count == 1:
-            return self.elements[0][0]
-        else:
-            return sum(self.elements[0][i]*self.cofactor(0, i) for i in range(self.col_count))
+        return self.get_lu_decomposition().determinant()
 
     def cofactor(self, row, col):
         return (-1)**(row+col)*self.minor(row, col)
@@ -132,25 +471,63 @@ class Matrix(object):
         return Matrix([[self.cofactor(i, j) for j in range(self.col_count)] for i in range(self.row_count)])
 
     def minor(self, row, col):
-        new_matrix = Matrix([r[:col]+r[col+1:] for r in self.elements[:row]+self.elements[row+1:]])
-        return new_matrix.determinant()
+        rows = [i for i in range(self.row_count) if i != row % self.row_count]
+        cols = [j for j in range(self.col_count) if j != col % self.col_count]
+        return self[rows, cols].determinant()
 
     def is_singular(self):
-        return self.determinant() == 0
+        return self.get_lu_decomposition().is_singular()
+
+    def rank(self):
+        return self.eliminate().rank
 
     def adjugate(self):
         return self.cofactor_matrix().transposed()
 
     def inverse(self):
         assert not self.is_singular()
-        return self.adjugate().scalar_muliplication(1.0/self.determinant())
+        return Matrix(self.get_lu_decomposition().inverse_elements())
+
+    def solve(self, b):
+        assert not self.is_singular()
+        if isinstance(b, Matrix):
+            assert b.row_count == self.row_count
+            return Matrix(self.get_lu_decomposition().solve_cols(b.get_col(j) for j in range(b.col_count)))
+        else:
+            return self.get_lu_decomposition().solve_vector(b)
 
-    def merge_horisontal(self, other):
+    def merge_horisontal(self, other, out=None):
         assert self.row_count == other.row_count
-        new_elements = []
-        for i in range(self.row_count):
-            new_elements.append(self.get_row(i) + other.get_row(i))
-        return Matrix(new_elements)
+        if out is not None:
+            assert out.row_count == self.row_count
+            assert out.col_count == self.col_count + other.col_count
+        return self.write_rows((self.get_row(i) + other.get_row(i) for i in range(self.row_count)), out)
+
+    @staticmethod
+    def block(blocks):
+        # Assembles a block matrix in one pass: Matrix.block([[A, IdentityBlock(), ColumnBlock(b)], [c, 0, 0]]).
+        # Identity and constant blocks take their size from the other blocks in their block row and column.
+        blocks = [[as_block(block) for block in block_row] for block_row in blocks]
+        assert len(set(map(len, blocks))) == 1
+        heights, widths = get_block_sizes(blocks)
+        rows = []
+        for block_row, height in zip(blocks, heights):
+            for i in range(height):
+                row = []
+                for block, width in zip(block_row, widths):
+                    row.extend(block.get_row(i, width))
+                rows.append(row)
+        return wrap_elements(rows)
+
+    def save(self, path):
+        matrix_io.save(self, path)
+
+    @staticmethod
+    def load(path, mmap=True):
+        # An ArrayMatrix over the saved elements, memory-mapped unless mmap is False. array_matrix imports
+        # this module, so it is only imported here.
+        import array_matrix
+        return array_matrix.ArrayMatrix.load(path, mmap)
 
     def merge_vertical(self, other):
         assert self.col_count == other.col_count
@@ -165,6 +542,18 @@ class Matrix(object):
     def is_symmetric(self):
         return self == self.transposed()
 
+    def get_eigen_decomposition(self):
+        # Values and vectors come from one pass and are kept until the matrix changes, like the LU.
+        if self.eigen_decomposition is None:
+            self.eigen_decomposition = eigen.eigen(self)
+        return self.eigen_decomposition
+
+    def eigenvalues(self):
+        return list(self.get_eigen_decomposition()[0])
+
+    def eigenvectors(self):
+        return [list(vector) for vector in self.get_eigen_decomposition()[1]]
+
     def get_row_with_non_zero_element_row_op(self, start_row, col):
         non_zero_element = self.get_first_non_zero_element_in_col(col, start_row)
         if non_zero_element.index == start_row:
@@ -221,24 +610,163 @@ class Matrix(object):
         self.set_row(row_index, self.get_scaled_row(factor, row_index))
 
     def col_to_row_echelon_form(self, col_index, row_index=0):
-        self.make_element_non_zero_using_row(row_index, col_index)
-        non_zero_element = self.get_first_non_zero_element_in_col(col_index, row_index)
-        self.scale_row(non_zero_element.element, row_index)
-        self.make_elements_zero_using_row(row_index, col_index, range(row_index+1, self.row_count))
+        self.eliminate(partial_pivoting=False, in_place=True, start_row=row_index, cols=[col_index])
         return self
 
     def row_echelon_form_step(self, matrix, col_index, start_row):
-        if not matrix.all_elements_zero_in_col(col_index, start_row):
-            return matrix.col_to_row_echelon_form(col_index, start_row), start_row+1
-        else:
-            return matrix, start_row
+        return matrix, matrix.eliminate(partial_pivoting=False, in_place=True, start_row=start_row, cols=[col_index]).rank
 
     def row_echelon_form(self):
-        rank = 0
-        matrix = Matrix(self.elements)
-        for col_index in range(matrix.col_count):
-            matrix, rank = self.row_echelon_form_step(matrix, col_index, rank)
-        return matrix
+        result = self.eliminate(partial_pivoting=False)
+        if result.rank == 0:
+            return result.matrix
+        # Elimination used to rewrite whole rows, so once there is a pivot every element is a float.
+        return wrap_elements([[float(element) if isinstance(element, numbers.Integral) else element for element in row]
+                              for row in result.matrix.elements])
+
+    def eliminate(self, reduced=False, partial_pivoting=True, in_place=False, tolerance=SINGULARITY_TOLERANCE, start_row=0, cols=None):
+        # Gaussian elimination that updates the row lists in place and only touches the columns right of
+        # the pivot in rows that are non-zero in the pivot column. With partial_pivoting the largest
+        # element is swapped up and elements within tolerance of zero are treated as zero; without it the
+        # first non-zero row is added to the pivot row, as row_echelon_form always did.
+        # With cols, only those columns are pivoted on, starting at start_row. The columns left of them
+        # need not be zero, so every row below the pivot is updated over its whole length, as the row
+        # operations of col_to_row_echelon_form always did, and no nullspace is computed.
+        rows = self.elements
+        shares_rows = in_place and rows is self.elements
+        if not shares_rows:
+            rows = [list(row) for row in rows]
+        row_count, col_count = len(rows), len(rows[0])
+        threshold = 0
+        if partial_pivoting:
+            threshold = tolerance*max(abs(element) for row in rows for element in row)
+        rank = start_row
+        pivot_cols = []
+        for col in (range(col_count) if cols is None else cols):
+            if rank == row_count:
+                break
+            first = col if cols is None else 0
+            if partial_pivoting:
+                pivot_index = max(range(rank, row_count), key=lambda i: abs(rows[i][col]))
+                if abs(rows[pivot_index][col]) <= threshold:
+                    continue
+                rows[rank], rows[pivot_index] = rows[pivot_index], rows[rank]
+            else:
+                pivot_index = next((i for i in range(rank, row_count) if rows[i][col] != 0), None)
+                if pivot_index is None:
+                    continue
+                if pivot_index != rank:
+                    rows[rank][first:] = map(operator.add, rows[rank][first:], rows[pivot_index][first:])
+            pivot_row = rows[rank]
+            pivot = pivot_row[col]
+            if isinstance(pivot, numbers.Integral):
+                pivot = float(pivot)
+            for j in range(first, col_count):
+                pivot_row[j] = pivot_row[j]/pivot
+            update_cols = list(range(first, col)) + list(range(col+1, col_count))
+            for i in range(0 if reduced else rank+1, row_count):
+                row = rows[i]
+                multiplier = row[col]
+                if i != rank and (multiplier != 0 or cols is not None):
+                    for j in update_cols:
+                        row[j] -= multiplier*pivot_row[j]
+                    row[col] = 0*pivot_row[col]
+            pivot_cols.append(col)
+            rank += 1
+        if in_place:
+            if not shares_rows:
+                for i, row in enumerate(rows):
+                    self.set_row(i, row)
+            self.invalidate_decomposition()
+        matrix = self if in_place else wrap_elements(rows)
+        nullspace = get_nullspace(rows, pivot_cols, col_count) if cols is None and start_row == 0 else None
+        return EliminationResult(matrix, rank, pivot_cols, nullspace)
+
+def get_indices(key, count):
+    if isinstance(key, slice):
+        return list(range(*key.indices(count)))
+    if isinstance(key, numbers.Integral):
+        key = [key]
+    indices = []
+    for i in key:
+        if not -count <= i < count:
+            raise IndexError("matrix index out of range")
+        indices.append(i % count)
+    return indices
+
+
+class MatrixView(Matrix):
+    # Submatrix of a parent matrix addressed through row and column index maps. Reads and writes go to the
+    # parent's rows and invalidate its decomposition; deleting rows or columns only edits the index maps.
+    # The parent has to store its rows: matrices whose elements property builds new lists (sparse, numpy)
+    # cannot be viewed, as writes would be lost.
+    def __init__(self, parent, row_indices, col_indices):
+        if isinstance(parent, MatrixView):
+            row_indices = [parent.row_indices[i] for i in row_indices]
+            col_indices = [parent.col_indices[j] for j in col_indices]
+            parent = parent.parent
+        rows = parent.elements
+        assert rows is parent.elements or all(isinstance(row, VectorView) for row in rows), "parent rows are copies"
+        self.parent = parent
+        self.parent_rows = rows
+        self.row_indices = list(row_indices)
+        self.col_indices = list(col_indices)
+        self.lu_decomposition = None
+        self.eigen_decomposition = None
+
+    @property
+    def row_count(self):
+        return len(self.row_indices)
+
+    @property
+    def col_count(self):
+        return len(self.col_indices)
+
+    @property
+    def elements(self):
+        return [IndexedView(self.parent_rows[i], self.col_indices, self.parent) for i in self.row_indices]
+
+    def get_row(self, i):
+        row = self.parent_rows[self.row_indices[i]]
+        return [row[j] for j in self.col_indices]
+
+    def get_col(self, j):
+        col = self.col_indices[j]
+        return [self.parent_rows[i][col] for i in self.row_indices]
+
+    def set_row(self, i, elements):
+        assert len(elements) == self.col_count
+        row = self.parent_rows[self.row_indices[i]]
+        for j, element in zip(self.col_indices, list(elements)):
+            row[j] = element
+        self.parent.invalidate_decomposition()
+
+    def set_col(self, j, elements):
+        assert len(elements) == self.row_count
+        col = self.col_indices[j]
+        for i, element in zip(self.row_indices, list(elements)):
+            self.parent_rows[i][col] = element
+        self.parent.invalidate_decomposition()
+
+    def delete_row(self, i):
+        del self.row_indices[i]
+
+    def delete_col(self, i):
+        del self.col_indices[i]
+
+    def get_lu_decomposition(self):
+        # The parent can change underneath a view, so the decomposition is not cached.
+        assert self.row_count == self.col_count
+        return LUDecomposition(self.elements)
+
+    def write_row(self, i, row):
+        self.set_row(i, row)
+
+    def get_eigen_decomposition(self):
+        return eigen.eigen(self)
+
+    def copy(self):
+        return wrap_elements([self.get_row(i) for i in range(self.row_count)])
 
 
 if __name__ == '__main__':
@@ -0,0 +1,187 @@
+from array import array
+
+from matrix import Matrix, LUDecomposition, SINGULARITY_TOLERANCE, wrap_elements
+
+
+def to_batch(matrices):
+    matrices = [matrix.elements if isinstance(matrix, Matrix) else matrix for matrix in matrices]
+    assert len(matrices) > 0
+    row_count, col_count = len(matrices[0]), len(matrices[0][0])
+    data = array("d")
+    for elements in matrices:
+        assert len(elements) == row_count
+        for row in elements:
+            assert len(row) == col_count
+            data.extend(row)
+    return MatrixBatch(len(matrices), row_count, col_count, data)
+
+
+def determinant_2(a, b, c, d):
+    return a*d - b*c
+
+
+def determinant_3(a, b, c, d, e, f, g, h, i):
+    return a*(e*i - f*h) - b*(d*i - f*g) + c*(d*h - e*g)
+
+
+def is_singular(elements, n, tolerance=SINGULARITY_TOLERANCE):
+    # The row-scaled pivot test of LUDecomposition on one n x n slice, so the closed-form kernels
+    # reject the same matrices as the LU path used for larger batches.
+    rows = [list(elements[i*n:(i+1)*n]) for i in range(n)]
+    scales = [tolerance*max(abs(element) for element in row) for row in rows]
+    for k in range(n):
+        pivot_index = max(range(k, n), key=lambda i: abs(rows[i][k]))
+        rows[k], rows[pivot_index] = rows[pivot_index], rows[k]
+        scales[k], scales[pivot_index] = scales[pivot_index], scales[k]
+        pivot_row = rows[k]
+        pivot = pivot_row[k]
+        if pivot == 0 or abs(pivot) <= scales[k]:
+            return True
+        for row in rows[k+1:]:
+            multiplier = row[k]/pivot
+            for j in range(k+1, n):
+                row[j] -= multiplier*pivot_row[j]
+    return False
+
+
+def inverse_2(a, b, c, d):
+    assert not is_singular([a, b, c, d], 2)
+    determinant = determinant_2(a, b, c, d)
+    factor = 1.0/determinant
+    return [d*factor, -b*factor, -c*factor, a*factor]
+
+
+def inverse_3(a, b, c, d, e, f, g, h, i):
+    cofactor_a, cofactor_b, cofactor_c = e*i - f*h, f*g - d*i, d*h - e*g
+    assert not is_singular([a, b, c, d, e, f, g, h, i], 3)
+    determinant = a*cofactor_a + b*cofactor_b + c*cofactor_c
+    factor = 1.0/determinant
+    return [cofactor_a*factor, (c*h - b*i)*factor, (b*f - c*e)*factor,
+            cofactor_b*factor, (a*i - c*g)*factor, (c*d - a*f)*factor,
+            cofactor_c*factor, (b*g - a*h)*factor, (a*e - b*d)*factor]
+
+
+class MatrixBatch(object):
+    # count matrices of the same shape stored back to back, row-major, in one array('d').
+    # Operations run one loop over the batch with closed-form kernels for 2x2 and 3x3 matrices,
+    # so no Matrix objects are created per element of the batch.
+    def __init__(self, count, row_count, col_count, data):
+        assert count > 0 and row_count > 0 and col_count > 0
+        assert len(data) == count*row_count*col_count
+        self.count = count
+        self.row_count = row_count
+        self.col_count = col_count
+        self.size = row_count*col_count
+        self.data = data
+
+    def __len__(self):
+        return self.count
+
+    def get_elements(self, k):
+        offset = k*self.size
+        return [list(self.data[offset+i*self.col_count:offset+(i+1)*self.col_count]) for i in range(self.row_count)]
+
+    def __getitem__(self, k):
+        if k < 0:
+            k += self.count
+        if not 0 <= k < self.count:
+            raise IndexError("batch index out of range")
+        return wrap_elements(self.get_elements(k))
+
+    def __iter__(self):
+        for k in range(self.count):
+            yield self[k]
+
+    def __eq__(self, other):
+        if not isinstance(other, MatrixBatch):
+            return False
+        return (self.count, self.row_count, self.col_count) == (other.count, other.row_count, other.col_count) and self.data == other.data
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "\n\n".join(map(repr, self))
+
+    def get_slices(self):
+        data, size = self.data, self.size
+        return (data[offset:offset+size] for offset in range(0, self.count*size, size))
+
+    def map_slices(self, function, row_count, col_count):
+        data = array("d")
+        for elements in self.get_slices():
+            data.extend(function(elements))
+        return MatrixBatch(self.count, row_count, col_count, data)
+
+    def determinant(self):
+        assert self.row_count == self.col_count
+        if self.row_count == 1:
+            return list(self.data)
+        if self.row_count == 2:
+            return [determinant_2(*elements) for elements in self.get_slices()]
+        if self.row_count == 3:
+            return [determinant_3(*elements) for elements in self.get_slices()]
+        return [LUDecomposition(self.get_elements(k)).determinant() for k in range(self.count)]
+
+    def inverse(self):
+        assert self.row_count == self.col_count
+        n = self.row_count
+        if n == 2:
+            return self.map_slices(lambda elements: inverse_2(*elements), n, n)
+        if n == 3:
+            return self.map_slices(lambda elements: inverse_3(*elements), n, n)
+        data = array("d")
+        for k in range(self.count):
+            decomposition = LUDecomposition(self.get_elements(k))
+            assert not decomposition.is_singular()
+            for row in decomposition.inverse_elements():
+                data.extend(row)
+        return MatrixBatch(self.count, n, n, data)
+
+    def transposed(self):
+        r, c = self.row_count, self.col_count
+        permutation = [i*c + j for j in range(c) for i in range(r)]
+        return self.map_slices(lambda elements: [elements[index] for index in permutation], c, r)
+
+    def __mul__(self, other):
+        # other is a MatrixBatch of the same length or a single Matrix applied to every element.
+        assert self.col_count == other.row_count
+        r, n, p = self.row_count, self.col_count, other.col_count
+        rows = [range(i*n, (i+1)*n) for i in range(r)]
+        cols = [range(j, n*p, p) for j in range(p)]
+        data = array("d")
+        if isinstance(other, MatrixBatch):
+            assert self.count == other.count
+            right_slices = other.get_slices()
+        else:
+            flat = array("d", (element for row in other.elements for element in row))
+            right_slices = (flat for _ in range(self.count))
+        for a in self.get_slices():
+            b = next(right_slices)
+            for row in rows:
+                row_elements = [a[index] for index in row]
+                data.extend(sum(x*b[index] for x, index in zip(row_elements, col)) for col in cols)
+        return MatrixBatch(self.count, r, p, data)
+
+    def solve(self, b):
+        # b is a list with one right-hand side vector per matrix, or a MatrixBatch of right-hand sides.
+        assert self.row_count == self.col_count
+        if isinstance(b, MatrixBatch):
+            assert b.count == self.count and b.row_count == self.row_count
+            if self.row_count <= 3:
+                return self.inverse()*b
+            data = array("d")
+            for k in range(self.count):
+                rhs = b.get_elements(k)
+                decomposition = LUDecomposition(self.get_elements(k))
+                assert not decomposition.is_singular()
+                solution = decomposition.solve_cols([row[j] for row in rhs] for j in range(b.col_count))
+                for row in solution:
+                    data.extend(row)
+            return MatrixBatch(self.count, self.row_count, b.col_count, data)
+        else:
+            assert len(b) == self.count
+            solutions = self.solve(to_batch([[[element] for element in vector] for vector in b]))
+            return [list(solution) for solution in solutions.get_slices()]
@@ -0,0 +1,77 @@
+import matrix
+import matrix_batch
+import random
+import unittest
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        generator = random.Random(2)
+        self.matrices = {}
+        for n in (2, 3, 4):
+            self.matrices[n] = [matrix.Matrix([[generator.randint(-9, 9) + 20*(i == j) for j in range(n)] for i in range(n)]) for _ in range(5)]
+
+    def assertMatrixAlmostEqual(self, matrix1, matrix2):
+        self.assertEqual((matrix1.row_count, matrix1.col_count), (matrix2.row_count, matrix2.col_count))
+        for row1, row2 in zip(matrix1.elements, matrix2.elements):
+            for element1, element2 in zip(row1, row2):
+                self.assertAlmostEqual(element1, element2)
+
+    def test_to_batch(self):
+        batch = matrix_batch.to_batch(self.matrices[3])
+        self.assertEqual(len(batch), 5)
+        self.assertEqual(list(batch), self.matrices[3])
+        self.assertEqual(batch[-1], self.matrices[3][-1])
+
+    def test_determinant(self):
+        for n, matrices in self.matrices.items():
+            for determinant, single in zip(matrix_batch.to_batch(matrices).determinant(), matrices):
+                self.assertAlmostEqual(determinant, single.determinant())
+
+    def test_inverse(self):
+        for n, matrices in self.matrices.items():
+            for inverse, single in zip(matrix_batch.to_batch(matrices).inverse(), matrices):
+                self.assertMatrixAlmostEqual(inverse, single.inverse())
+
+    def test_transposed(self):
+        rectangular = [matrix.Matrix([[1,2,3],[4,5,6]]), matrix.Matrix([[0,1,0],[2,0,2]])]
+        for transposed, single in zip(matrix_batch.to_batch(rectangular).transposed(), rectangular):
+            self.assertEqual(transposed, single.transposed())
+
+    def test_mul(self):
+        left = matrix_batch.to_batch(self.matrices[3])
+        right = matrix_batch.to_batch([m.transposed() for m in self.matrices[3]])
+        for product, single in zip(left*right, self.matrices[3]):
+            self.assertEqual(product, single*single.transposed())
+        shared = matrix.Matrix([[1,0],[2,1],[0,3]])
+        for product, single in zip(left*shared, self.matrices[3]):
+            self.assertEqual(product, single*shared)
+
+    def test_solve(self):
+        for n, matrices in self.matrices.items():
+            vectors = [list(range(1, n+1)) for _ in matrices]
+            for x, single, vector in zip(matrix_batch.to_batch(matrices).solve(vectors), matrices, vectors):
+                for element1, element2 in zip(x, single.solve(vector)):
+                    self.assertAlmostEqual(element1, element2)
+
+    def test_singular(self):
+        for n in (2, 3, 4):
+            nearly_singular = [[1.0]*n for _ in range(n)]
+            nearly_singular[-1][-1] += 1e-14
+            scaled = [[1e-20*(i == j) if i == 0 else float(i == j) for j in range(n)] for i in range(n)]
+            self.assertTrue(matrix.Matrix(nearly_singular).is_singular())
+            self.assertFalse(matrix.Matrix(scaled).is_singular())
+            self.assertRaises(AssertionError, matrix_batch.to_batch([nearly_singular]).inverse)
+            self.assertRaises(AssertionError, matrix_batch.to_batch([nearly_singular]).solve, [[1.0]*n])
+            self.assertAlmostEqual(matrix_batch.to_batch([scaled]).solve([[1.0]*n])[0][0], 1e20, delta=1e6)
+
+    def test_compare_with_other_types(self):
+        batch = matrix_batch.to_batch(self.matrices[2])
+        self.assertFalse(batch == self.matrices[2][0])
+        self.assertTrue(batch != None)
+        self.assertTrue(batch == matrix_batch.to_batch(self.matrices[2]))
+        self.assertFalse(batch != matrix_batch.to_batch(self.matrices[2]))
+
+
+if __name__ == '__main__':
+    unittest.main()
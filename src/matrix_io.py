@@ -0,0 +1,78 @@
+import mmap as mmap_module
+import struct
+import sys
+from array import array
+
+
+# Header: magic, format version, element type code, storage order, row count, column count.
+# The raw little-endian elements follow directly, starting at an offset that is a multiple of 8.
+HEADER = struct.Struct("<4sBccxQQ")
+MAGIC = b"MATA"
+VERSION = 1
+DTYPE = b"d"
+ROW_MAJOR = b"C"
+TYPECODE = "d"
+ELEMENT = struct.Struct("<" + TYPECODE)
+
+
+class MappedBuffer(object):
+    # Flat read-only view of the elements in a memory-mapped file. Elements are decoded on access, so only
+    # the pages that are touched are ever read from disk.
+    def __init__(self, mapping, offset, length):
+        self.mapping = mapping
+        self.offset = offset
+        self.length = length
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, i):
+        if not 0 <= i < self.length:
+            raise IndexError("buffer index out of range")
+        return ELEMENT.unpack_from(self.mapping, self.offset + i*ELEMENT.size)[0]
+
+    def __setitem__(self, i, value):
+        raise TypeError("memory-mapped matrix is read-only")
+
+
+def get_mapped_buffer(mapping, length):
+    try:
+        return memoryview(mapping)[HEADER.size:].cast(TYPECODE)
+    except (AttributeError, TypeError):
+        return MappedBuffer(mapping, HEADER.size, length)
+
+
+def save(matrix, path):
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, DTYPE, ROW_MAJOR, matrix.row_count, matrix.col_count))
+        for i in range(matrix.row_count):
+            row = array(TYPECODE, matrix.get_row(i))
+            if sys.byteorder == "big":
+                row.byteswap()
+            row.tofile(f)
+
+
+def read_header(f):
+    magic, version, dtype, order, row_count, col_count = HEADER.unpack(f.read(HEADER.size))
+    assert magic == MAGIC
+    assert version == VERSION
+    assert dtype == DTYPE
+    assert order == ROW_MAJOR
+    return row_count, col_count
+
+
+def read(path, mmap=True):
+    # (row_count, col_count), data of a saved matrix. With mmap the elements stay in the file.
+    with open(path, "rb") as f:
+        row_count, col_count = read_header(f)
+        length = row_count*col_count
+        if mmap and sys.byteorder == "little":
+            mapping = mmap_module.mmap(f.fileno(), 0, access=mmap_module.ACCESS_READ)
+            assert len(mapping) == HEADER.size + length*ELEMENT.size
+            data = get_mapped_buffer(mapping, length)
+        else:
+            data = array(TYPECODE)
+            data.fromfile(f, length)
+            if sys.byteorder == "big":
+                data.byteswap()
+    return (row_count, col_count), data
@@ -0,0 +1,48 @@
+import array_matrix
+import matrix
+import matrix_io
+import os
+import shutil
+import tempfile
+import unittest
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "matrix.bin")
+        self.matrix = matrix.Matrix([[1,2.5,3],[4,5,-6]])
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_file_layout(self):
+        self.matrix.save(self.path)
+        self.assertEqual(os.path.getsize(self.path), matrix_io.HEADER.size + 6*8)
+        with open(self.path, "rb") as f:
+            self.assertEqual(matrix_io.read_header(f), (2, 3))
+
+    def test_load(self):
+        self.matrix.save(self.path)
+        loaded = matrix.Matrix.load(self.path, mmap=False)
+        self.assertIsInstance(loaded, array_matrix.ArrayMatrix)
+        self.assertEqual(loaded, self.matrix)
+        loaded.set_element(0, 0, 7)
+        self.assertEqual(loaded.get_row(0), [7,2.5,3])
+
+    def test_load_mmap(self):
+        self.matrix.save(self.path)
+        loaded = matrix.Matrix.load(self.path)
+        self.assertIsInstance(loaded, array_matrix.ArrayMatrix)
+        self.assertEqual(loaded, self.matrix)
+        self.assertEqual(loaded.transposed(), self.matrix.transposed())
+        self.assertEqual(loaded.get_col(2), [3,-6])
+        self.assertRaises(TypeError, loaded.set_element, 0, 0, 1)
+
+    def test_save_views(self):
+        array_matrix.ArrayMatrix(self.matrix.elements).transposed().save(self.path)
+        self.assertEqual(array_matrix.ArrayMatrix.load(self.path), self.matrix.transposed())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,228 @@
+import functools
+import timeit
+
+from matrix import Matrix, LUDecomposition
+
+
+def count_product(matrix, other, *args):
+    if isinstance(other, Matrix):
+        profile.element_operations += matrix.row_count*other.col_count*(2*other.row_count - 1)
+
+
+def count_elementwise(matrix, *args):
+    profile.element_operations += matrix.row_count*matrix.col_count
+
+
+def count_elimination(matrix, result):
+    # Upper bound: rows whose multiplier is zero are skipped by eliminate.
+    for col in result.pivot_cols:
+        remaining = matrix.col_count - col
+        profile.element_operations += remaining + 2*(matrix.row_count - 1)*(remaining - 1)
+
+
+def count_decomposition(decomposition, result):
+    n = decomposition.size
+    profile.element_operations += sum((n-k-1)*(1 + 2*(n-k-1)) for k in range(n))
+
+
+def count_substitution(decomposition, result):
+    profile.element_operations += decomposition.size*(2*decomposition.size - 1)
+
+
+def count_row_copy(matrix, *args):
+    profile.row_copies += 1
+    profile.copied_elements += matrix.col_count
+
+
+def count_col_copy(matrix, *args):
+    profile.col_copies += 1
+    profile.copied_elements += matrix.row_count
+
+
+# name: (called with the arguments before the method runs, called with the result after it returns).
+# An override in a subclass of Matrix counts like the method it overrides unless it has its own entry.
+HOOKS = {
+    "Matrix.__mul__": (count_product, None),
+    "Matrix.__imul__": (count_product, None),
+    "Matrix.add": (count_elementwise, None),
+    "Matrix.subtract": (count_elementwise, None),
+    "Matrix.scalar_muliplication": (count_elementwise, None),
+    "Matrix.get_row": (count_row_copy, None),
+    "Matrix.get_col": (count_col_copy, None),
+    "Matrix.eliminate": (None, count_elimination),
+    "LUDecomposition.__init__": (None, count_decomposition),
+    "LUDecomposition.solve_vector": (None, count_substitution),
+    # Rows and columns of an ArrayMatrix are views of its buffer, not copies.
+    "ArrayMatrix.get_row": (None, None),
+    "ArrayMatrix.get_col": (None, None),
+}
+
+WRAPPED_SPECIAL_METHODS = ("__init__", "__mul__", "__rmul__", "__imul__", "__add__", "__radd__", "__iadd__",
+                           "__sub__", "__rsub__", "__isub__", "__getitem__", "__eq__")
+
+
+class Profile(object):
+    # Counters filled in while instrumentation is enabled. Times are wall clock and inclusive, so a method
+    # also accounts for the methods it calls.
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.allocations = 0
+        self.element_operations = 0
+        self.row_copies = 0
+        self.col_copies = 0
+        self.copied_elements = 0
+        self.calls = {}
+        self.times = {}
+
+    def record_call(self, name, time):
+        self.calls[name] = self.calls.get(name, 0) + 1
+        self.times[name] = self.times.get(name, 0.0) + time
+
+    def snapshot(self):
+        return {
+            "allocations": self.allocations,
+            "element_operations": self.element_operations,
+            "row_copies": self.row_copies,
+            "col_copies": self.col_copies,
+            "copied_elements": self.copied_elements,
+            "calls": dict(self.calls),
+            "times": dict(self.times),
+        }
+
+    def report(self):
+        lines = [
+            "allocations: %d" % self.allocations,
+            "element operations: %d" % self.element_operations,
+            "row copies: %d, column copies: %d, copied elements: %d" % (self.row_copies, self.col_copies, self.copied_elements),
+            "%-36s %8s %12s" % ("method", "calls", "time (s)"),
+        ]
+        for name in sorted(self.times, key=lambda name: -self.times[name]):
+            lines.append("%-36s %8d %12.6f" % (name, self.calls[name], self.times[name]))
+        return "\n".join(lines)
+
+
+profile = Profile()
+
+# (class, attribute name, original class attribute); empty while instrumentation is disabled, when the
+# classes hold their original methods and nothing is counted.
+patched = []
+
+# (id of the object, method name) of the counted calls in progress. An override that calls the method it
+# overrides, like SparseMatrix.scalar_muliplication with an out matrix, is only counted once.
+counting = set()
+
+
+def get_hooks(cls, name):
+    for base in cls.__mro__:
+        hooks = HOOKS.get(base.__name__ + "." + name)
+        if hooks is not None:
+            return hooks
+    return None, None
+
+
+def wrap_method(name, method, hooks=(None, None)):
+    before, after = hooks
+    method_name = name.split(".")[-1]
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (id(self), method_name)
+        counted = (before is not None or after is not None) and key not in counting
+        if counted:
+            counting.add(key)
+            if before is not None:
+                before(self, *args)
+        start = timeit.default_timer()
+        try:
+            result = method(self, *args, **kwargs)
+        finally:
+            profile.record_call(name, timeit.default_timer() - start)
+            if counted:
+                counting.discard(key)
+        if counted and after is not None:
+            after(self, result)
+        return result
+    return wrapper
+
+
+def wrap_static_method(name, function):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        start = timeit.default_timer()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            profile.record_call(name, timeit.default_timer() - start)
+    return staticmethod(wrapper)
+
+
+def new_matrix(cls, *args, **kwargs):
+    profile.allocations += 1
+    return object.__new__(cls)
+
+
+def patch(cls, name, value):
+    patched.append((cls, name, cls.__dict__.get(name)))
+    setattr(cls, name, value)
+
+
+def instrument(cls):
+    for name, attribute in list(cls.__dict__.items()):
+        if name.startswith("_") and name not in WRAPPED_SPECIAL_METHODS:
+            continue
+        qualified_name = cls.__name__ + "." + name
+        if isinstance(attribute, staticmethod):
+            patch(cls, name, wrap_static_method(qualified_name, attribute.__get__(None, cls)))
+        elif callable(attribute):
+            patch(cls, name, wrap_method(qualified_name, attribute, get_hooks(cls, name)))
+
+
+def get_subclasses(cls):
+    # Every subclass once, also when it inherits from cls along several paths.
+    subclasses = []
+    for subclass in cls.__subclasses__():
+        for found in [subclass] + get_subclasses(subclass):
+            if found not in subclasses:
+                subclasses.append(found)
+    return subclasses
+
+
+def is_enabled():
+    return len(patched) > 0
+
+
+def enable():
+    # Instruments Matrix and the overrides in every subclass imported so far (ArrayMatrix, SparseMatrix,
+    # NumpyMatrix, MatrixView, ...); subclasses imported later are only profiled through the methods they
+    # inherit.
+    if is_enabled():
+        return
+    for cls in [Matrix] + get_subclasses(Matrix):
+        instrument(cls)
+    instrument(LUDecomposition)
+    patch(Matrix, "__new__", staticmethod(new_matrix))
+
+
+def disable():
+    while patched:
+        cls, name, original = patched.pop()
+        if original is None:
+            delattr(cls, name)
+        else:
+            setattr(cls, name, original)
+
+
+class profiling(object):
+    # with profiling() as profile: ... resets the counters, enables instrumentation for the block and
+    # disables it again unless it was already enabled.
+    def __enter__(self):
+        self.was_enabled = is_enabled()
+        profile.reset()
+        enable()
+        return profile
+
+    def __exit__(self, *args):
+        if not self.was_enabled:
+            disable()
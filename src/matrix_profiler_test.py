@@ -0,0 +1,70 @@
+import array_matrix
+import matrix
+import matrix_profiler
+import sparse_matrix
+import unittest
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.matrix1 = matrix.Matrix([[1,2,3],[4,5,6]])
+        self.matrix2 = matrix.Matrix([[3,1],[2,1]])
+
+    def tearDown(self):
+        matrix_profiler.disable()
+
+    def test_counts(self):
+        with matrix_profiler.profiling() as profile:
+            product = self.matrix2*self.matrix1
+            self.matrix1.get_row(0)
+            self.matrix1.get_col(1)
+            self.matrix2.determinant()
+        self.assertEqual(product.elements, [[7,11,15],[6,9,12]])
+        snapshot = profile.snapshot()
+        self.assertEqual(snapshot["allocations"], 1)
+        self.assertEqual(snapshot["element_operations"], 2*3*3 + 3)
+        self.assertEqual((snapshot["row_copies"], snapshot["col_copies"], snapshot["copied_elements"]), (1, 1, 5))
+        self.assertEqual(snapshot["calls"]["Matrix.__mul__"], 1)
+        self.assertEqual(snapshot["calls"]["LUDecomposition.__init__"], 1)
+        self.assertGreaterEqual(snapshot["times"]["Matrix.determinant"], 0)
+        self.assertIn("Matrix.__mul__", profile.report())
+
+    def test_disabled(self):
+        original = matrix.Matrix.__dict__["__mul__"]
+        matrix_profiler.enable()
+        self.assertTrue(matrix_profiler.is_enabled())
+        self.assertIsNot(matrix.Matrix.__dict__["__mul__"], original)
+        matrix_profiler.disable()
+        self.assertFalse(matrix_profiler.is_enabled())
+        self.assertIs(matrix.Matrix.__dict__["__mul__"], original)
+        self.assertNotIn("__new__", matrix.Matrix.__dict__)
+        calls = dict(matrix_profiler.profile.calls)
+        self.matrix1.transposed()
+        self.assertEqual(matrix_profiler.profile.calls, calls)
+
+    def test_subclasses(self):
+        array = array_matrix.ArrayMatrix(self.matrix1.elements)
+        sparse = sparse_matrix.to_sparse(self.matrix1)
+        original = sparse_matrix.SparseMatrix.__dict__["scalar_muliplication"]
+        with matrix_profiler.profiling() as profile:
+            array.get_row(0)
+            sparse.get_row(1)
+        self.assertEqual(profile.calls["ArrayMatrix.get_row"], 1)
+        self.assertEqual(profile.calls["SparseMatrix.get_row"], 1)
+        self.assertEqual((profile.row_copies, profile.copied_elements), (1, 3))
+        with matrix_profiler.profiling() as profile:
+            sparse.scalar_muliplication(2, matrix.Matrix([[0,0,0],[0,0,0]]))
+        self.assertEqual(profile.calls["SparseMatrix.scalar_muliplication"], 1)
+        self.assertEqual(profile.calls["Matrix.scalar_muliplication"], 1)
+        self.assertEqual(profile.element_operations, 6)
+        self.assertIs(sparse_matrix.SparseMatrix.__dict__["scalar_muliplication"], original)
+
+    def test_static_methods(self):
+        with matrix_profiler.profiling() as profile:
+            matrix.Matrix.block([[self.matrix2, matrix.IdentityBlock()]])
+        self.assertEqual(profile.calls["Matrix.block"], 1)
+        self.assertEqual(profile.allocations, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
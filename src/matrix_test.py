@@ -119,6 +119,167 @@ class MyTestCase(unittest.TestCase):
             for element1, element2 in zip(row1, row2):
                 self.assertAlmostEqual(element1, element2)
 
+    def test_row_echelon_form_floats(self):
+        result = matrix.Matrix([[2,4],[0,0]]).row_echelon_form()
+        self.assertEqual(repr(result), repr(matrix.Matrix([[1.0,2.0],[0.0,0.0]])))
+        self.assertEqual(repr(matrix.Matrix([[0,0]]).row_echelon_form()), repr(matrix.Matrix([[0,0]])))
+
+    def test_row_echelon_form_step(self):
+        m = matrix.Matrix([[0,2,0,4],[-3,1,4,-3],[4,2,0,-3],[0,0,4,0]])
+        self.assertIs(m.col_to_row_echelon_form(0), m)
+        self.assertEqual(m.elements[0], [1.0, -1.0, -4.0/3, -1.0/3])
+        self.assertEqual([row[0] for row in m.elements[1:]], [0.0, 0.0, 0.0])
+        self.assertEqual(m.elements[3], [0.0, 0.0, 4.0, 0.0])
+        m = matrix.Matrix(self.matrix5.elements)
+        rank = 0
+        for col in range(m.col_count):
+            m, rank = m.row_echelon_form_step(m, col, rank)
+        self.assertEqual(rank, 4)
+        self.assertEqual(m, self.matrix5.row_echelon_form())
+
+    def test_determinant(self):
+        self.assertEqual(self.matrix3.determinant(), 42)
+        self.assertEqual(matrix.Matrix([[4,3],[2,1]]).determinant(), -2)
+        self.assertEqual(self.matrix2.determinant(), 0)
+        self.assertEqual(matrix.Matrix([[5]]).determinant(), 5)
+        self.assertIsInstance(matrix.Matrix([[2,1],[1,1]]).determinant(), int)
+        self.assertAlmostEqual(matrix.Matrix([[0.5,1],[1,1]]).determinant(), -0.5)
+
+    def test_badly_scaled(self):
+        scaled = matrix.Matrix([[1e-7,0],[0,1e7]])
+        self.assertFalse(scaled.is_singular())
+        self.assertEqual(scaled.determinant(), 1.0)
+        self.assertTrue(matrix.Matrix([[1.0,2.0],[2.0,4.0+1e-14]]).is_singular())
+
+    def test_is_singular(self):
+        self.assertTrue(self.matrix2.is_singular())
+        self.assertTrue(matrix.Matrix([[1,2,3],[4,5,6],[7,8,9]]).is_singular())
+        self.assertFalse(self.matrix3.is_singular())
+
+    def test_inverse(self):
+        product = self.matrix3.inverse()*self.matrix3
+        for i in range(3):
+            for j in range(3):
+                self.assertAlmostEqual(product.elements[i][j], int(i == j))
+
+    def test_lu_decomposition_cached(self):
+        decomposition = self.matrix3.get_lu_decomposition()
+        self.matrix3.determinant()
+        self.matrix3.inverse()
+        self.assertIs(self.matrix3.get_lu_decomposition(), decomposition)
+        self.matrix3.set_row(0, [0,0,0])
+        self.assertIsNot(self.matrix3.get_lu_decomposition(), decomposition)
+        self.assertTrue(self.matrix3.is_singular())
+
+    def test_solve_vector(self):
+        b = [10, 28, 45]
+        x = self.matrix3.solve(b)
+        for i in range(3):
+            self.assertAlmostEqual(sum(a*y for a, y in zip(self.elements3[i], x)), b[i])
+
+    def test_solve_matrix(self):
+        b = matrix.Matrix([[10, 1], [28, 0], [45, 2]])
+        x = self.matrix3.solve(b)
+        self.assertEqual((x.row_count, x.col_count), (3, 2))
+        product = self.matrix3*x
+        for row1, row2 in zip(product.elements, b.elements):
+            for element1, element2 in zip(row1, row2):
+                self.assertAlmostEqual(element1, element2)
+        self.assertEqual(self.matrix3.solve(b.transposed().get_row(0)), x.get_col(0))
+
+    def test_in_place_arithmetic(self):
+        rows = self.matrix3.elements
+        first_row = rows[0]
+        self.matrix3 += self.matrix3
+        self.matrix3 -= matrix.Matrix(self.elements3)
+        self.matrix3 *= 2
+        self.assertIs(self.matrix3.elements, rows)
+        self.assertIs(self.matrix3.elements[0], first_row)
+        self.assertEqual(self.matrix3.elements, [[2*a for a in row] for row in self.elements3])
+        self.matrix3 *= matrix.get_unit_matrix(3)
+        self.assertIs(self.matrix3.elements, rows)
+        self.assertEqual(self.matrix3.elements, [[2*a for a in row] for row in self.elements3])
+
+    def test_shared_rows_not_mutated(self):
+        rows = [[1,2],[3,4]]
+        shared = matrix.wrap_elements(rows)
+        other = matrix.wrap_elements([rows[0], [5,6]])
+        other.set_row(0, [9,9])
+        other += other
+        self.assertEqual(shared.elements, [[1,2],[3,4]])
+        self.assertEqual(other.elements, [[18,18],[10,12]])
+
+    def test_out(self):
+        out = matrix.Matrix([[0,0,0],[0,0,0]])
+        rows = out.elements
+        self.assertIs(self.matrix1.add(self.matrix1, out=out), out)
+        self.assertEqual(out.elements, [[2,4,6],[8,10,12]])
+        self.matrix1.subtract(matrix.Matrix([[1,1,1],[1,1,1]]), out=out)
+        self.assertEqual(out.elements, [[0,1,2],[3,4,5]])
+        self.matrix1.scalar_muliplication(3, out=out)
+        self.assertEqual(out.elements, [[3,6,9],[12,15,18]])
+        self.assertIs(out.elements, rows)
+        merged = matrix.Matrix([[0]*6, [0]*6])
+        self.matrix1.merge_horisontal(self.matrix1, out=merged)
+        self.assertEqual(merged.elements, [[1,2,3,1,2,3],[4,5,6,4,5,6]])
+
+    def test_eliminate(self):
+        result = self.matrix5.eliminate()
+        self.assertEqual(result.rank, 4)
+        self.assertEqual(result.pivot_cols, [1,3,4,5])
+        self.assertEqual(len(result.nullspace), 2)
+        for vector in result.nullspace:
+            for row in self.elements5:
+                self.assertAlmostEqual(sum(a*x for a, x in zip(row, vector)), 0)
+        self.assertEqual(self.matrix5.elements, self.elements5)
+
+    def test_eliminate_reduced(self):
+        singular = matrix.Matrix([[1,2,3],[4,5,6],[7,8,9]])
+        result = singular.eliminate(reduced=True)
+        self.assertEqual(result.rank, 2)
+        self.assertEqual(result.pivot_cols, [0,1])
+        expected = [[1,0,-1],[0,1,2],[0,0,0]]
+        for row1, row2 in zip(result.matrix.elements, expected):
+            for element1, element2 in zip(row1, row2):
+                self.assertAlmostEqual(element1, element2)
+        for element1, element2 in zip(result.nullspace[0], [1,-2,1]):
+            self.assertAlmostEqual(element1, element2)
+        self.assertEqual(singular.rank(), 2)
+
+    def test_eliminate_in_place(self):
+        rows = self.matrix3.elements
+        result = self.matrix3.eliminate(reduced=True, in_place=True)
+        self.assertIs(result.matrix, self.matrix3)
+        self.assertIs(self.matrix3.elements, rows)
+        self.assertEqual(result.nullspace, [])
+        for i in range(3):
+            for j in range(3):
+                self.assertAlmostEqual(self.matrix3.elements[i][j], int(i == j))
+
+    def test_block(self):
+        result = matrix.Matrix.block([
+            [self.matrix1, matrix.IdentityBlock(), matrix.ColumnBlock([7,8])],
+            [[1,1,1], 0, 0],
+            [0, -1, 0]
+        ])
+        self.assertEqual(result.elements, [
+            [1,2,3,1,0,7],
+            [4,5,6,0,1,8],
+            [1,1,1,0,0,0],
+            [0,0,0,-1,-1,0]
+        ])
+
+    def test_block_diagonal(self):
+        result = matrix.Matrix.block([[matrix.DiagonalBlock([2,-1]), matrix.ConstantBlock(5), [[1],[2]]]])
+        self.assertEqual(result.elements, [[2,0,5,1],[0,-1,5,2]])
+        self.assertRaises(AssertionError, matrix.Matrix.block, [[self.matrix1, [[1,2]]]])
+
+    def test_solve_transposed(self):
+        decomposition = matrix.LUDecomposition([[0,2,1],[1,1,0],[3,0,1]])
+        x = decomposition.solve_transposed_vector([7,3,3])
+        for element, expected in zip(x, [1,1,2]):
+            self.assertAlmostEqual(element, expected)
+
 
 if __name__ == '__main__':
     unittest.main()
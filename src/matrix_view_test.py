@@ -0,0 +1,80 @@
+import array_matrix
+import matrix
+import numpy_matrix
+import sparse_matrix
+import unittest
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.elements = [
+            [1,2,3,4,5],
+            [6,7,8,9,10],
+            [11,12,13,14,15],
+            [16,17,18,19,21]
+        ]
+        self.matrix = matrix.Matrix(self.elements)
+
+    def test_slicing(self):
+        view = self.matrix[1:3, 2:5]
+        self.assertIsInstance(view, matrix.MatrixView)
+        self.assertEqual(view, matrix.Matrix([[8,9,10],[13,14,15]]))
+        self.assertEqual(self.matrix[1:3], matrix.Matrix(self.elements[1:3]))
+        self.assertEqual(self.matrix[[0,-1], 4].elements, [[5],[21]])
+        self.assertEqual(self.matrix[2, 1], 12)
+        self.assertRaises(IndexError, lambda: self.matrix[[4], 0])
+
+    def test_view_shares_elements(self):
+        view = self.matrix[1:3, 2:5]
+        rows = self.matrix.elements
+        view.set_row(0, [0,0,0])
+        view.elements[1][0] = -1
+        self.assertEqual(self.matrix.get_row(1), [6,7,0,0,0])
+        self.assertEqual(self.matrix.get_col(2), [3,0,-1,18])
+        self.assertIs(self.matrix.elements, rows)
+
+    def test_view_writes_invalidate_decomposition(self):
+        square = matrix.Matrix([[4,2,6],[1,11,5],[3,12,9]])
+        self.assertEqual(square.determinant(), 42)
+        square[:, :].elements[0][0] = 0
+        self.assertEqual(square.determinant(), -114)
+        square[1:, :].set_row(0, [0,0,0])
+        self.assertEqual(square.determinant(), 0)
+
+    def test_copied_rows_rejected(self):
+        self.assertRaises(AssertionError, lambda: sparse_matrix.to_sparse(self.matrix)[1:, :])
+        if numpy_matrix.numpy is not None:
+            self.assertRaises(AssertionError, lambda: numpy_matrix.NumpyMatrix(self.elements)[1:, :])
+
+    def test_nested_view(self):
+        view = self.matrix[1:, 1:][1:, ::2]
+        self.assertIs(view.parent, self.matrix)
+        self.assertEqual(view.elements, [[12,14],[17,19]])
+
+    def test_delete(self):
+        view = self.matrix[:, :]
+        view.delete_row(-1)
+        view.delete_col(0)
+        view.delete_col(1)
+        self.assertEqual(view.elements, [[2,4,5],[7,9,10],[12,14,15]])
+        self.assertEqual(self.matrix.elements, self.elements)
+
+    def test_minor(self):
+        square = matrix.Matrix([[4,2,6],[1,11,5],[3,12,9]])
+        self.assertAlmostEqual(square.minor(0, 0), 39)
+        self.assertAlmostEqual(square.minor(1, 2), 42)
+        self.assertAlmostEqual(self.matrix[:, :4].minor(3, 3), 0)
+
+    def test_array_matrix_slicing(self):
+        view = array_matrix.ArrayMatrix(self.elements)[1:3, 2:5]
+        self.assertIsInstance(view, array_matrix.ArrayMatrix)
+        self.assertEqual(view, matrix.Matrix([[8,9,10],[13,14,15]]))
+        self.assertEqual(view[1, -1], 15)
+        self.assertRaises(IndexError, lambda: view[2, 0])
+        rows = array_matrix.ArrayMatrix(self.elements)[[0, 2], 1:3]
+        rows.elements[1][0] = -1
+        self.assertEqual(rows.parent.get_row(2), [11,-1,13,14,15])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import operator
+
+
+BLOCK_SIZE = 64
+STRASSEN_THRESHOLD = 128
+
+
+def multiply(a, b, strassen_threshold=None, block_size=None):
+    if strassen_threshold is None:
+        strassen_threshold = STRASSEN_THRESHOLD
+    if block_size is None:
+        block_size = BLOCK_SIZE
+    if min(len(a), len(b), len(b[0])) > strassen_threshold:
+        return strassen_multiply(a, b, strassen_threshold, block_size)
+    else:
+        return blocked_multiply(a, b, block_size)
+
+
+def blocked_multiply(a, b, block_size=BLOCK_SIZE):
+    # The right operand is transposed once so that every dot product runs over two packed rows.
+    return packed_multiply(a, list(zip(*b)), block_size)
+
+
+def packed_multiply(a, b_cols, block_size=BLOCK_SIZE):
+    # Output is filled tile by tile so a block of rows and a block of columns stay hot together.
+    result = [[None]*len(b_cols) for _ in range(len(a))]
+    for row_start in range(0, len(a), block_size):
+        row_block = range(row_start, min(row_start+block_size, len(a)))
+        for col_start in range(0, len(b_cols), block_size):
+            col_block = b_cols[col_start:col_start+block_size]
+            for i in row_block:
+                row = a[i]
+                result[i][col_start:col_start+len(col_block)] = [sum(map(operator.mul, row, col)) for col in col_block]
+    return result
+
+
+def add(a, b):
+    return [list(map(operator.add, row_a, row_b)) for row_a, row_b in zip(a, b)]
+
+
+def sub(a, b):
+    return [list(map(operator.sub, row_a, row_b)) for row_a, row_b in zip(a, b)]
+
+
+def pad(elements, row_count, col_count):
+    padding = [0]*(col_count-len(elements[0]))
+    padded = [list(row) + padding for row in elements]
+    padded.extend([0]*col_count for _ in range(row_count-len(elements)))
+    return padded
+
+
+def split(elements, row_half, col_half):
+    top, bottom = elements[:row_half], elements[row_half:]
+    return ([row[:col_half] for row in top], [row[col_half:] for row in top],
+            [row[:col_half] for row in bottom], [row[col_half:] for row in bottom])
+
+
+def strassen_multiply(a, b, strassen_threshold=STRASSEN_THRESHOLD, block_size=BLOCK_SIZE):
+    m, n, p = len(a), len(b), len(b[0])
+    if min(m, n, p) <= strassen_threshold:
+        return blocked_multiply(a, b, block_size)
+    m_half, n_half, p_half = (m+1)//2, (n+1)//2, (p+1)//2
+    a11, a12, a21, a22 = split(pad(a, 2*m_half, 2*n_half), m_half, n_half)
+    b11, b12, b21, b22 = split(pad(b, 2*n_half, 2*p_half), n_half, p_half)
+    m1 = strassen_multiply(add(a11, a22), add(b11, b22), strassen_threshold, block_size)
+    m2 = strassen_multiply(add(a21, a22), b11, strassen_threshold, block_size)
+    m3 = strassen_multiply(a11, sub(b12, b22), strassen_threshold, block_size)
+    m4 = strassen_multiply(a22, sub(b21, b11), strassen_threshold, block_size)
+    m5 = strassen_multiply(add(a11, a12), b22, strassen_threshold, block_size)
+    m6 = strassen_multiply(sub(a21, a11), add(b11, b12), strassen_threshold, block_size)
+    m7 = strassen_multiply(sub(a12, a22), add(b21, b22), strassen_threshold, block_size)
+    c11 = add(sub(add(m1, m4), m5), m7)
+    c12 = add(m3, m5)
+    c21 = add(m2, m4)
+    c22 = add(add(sub(m1, m2), m3), m6)
+    top = [row1 + row2 for row1, row2 in zip(c11, c12)]
+    bottom = [row1 + row2 for row1, row2 in zip(c21, c22)]
+    return [row[:p] for row in (top + bottom)[:m]]
@@ -0,0 +1,32 @@
+import multiplication
+import random
+import unittest
+
+
+def naive_multiply(a, b):
+    return [[sum(a[i][k]*b[k][j] for k in range(len(b))) for j in range(len(b[0]))] for i in range(len(a))]
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        generator = random.Random(0)
+        self.a = [[generator.randint(-9, 9) for _ in range(13)] for _ in range(11)]
+        self.b = [[generator.randint(-9, 9) for _ in range(7)] for _ in range(13)]
+
+    def test_blocked_multiply(self):
+        expected = naive_multiply(self.a, self.b)
+        self.assertEqual(multiplication.blocked_multiply(self.a, self.b), expected)
+        self.assertEqual(multiplication.blocked_multiply(self.a, self.b, 4), expected)
+
+    def test_strassen_multiply(self):
+        expected = naive_multiply(self.a, self.b)
+        self.assertEqual(multiplication.strassen_multiply(self.a, self.b, 2), expected)
+        self.assertEqual(multiplication.multiply(self.a, self.b, strassen_threshold=1, block_size=3), expected)
+
+    def test_strassen_multiply_square(self):
+        a = [row[:11] for row in self.a]
+        self.assertEqual(multiplication.strassen_multiply(a, a, 1), naive_multiply(a, a))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,199 @@
+import math
+
+from matrix import Matrix, SINGULARITY_TOLERANCE
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def create_matrix(elements):
+    if numpy is None:
+        return Matrix(elements)
+    else:
+        return NumpyMatrix(elements)
+
+
+def as_array(other):
+    if isinstance(other, NumpyMatrix):
+        return other.array
+    else:
+        return numpy.array(other.elements)
+
+
+class NumpyMatrix(Matrix):
+    # Matrix that holds an ndarray. Elementwise operations, products and eliminations run as vectorized
+    # numpy kernels; elements, get_row and get_col return lists so that __eq__ and __repr__ match Matrix.
+    def __init__(self, elements, copy=True):
+        assert numpy is not None
+        array = numpy.array(elements, copy=copy)
+        assert array.ndim == 2
+        self.check_positive_length(array)
+        self.check_positive_length(array[0])
+        self.array = array
+        self.lu_decomposition = None
+        self.eigen_decomposition = None
+        self.log_determinant = None
+
+    @property
+    def row_count(self):
+        return self.array.shape[0]
+
+    @property
+    def col_count(self):
+        return self.array.shape[1]
+
+    @property
+    def elements(self):
+        return self.array.tolist()
+
+    def is_numeric(self):
+        return self.array.dtype.kind in "biuf"
+
+    def set_values(self, index, values):
+        values = numpy.asarray(values)
+        if not numpy.can_cast(values.dtype, self.array.dtype):
+            self.array = self.array.astype(numpy.result_type(self.array, values))
+        self.array[index] = values
+        self.invalidate_decomposition()
+
+    def __add__(self, other):
+        self.check_matrix_size(other)
+        return NumpyMatrix(self.array + as_array(other), copy=False)
+
+    def __sub__(self, other):
+        self.check_matrix_size(other)
+        return NumpyMatrix(self.array - as_array(other), copy=False)
+
+    def __rsub__(self, other):
+        self.check_matrix_size(other)
+        return NumpyMatrix(as_array(other) - self.array, copy=False)
+
+    def __mul__(self, other):
+        assert self.col_count == other.row_count
+        return NumpyMatrix(self.array.dot(as_array(other)), copy=False)
+
+    def __iadd__(self, other):
+        self.check_matrix_size(other)
+        self.set_values(Ellipsis, self.array + as_array(other))
+        return self
+
+    def __isub__(self, other):
+        self.check_matrix_size(other)
+        self.set_values(Ellipsis, self.array - as_array(other))
+        return self
+
+    def scalar_muliplication(self, scalar, out=None):
+        if out is not None:
+            return Matrix.scalar_muliplication(self, scalar, out)
+        return NumpyMatrix(self.array*scalar, copy=False)
+
+    def scale(self, scalar):
+        self.set_values(Ellipsis, self.array*scalar)
+        return self
+
+    def transposed(self):
+        return NumpyMatrix(self.array.T, copy=False)
+
+    def get_row(self, i):
+        return self.array[i].tolist()
+
+    def get_col(self, j):
+        return self.array[:, j].tolist()
+
+    def set_row(self, i, elements):
+        assert len(elements) == self.col_count
+        self.set_values(i, list(elements))
+
+    def write_row(self, i, row):
+        self.set_row(i, row)
+
+    def set_col(self, i, elements):
+        assert len(elements) == self.row_count
+        self.set_values((slice(None), i), list(elements))
+
+    def delete_row(self, i):
+        self.array = numpy.delete(self.array, i, axis=0)
+        self.invalidate_decomposition()
+
+    def delete_col(self, i):
+        self.array = numpy.delete(self.array, i, axis=1)
+        self.invalidate_decomposition()
+
+    def invalidate_decomposition(self):
+        self.lu_decomposition = None
+        self.eigen_decomposition = None
+        self.log_determinant = None
+
+    def get_log_determinant(self):
+        # (sign, log|det|) from one LU factorisation, cached like Matrix caches its LUDecomposition. Only
+        # used for the singularity test, where it cannot overflow.
+        assert self.row_count == self.col_count
+        if self.log_determinant is None:
+            sign, log_determinant = numpy.linalg.slogdet(self.array)
+            self.log_determinant = float(sign), float(log_determinant)
+        return self.log_determinant
+
+    def is_singular(self):
+        # Like LUDecomposition, relative to the largest element of every row: |det| is compared with the
+        # product of the row maxima, so scaling a row does not change the answer.
+        if not self.is_numeric():
+            return Matrix.is_singular(self)
+        sign, log_determinant = self.get_log_determinant()
+        if sign == 0:
+            return True
+        row_scales = numpy.abs(self.array).max(axis=1)
+        return log_determinant - float(numpy.log(row_scales).sum()) <= math.log(SINGULARITY_TOLERANCE)
+
+    def determinant(self):
+        # Integer arrays get the exact determinant of Matrix, so the backend does not change results.
+        if self.array.dtype.kind not in "f":
+            return Matrix.determinant(self)
+        assert self.row_count == self.col_count
+        return float(numpy.linalg.det(self.array))
+
+    def inverse(self):
+        if not self.is_numeric():
+            return Matrix.inverse(self)
+        assert not self.is_singular()
+        return NumpyMatrix(numpy.linalg.inv(self.array), copy=False)
+
+    def merge_horisontal(self, other, out=None):
+        if out is not None:
+            return Matrix.merge_horisontal(self, other, out)
+        assert self.row_count == other.row_count
+        return NumpyMatrix(numpy.hstack((self.array, as_array(other))), copy=False)
+
+    def merge_vertical(self, other):
+        assert self.col_count == other.col_count
+        return NumpyMatrix(numpy.vstack((self.array, as_array(other))), copy=False)
+
+    def scale_row(self, factor, row_index):
+        self.set_values(row_index, self.array[row_index]/float(factor))
+
+    def make_elements_zero_using_row(self, row_index, col_index, rows_to_zero=None):
+        if rows_to_zero is None:
+            row_index %= self.row_count
+            rows_to_zero = tuple(i for i in range(self.row_count) if i != row_index)
+        rows = numpy.array(list(rows_to_zero), dtype=int)
+        if len(rows) > 0:
+            self.set_values(rows, self.array[rows] - numpy.outer(self.array[rows, col_index], self.array[row_index]))
+
+    def row_echelon_form(self):
+        if not self.is_numeric():
+            return Matrix.row_echelon_form(self)
+        result = self.array.astype(float)
+        row = 0
+        for col in range(self.col_count):
+            if row == self.row_count:
+                break
+            non_zero = numpy.flatnonzero(result[row:, col])
+            if len(non_zero) == 0:
+                continue
+            if non_zero[0] != 0:
+                result[row] += result[row+non_zero[0]]
+            result[row] /= result[row, col]
+            result[row+1:] -= numpy.outer(result[row+1:, col], result[row])
+            row += 1
+        return NumpyMatrix(result, copy=False)
@@ -0,0 +1,96 @@
+import matrix
+import numpy_matrix
+import unittest
+
+
+class FallbackTestCase(unittest.TestCase):
+    def test_create_matrix(self):
+        created = numpy_matrix.create_matrix([[1,2],[3,4]])
+        self.assertEqual(created, matrix.Matrix([[1,2],[3,4]]))
+        if numpy_matrix.numpy is None:
+            self.assertIs(type(created), matrix.Matrix)
+        else:
+            self.assertIsInstance(created, numpy_matrix.NumpyMatrix)
+
+
+@unittest.skipIf(numpy_matrix.numpy is None, "numpy is not installed")
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.elements1 = [
+            [4,2,6],
+            [1,11,5],
+            [3,12,9]
+        ]
+        self.elements2 = [
+            [0,2,6],
+            [4,0,0],
+            [1,11,5],
+            [3,12,9]
+        ]
+        self.matrix1 = numpy_matrix.NumpyMatrix(self.elements1)
+        self.matrix2 = numpy_matrix.NumpyMatrix(self.elements2)
+        self.dense1 = matrix.Matrix(self.elements1)
+        self.dense2 = matrix.Matrix(self.elements2)
+
+    def assertMatrixAlmostEqual(self, matrix1, matrix2):
+        self.assertEqual((matrix1.row_count, matrix1.col_count), (matrix2.row_count, matrix2.col_count))
+        for row1, row2 in zip(matrix1.elements, matrix2.elements):
+            for element1, element2 in zip(row1, row2):
+                self.assertAlmostEqual(element1, element2)
+
+    def test_repr_and_eq(self):
+        self.assertEqual(str(self.matrix1), str(self.dense1))
+        self.assertEqual(self.matrix1, self.dense1)
+        self.assertEqual(self.dense1, self.matrix1)
+
+    def test_arithmetic(self):
+        self.assertEqual(self.matrix1 + self.dense1, self.dense1 + self.dense1)
+        self.assertEqual(self.matrix1 - self.dense1.transposed(), self.dense1 - self.dense1.transposed())
+        self.assertEqual(self.matrix2*self.matrix1, self.dense2*self.dense1)
+        self.assertEqual(self.matrix1.scalar_muliplication(3), self.dense1.scalar_muliplication(3))
+        self.assertEqual(self.matrix2.transposed(), self.dense2.transposed())
+
+    def test_determinant_and_inverse(self):
+        self.assertEqual(self.matrix1.determinant(), 42)
+        self.assertIsInstance(self.matrix1.determinant(), int)
+        self.assertAlmostEqual(numpy_matrix.NumpyMatrix([[4.0,2,6],[1,11,5],[3,12,9]]).determinant(), 42)
+        self.assertEqual(numpy_matrix.NumpyMatrix([[1,2,3],[4,5,6],[7,8,9]]).determinant(), 0)
+        self.assertMatrixAlmostEqual(self.matrix1.inverse(), self.dense1.inverse())
+        scaled = numpy_matrix.NumpyMatrix([[1e-7,0],[0,1e7]])
+        self.assertFalse(scaled.is_singular())
+        self.assertAlmostEqual(scaled.determinant(), 1)
+        self.assertTrue(numpy_matrix.NumpyMatrix([[1.0,2.0],[2.0,4.0+1e-14]]).is_singular())
+
+    def test_determinant_cached(self):
+        self.matrix1.is_singular()
+        cached = self.matrix1.log_determinant
+        self.assertFalse(self.matrix1.is_singular())
+        self.assertIs(self.matrix1.log_determinant, cached)
+        self.matrix1.set_row(0, [0,0,0])
+        self.assertEqual(self.matrix1.determinant(), 0)
+        self.assertTrue(self.matrix1.is_singular())
+
+    def test_row_echelon_form(self):
+        self.assertMatrixAlmostEqual(self.matrix1.row_echelon_form(), self.dense1.row_echelon_form())
+        self.assertMatrixAlmostEqual(self.matrix2.row_echelon_form(), self.dense2.row_echelon_form())
+
+    def test_in_place_arithmetic(self):
+        self.matrix1 += self.dense1
+        self.matrix1 -= self.dense1.transposed()
+        self.matrix1.scale(0.5)
+        self.assertIsInstance(self.matrix1, numpy_matrix.NumpyMatrix)
+        self.assertMatrixAlmostEqual(self.matrix1, (self.dense1 + self.dense1 - self.dense1.transposed()).scalar_muliplication(0.5))
+
+    def test_row_operations(self):
+        self.matrix1.scale_row(4, 0)
+        self.dense1.scale_row(4, 0)
+        self.matrix1.make_elements_zero_using_row(0, 0)
+        self.dense1.make_elements_zero_using_row(0, 0)
+        self.assertMatrixAlmostEqual(self.matrix1, self.dense1)
+        self.matrix2.delete_row(0)
+        self.matrix2.delete_col(-1)
+        self.assertEqual(self.matrix2.elements, [[4,0],[1,11],[3,12]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import multiprocessing
+
+from sparse_matrix import SparseMatrix, to_sparse
+from revised_simplex import RevisedSimplex
+from warm_start import WarmStartSolver
+
+
+# Filled in each worker by init_worker. A is inherited when the pool forks, so tasks only carry b and c.
+shared = {}
+
+
+class ScenarioSolver(object):
+    # Solves scenarios that share A. With warm_start the basis of the previous scenario is kept and both the
+    # new b and the new c are applied to it before one re-optimisation: dual simplex for b, then primal
+    # simplex for c.
+    def __init__(self, A, warm_start=False):
+        self.A = A
+        self.warm_start = warm_start
+        self.solver = None
+
+    def solve(self, task):
+        index, b, c = task
+        if not self.warm_start:
+            return index, RevisedSimplex(c, self.A, b).run()
+        if self.solver is None:
+            self.solver = WarmStartSolver(c, self.A, b)
+            return index, self.solver.solve()
+        return index, self.solver.update(c, b)
+
+
+def init_worker(A, warm_start):
+    shared.clear()
+    shared["solver"] = ScenarioSolver(A, warm_start)
+
+
+def solve_scenario(task):
+    return shared["solver"].solve(task)
+
+
+def solve_many(A, list_of_b, list_of_c, workers=None, warm_start=False, chunksize=1):
+    # Yields (index, result) for max c^T x, A x <= b, x >= 0 for every pair of list_of_b and list_of_c, in
+    # the order the scenarios finish. With one worker they are solved in order in this process.
+    assert len(list_of_b) == len(list_of_c)
+    A = A if isinstance(A, SparseMatrix) else to_sparse(A)
+    tasks = [(index, b, c) for index, (b, c) in enumerate(zip(list_of_b, list_of_c))]
+    workers = workers or multiprocessing.cpu_count()
+    if workers == 1:
+        solver = ScenarioSolver(A, warm_start)
+        for task in tasks:
+            yield solver.solve(task)
+        return
+    pool = multiprocessing.Pool(workers, initializer=init_worker, initargs=(A, warm_start))
+    try:
+        for result in pool.imap_unordered(solve_scenario, tasks, chunksize):
+            yield result
+    finally:
+        pool.terminate()
+        pool.join()
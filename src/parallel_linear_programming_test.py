@@ -0,0 +1,36 @@
+import matrix
+import parallel_linear_programming
+import random
+import revised_simplex
+import unittest
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        generator = random.Random(1)
+        self.A = matrix.Matrix([[generator.randint(-2, 6) for _ in range(4)] for _ in range(5)])
+        self.list_of_b = [[generator.randint(-1, 12) for _ in range(5)] for _ in range(12)]
+        self.list_of_c = [[generator.randint(-2, 6) for _ in range(4)] for _ in range(12)]
+
+    def assertSolved(self, results):
+        self.assertEqual(sorted(index for index, _ in results), list(range(12)))
+        for index, result in results:
+            expected = revised_simplex.RevisedSimplex(self.list_of_c[index], self.A, self.list_of_b[index]).run()
+            self.assertEqual(result.status, expected.status)
+            if expected.status == "SUCCESSFUL":
+                self.assertAlmostEqual(result.value, expected.value)
+
+    def test_parallel(self):
+        self.assertSolved(list(parallel_linear_programming.solve_many(self.A, self.list_of_b, self.list_of_c, workers=2)))
+
+    def test_warm_start(self):
+        self.assertSolved(list(parallel_linear_programming.solve_many(self.A, self.list_of_b, self.list_of_c, workers=2, warm_start=True)))
+
+    def test_serial(self):
+        results = list(parallel_linear_programming.solve_many(self.A, self.list_of_b, self.list_of_c, workers=1, warm_start=True))
+        self.assertEqual([index for index, _ in results], list(range(12)))
+        self.assertSolved(results)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,213 @@
+import multiprocessing
+import numbers
+import operator
+from multiprocessing.sharedctypes import RawArray
+
+from array_matrix import ArrayMatrix
+from matrix import Matrix, wrap_elements
+
+
+PARALLEL_THRESHOLD = 256
+# Integer products are computed in doubles, which are exact while every partial sum stays below 2**53.
+EXACT_FLOAT_LIMIT = 2**53
+
+# Filled in each worker by init_worker with the executor's shared arrays. They are inherited when the pool
+# forks, so tasks only carry array names and row ranges and operands are never pickled.
+shared = {}
+
+
+def init_worker(arrays):
+    shared.clear()
+    shared.update(arrays)
+
+
+def is_float_compatible(matrix):
+    return all(isinstance(element, (numbers.Integral, float)) for row in matrix.elements for element in row)
+
+
+def is_integral(matrix):
+    return all(isinstance(element, numbers.Integral) for row in matrix.elements for element in row)
+
+
+def get_max_element(matrix):
+    return max(abs(element) for row in matrix.elements for element in row)
+
+
+def copy_rows(data, rows):
+    offset = 0
+    for row in rows:
+        data[offset:offset+len(row)] = list(row)
+        offset += len(row)
+
+
+def get_row_ranges(row_count, task_count):
+    step = max(1, -(-row_count // task_count))
+    return [(start, min(start+step, row_count)) for start in range(0, row_count, step)]
+
+
+def multiply_rows(task):
+    call, row_range, n, p = task
+    a, b_cols, result = shared["a"], shared["b_cols"], shared["result"]
+    if shared.get("cols_call") != call:
+        shared["cols"] = [b_cols[j*n:(j+1)*n] for j in range(p)]
+        shared["cols_call"] = call
+    cols = shared["cols"]
+    for i in range(*row_range):
+        row = a[i*n:(i+1)*n]
+        result[i*p:(i+1)*p] = [sum(map(operator.mul, row, col)) for col in cols]
+
+
+def zero_rows(task):
+    name, row_index, col_index, rows, n = task
+    data = shared[name]
+    pivot_row = data[row_index*n:(row_index+1)*n]
+    for i in rows:
+        row = data[i*n:(i+1)*n]
+        multiplier = row[col_index]
+        if multiplier != 0:
+            data[i*n:(i+1)*n] = [x - multiplier*y for x, y in zip(row, pivot_row)]
+
+
+class ParallelExecutor(object):
+    # Runs products and eliminations of float matrices on one process pool that lives as long as the
+    # executor. Operands live in shared ctypes arrays owned by the executor. Workers only see the arrays that
+    # existed when they forked, so a new or larger array marks the pool stale and it is forked again on its
+    # next use: matrices created together cost one fork. Matrices from create_matrix are stored in such an
+    # array, so pivots on them update the rows in place without copying; release_matrix hands the array to a
+    # later create_matrix. Below the row threshold, with one worker or with non-float elements the serial
+    # Matrix methods are used instead. Call close(), or use the executor in a with block, to stop the
+    # workers and drop the arrays.
+    def __init__(self, workers=None, threshold=PARALLEL_THRESHOLD):
+        self.workers = workers or multiprocessing.cpu_count()
+        self.threshold = threshold
+        self.arrays = {}
+        self.free_names = []
+        self.pool = None
+        self.stale = False
+        self.call_count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        # Matrices from create_matrix keep their elements but are no longer shared with workers.
+        self.terminate_pool()
+        self.arrays = {}
+        self.free_names = []
+
+    def terminate_pool(self):
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool.join()
+            self.pool = None
+        self.stale = False
+
+    def use_parallel(self, row_count, *matrices):
+        return self.workers > 1 and row_count >= self.threshold and all(map(is_float_compatible, matrices))
+
+    def add_array(self, name, size):
+        self.arrays[name] = RawArray("d", size)
+        self.stale = self.pool is not None
+        return self.arrays[name]
+
+    def get_array(self, name, size):
+        array = self.arrays.get(name)
+        if array is None or len(array) < size:
+            array = self.add_array(name, max(size, 2*len(array) if array is not None else size))
+        return array
+
+    def get_pool(self):
+        if self.stale:
+            self.terminate_pool()
+        if self.pool is None:
+            self.pool = multiprocessing.Pool(self.workers, initializer=init_worker, initargs=(self.arrays,))
+        return self.pool
+
+    def create_matrix(self, elements):
+        # An ArrayMatrix whose buffer is shared with the workers.
+        row_count, col_count = len(elements), len(elements[0])
+        size = row_count*col_count
+        fitting = [name for name in self.free_names if len(self.arrays[name]) >= size]
+        if fitting:
+            name = min(fitting, key=lambda name: len(self.arrays[name]))
+            self.free_names.remove(name)
+            data = self.arrays[name]
+        else:
+            data = self.add_array("matrix%d" % len(self.arrays), size)
+        copy_rows(data, elements)
+        return ArrayMatrix((row_count, col_count), data)
+
+    def release_matrix(self, matrix):
+        # The array of a matrix from create_matrix is reused by a later create_matrix without forking the
+        # pool again, so matrix must not be used afterwards.
+        name = self.get_array_name(matrix)
+        assert name is not None and name.startswith("matrix") and name not in self.free_names, "not a matrix of this executor"
+        self.free_names.append(name)
+
+    def get_array_name(self, matrix):
+        # Name of the shared array that holds matrix as contiguous rows, or None.
+        if not isinstance(matrix, ArrayMatrix) or (matrix.offset, matrix.row_stride, matrix.col_stride) != (0, matrix.col_count, 1):
+            return None
+        return next((name for name, array in self.arrays.items() if array is matrix.data), None)
+
+    def multiply(self, a, b):
+        # Integer operands give integer results, like the serial product; when the doubles could round,
+        # the serial product is used.
+        assert a.col_count == b.row_count
+        integral = is_integral(a) and is_integral(b)
+        if not self.use_parallel(a.row_count, a, b) or (integral and get_max_element(a)*get_max_element(b)*a.col_count >= EXACT_FLOAT_LIMIT):
+            return a*b
+        m, n, p = a.row_count, a.col_count, b.col_count
+        copy_rows(self.get_array("a", m*n), a.elements)
+        copy_rows(self.get_array("b_cols", n*p), (b.get_col(j) for j in range(p)))
+        result = self.get_array("result", m*p)
+        self.call_count += 1
+        self.get_pool().map(multiply_rows, [(self.call_count, row_range, n, p) for row_range in get_row_ranges(m, self.workers*4)])
+        convert = int if integral else float
+        return wrap_elements([list(map(convert, result[i*p:(i+1)*p])) for i in range(m)])
+
+    def make_elements_zero_using_row(self, matrix, row_index, col_index, rows_to_zero=None):
+        name = self.get_array_name(matrix)
+        if name is None or not self.use_parallel(matrix.row_count):
+            return matrix.make_elements_zero_using_row(row_index, col_index, rows_to_zero)
+        m, n = matrix.row_count, matrix.col_count
+        row_index %= m
+        if rows_to_zero is None:
+            rows_to_zero = [i for i in range(m) if i != row_index]
+        rows_to_zero = sorted(set(i % m for i in rows_to_zero))
+        other_rows = [i for i in rows_to_zero if i != row_index]
+        tasks = [(name, row_index, col_index, other_rows[start:end], n) for start, end in get_row_ranges(len(other_rows), self.workers*4)]
+        self.get_pool().map(zero_rows, tasks)
+        if row_index in rows_to_zero:
+            pivot_row = matrix.data[row_index*n:(row_index+1)*n]
+            multiplier = pivot_row[col_index]
+            matrix.set_row(row_index, [x - multiplier*x for x in pivot_row])
+        matrix.invalidate_decomposition()
+
+    def row_echelon_form(self, matrix):
+        # Same steps as Matrix.row_echelon_form. Pivot selection and scaling run in the parent; the
+        # row updates below the pivot are split into row ranges.
+        if not self.use_parallel(matrix.row_count, matrix):
+            return matrix.row_echelon_form()
+        m, n = matrix.row_count, matrix.col_count
+        data = self.get_array("data", m*n)
+        copy_rows(data, matrix.elements)
+        pool = self.get_pool()
+        rank = 0
+        for col in range(n):
+            if rank == m:
+                break
+            pivot_index = next((i for i in range(rank, m) if data[i*n+col] != 0), None)
+            if pivot_index is None:
+                continue
+            pivot_row = data[rank*n:(rank+1)*n]
+            if pivot_index != rank:
+                pivot_row = list(map(operator.add, pivot_row, data[pivot_index*n:(pivot_index+1)*n]))
+            factor = float(pivot_row[col])
+            data[rank*n:(rank+1)*n] = [x/factor for x in pivot_row]
+            pool.map(zero_rows, [("data", rank, col, range(rank+1+start, rank+1+end), n) for start, end in get_row_ranges(m-rank-1, self.workers)])
+            rank += 1
+        return Matrix([data[i*n:(i+1)*n] for i in range(m)])
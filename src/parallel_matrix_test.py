@@ -0,0 +1,95 @@
+import array_matrix
+import matrix
+import parallel_matrix
+import random
+import unittest
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        generator = random.Random(1)
+        self.a = matrix.Matrix([[generator.randint(-5, 5) for _ in range(7)] for _ in range(9)])
+        self.b = matrix.Matrix([[generator.randint(-5, 5) for _ in range(4)] for _ in range(7)])
+        self.executor = parallel_matrix.ParallelExecutor(workers=2, threshold=0)
+
+    def tearDown(self):
+        self.executor.close()
+
+    def assertMatrixAlmostEqual(self, matrix1, matrix2):
+        self.assertEqual((matrix1.row_count, matrix1.col_count), (matrix2.row_count, matrix2.col_count))
+        for row1, row2 in zip(matrix1.elements, matrix2.elements):
+            for element1, element2 in zip(row1, row2):
+                self.assertAlmostEqual(element1, element2)
+
+    def test_multiply(self):
+        product = self.executor.multiply(self.a, self.b)
+        self.assertEqual(product, self.a*self.b)
+        self.assertTrue(all(isinstance(element, int) for row in product.elements for element in row))
+        pool = self.executor.pool
+        floats = self.b.scalar_muliplication(0.5)
+        self.assertMatrixAlmostEqual(self.executor.multiply(self.a, floats), self.a*floats)
+        self.assertIs(self.executor.pool, pool)
+        large = matrix.Matrix([[2**40, 1], [1, 1]])
+        self.assertEqual(self.executor.multiply(large, large), large*large)
+
+    def test_make_elements_zero_using_row(self):
+        expected = matrix.Matrix(self.a.elements)
+        expected.make_elements_zero_using_row(2, 1)
+        shared = self.executor.create_matrix(self.a.elements)
+        self.assertIsInstance(shared, array_matrix.ArrayMatrix)
+        data = shared.data
+        self.executor.make_elements_zero_using_row(shared, 2, 1)
+        pool = self.executor.pool
+        self.assertMatrixAlmostEqual(shared, expected)
+        expected.make_elements_zero_using_row(-1, 3, [0, 4, 8])
+        self.executor.make_elements_zero_using_row(shared, -1, 3, [0, 4, 8])
+        self.assertMatrixAlmostEqual(shared, expected)
+        self.assertIs(shared.data, data)
+        self.assertIs(self.executor.pool, pool)
+
+    def test_create_and_release_matrix(self):
+        self.executor.multiply(self.a, self.b)
+        pool = self.executor.pool
+        first = self.executor.create_matrix(self.a.elements)
+        second = self.executor.create_matrix(self.b.elements)
+        self.assertIs(self.executor.pool, pool)
+        self.executor.make_elements_zero_using_row(first, 0, 0)
+        self.executor.make_elements_zero_using_row(second, 0, 0)
+        pool = self.executor.pool
+        data = first.data
+        self.executor.release_matrix(first)
+        self.assertRaises(AssertionError, self.executor.release_matrix, first)
+        third = self.executor.create_matrix(self.b.elements)
+        self.assertIs(third.data, data)
+        self.assertMatrixAlmostEqual(third, self.b)
+        expected = matrix.Matrix(self.b.elements)
+        expected.make_elements_zero_using_row(1, 2)
+        self.executor.make_elements_zero_using_row(third, 1, 2)
+        self.assertMatrixAlmostEqual(third, expected)
+        self.assertIs(self.executor.pool, pool)
+        self.executor.close()
+        self.assertIsNone(self.executor.pool)
+        self.assertIsNone(self.executor.get_array_name(third))
+
+    def test_make_elements_zero_serial(self):
+        expected = matrix.Matrix(self.a.elements)
+        expected.make_elements_zero_using_row(2, 1)
+        self.executor.make_elements_zero_using_row(self.a, 2, 1)
+        self.assertEqual(self.a, expected)
+        self.assertIsNone(self.executor.pool)
+
+    def test_row_echelon_form(self):
+        self.assertMatrixAlmostEqual(self.executor.row_echelon_form(self.a), self.a.row_echelon_form())
+        singular = matrix.Matrix([[0,0,0,0,2,6],[0,4,0,4,0,0],[0,0,0,1,11,5],[0,0,0,3,12,9]])
+        self.assertMatrixAlmostEqual(self.executor.row_echelon_form(singular), singular.row_echelon_form())
+
+    def test_serial_fallback(self):
+        with parallel_matrix.ParallelExecutor(workers=2) as executor:
+            self.assertFalse(executor.use_parallel(self.a.row_count, self.a))
+            self.assertFalse(self.executor.use_parallel(1, matrix.Matrix([[1, 0.5j]])))
+            self.assertEqual(executor.multiply(self.a, self.b), self.a*self.b)
+            self.assertIsNone(executor.pool)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,188 @@
+STALL_LIMIT = 50
+DEGENERACY_TOLERANCE = 1e-12
+HARRIS_TOLERANCE = 1e-9
+
+
+# Entering rules get the reduced costs of all variables (positive ones improve the objective, basic
+# variables have zero) and get_column(j), which returns the column of variable j in the current tableau.
+# update is called before each pivot; get_column_products(vector), when the solver gives it, returns the
+# dot product of every tableau column with vector.
+
+class PivotRule(object):
+    # Rules that only change the weights or the ratio test inherit Dantzig's choice of the largest
+    # reduced cost.
+    def reset(self, variable_count):
+        pass
+
+    def choose_entering(self, reduced_costs, get_column, tolerance):
+        entering = None
+        largest = tolerance
+        for j, reduced_cost in enumerate(reduced_costs):
+            if reduced_cost > largest:
+                largest = reduced_cost
+                entering = j
+        return entering
+
+    def update(self, entering, leaving, pivot_column, row, get_pivot_row, get_column_products=None):
+        pass
+
+
+class FirstPositive(PivotRule):
+    # The first improving variable; with the Bland ratio test this is Bland's rule.
+    def choose_entering(self, reduced_costs, get_column, tolerance):
+        for j, reduced_cost in enumerate(reduced_costs):
+            if reduced_cost > tolerance:
+                return j
+        return None
+
+
+class Dantzig(PivotRule):
+    # The largest reduced cost, the choice of PivotRule.
+    pass
+
+
+class SteepestEdge(PivotRule):
+    # The largest reduced cost per unit length of the edge. The weights 1 + |column|^2 are computed from
+    # get_column the first time a variable is a candidate and then kept exact with the Goldfarb-Reid
+    # update, which needs the pivot row and the products of all columns with the pivot column. Without
+    # get_column_products the weights are dropped and computed again.
+    def reset(self, variable_count):
+        self.weights = [None]*variable_count
+
+    def choose_entering(self, reduced_costs, get_column, tolerance):
+        entering = None
+        best = 0.0
+        for j, reduced_cost in enumerate(reduced_costs):
+            if reduced_cost > tolerance:
+                if self.weights[j] is None:
+                    self.weights[j] = 1 + sum(element*element for element in get_column(j))
+                score = reduced_cost*reduced_cost/self.weights[j]
+                if score > best:
+                    best = score
+                    entering = j
+        return entering
+
+    def update(self, entering, leaving, pivot_column, row, get_pivot_row, get_column_products=None):
+        if get_column_products is None:
+            self.reset(len(self.weights))
+            return
+        pivot_row = get_pivot_row()
+        products = get_column_products(pivot_column)
+        pivot = float(pivot_row[entering])
+        entering_weight = 1 + sum(element*element for element in pivot_column)
+        for j, element in enumerate(pivot_row):
+            if j != entering and j != leaving and element != 0 and self.weights[j] is not None:
+                ratio = element/pivot
+                self.weights[j] = max(self.weights[j] - 2*ratio*products[j] + ratio*ratio*entering_weight, 1 + ratio*ratio)
+        if leaving is not None:
+            self.weights[leaving] = max(entering_weight/pivot**2, 1.0)
+        self.weights[entering] = None
+
+
+class Devex(PivotRule):
+    # Steepest edge with reference weights that are only updated from the pivot row.
+    def reset(self, variable_count):
+        self.weights = [1.0]*variable_count
+
+    def choose_entering(self, reduced_costs, get_column, tolerance):
+        entering = None
+        best = 0.0
+        for j, reduced_cost in enumerate(reduced_costs):
+            if reduced_cost > tolerance:
+                score = reduced_cost*reduced_cost/self.weights[j]
+                if score > best:
+                    best = score
+                    entering = j
+        return entering
+
+    def update(self, entering, leaving, pivot_column, row, get_pivot_row, get_column_products=None):
+        pivot_row = get_pivot_row()
+        pivot = float(pivot_row[entering])
+        entering_weight = self.weights[entering]
+        for j, element in enumerate(pivot_row):
+            if j != entering and element != 0:
+                self.weights[j] = max(self.weights[j], (element/pivot)**2*entering_weight)
+        if leaving is not None:
+            self.weights[leaving] = max(entering_weight/pivot**2, 1.0)
+        self.weights[entering] = 1.0
+
+
+# Ratio tests get the entering column and the basic values without the objective rows, and the basis
+# header (the basic variable of each row) when the solver keeps one. They return a row or None. Basic
+# values that rounding made slightly negative count as zero, so the step is never negative.
+
+def first_smallest_ratio(column, values, tolerance, basis=None):
+    minimum_ratio = float("inf")
+    row = None
+    for i, (element, value) in enumerate(zip(column, values)):
+        if element > tolerance:
+            ratio = max(value, 0.0)/float(element)
+            if ratio < minimum_ratio:
+                minimum_ratio = ratio
+                row = i
+    return row
+
+
+def bland_ratio(column, values, tolerance, basis=None):
+    # Ties are broken by the smallest basic variable, which together with FirstPositive cannot cycle.
+    rows = [(max(value, 0.0)/float(element), basis[i] if basis is not None else i, i) for i, (element, value) in enumerate(zip(column, values)) if element > tolerance]
+    if not rows:
+        return None
+    return min(rows)[2]
+
+
+def harris_ratio(column, values, tolerance, basis=None, feasibility_tolerance=HARRIS_TOLERANCE):
+    # Two passes: the smallest ratio with every basic value relaxed by feasibility_tolerance, then the row
+    # with the largest pivot among those within that bound, which avoids tiny, unstable pivots.
+    bound = float("inf")
+    for element, value in zip(column, values):
+        if element > tolerance:
+            bound = min(bound, (max(value, 0.0) + feasibility_tolerance)/float(element))
+    row = None
+    largest = 0.0
+    for i, (element, value) in enumerate(zip(column, values)):
+        if element > tolerance and max(value, 0.0)/float(element) <= bound and element > largest:
+            largest = element
+            row = i
+    return row
+
+
+class PivotSelector(object):
+    # Combines an entering rule and a ratio test. After stall_limit degenerate pivots in a row it switches to
+    # Bland's rule, which cannot cycle, and back to the configured rules after the next pivot that moves.
+    def __init__(self, rule=None, ratio_test=first_smallest_ratio, stall_limit=STALL_LIMIT, degeneracy_tolerance=DEGENERACY_TOLERANCE):
+        self.rule = rule or FirstPositive()
+        self.ratio_test = ratio_test
+        self.stall_limit = stall_limit
+        self.degeneracy_tolerance = degeneracy_tolerance
+        self.bland = FirstPositive()
+        self.reset(0)
+
+    def reset(self, variable_count):
+        self.variable_count = variable_count
+        self.rule.reset(variable_count)
+        self.degenerate_pivots = 0
+        self.use_bland = False
+
+    def choose_entering(self, reduced_costs, get_column, tolerance):
+        rule = self.bland if self.use_bland else self.rule
+        return rule.choose_entering(reduced_costs, get_column, tolerance)
+
+    def choose_leaving(self, column, values, tolerance, basis=None):
+        ratio_test = bland_ratio if self.use_bland else self.ratio_test
+        return ratio_test(column, values, tolerance, basis)
+
+    def record_pivot(self, step, entering, leaving, pivot_column, row, get_pivot_row, get_column_products=None):
+        # Called before the pivot is applied, with the length of the step along the entering column. The
+        # weights of the configured rule are reset after pivots chosen by Bland's rule, which they missed.
+        if not self.use_bland:
+            self.rule.update(entering, leaving, pivot_column, row, get_pivot_row, get_column_products)
+        else:
+            self.rule.reset(self.variable_count)
+        if abs(step) <= self.degeneracy_tolerance:
+            self.degenerate_pivots += 1
+            if self.degenerate_pivots >= self.stall_limit:
+                self.use_bland = True
+        else:
+            self.degenerate_pivots = 0
+            self.use_bland = False
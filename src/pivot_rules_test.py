@@ -0,0 +1,101 @@
+import linear_programming
+import matrix
+import pivot_rules
+import random
+import revised_simplex
+import unittest
+
+
+class CheckedSteepestEdge(pivot_rules.SteepestEdge):
+    # Compares the updated weights with the exact ones before every choice.
+    def choose_entering(self, reduced_costs, get_column, tolerance):
+        for j, weight in enumerate(self.weights):
+            if weight is not None:
+                self.checks.append((weight, 1 + sum(element*element for element in get_column(j))))
+        return pivot_rules.SteepestEdge.choose_entering(self, reduced_costs, get_column, tolerance)
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.A = matrix.Matrix([
+            [1, 1, 3],
+            [2, 2, 5],
+            [4, 1, 2]
+        ])
+        self.b = [30, 24, 36]
+        self.c = [3, 1, 2]
+
+    def test_entering_rules(self):
+        reduced_costs = [0, 1, 4, 3]
+        columns = {1: [1, 0], 2: [10, 10], 3: [1, 1]}
+        self.assertEqual(pivot_rules.FirstPositive().choose_entering(reduced_costs, columns.get, 0), 1)
+        self.assertEqual(pivot_rules.Dantzig().choose_entering(reduced_costs, columns.get, 0), 2)
+        steepest_edge = pivot_rules.SteepestEdge()
+        steepest_edge.reset(4)
+        self.assertEqual(steepest_edge.choose_entering(reduced_costs, columns.get, 0), 3)
+        self.assertEqual(steepest_edge.weights, [None, 2, 201, 3])
+        self.assertIsNone(pivot_rules.Dantzig().choose_entering([0, -1], columns.get, 0))
+        self.assertEqual(pivot_rules.PivotRule().choose_entering(reduced_costs, columns.get, 0), 2)
+        devex = pivot_rules.Devex()
+        devex.reset(4)
+        self.assertEqual(devex.choose_entering(reduced_costs, columns.get, 0), 2)
+        devex.update(2, 0, columns[2], 0, lambda: [1, 0, 0.5, 2])
+        self.assertEqual(devex.weights, [4.0, 1.0, 1.0, 16.0])
+        self.assertEqual(devex.choose_entering(reduced_costs, columns.get, 0), 2)
+
+    def test_steepest_edge_weights(self):
+        generator = random.Random(3)
+        A = matrix.Matrix([[generator.randint(-2, 9) for _ in range(8)] for _ in range(6)])
+        b = [generator.randint(5, 40) for _ in range(6)]
+        c = [generator.randint(1, 9) for _ in range(8)]
+        expected = revised_simplex.RevisedSimplex(c, A, b).run().value
+        for solve in (lambda selector: linear_programming.LinearProgramming(c, A, b, selector).run(),
+                      lambda selector: revised_simplex.RevisedSimplex(c, A, b, pivot_selector=selector).run()):
+            rule = CheckedSteepestEdge()
+            rule.checks = []
+            self.assertAlmostEqual(solve(pivot_rules.PivotSelector(rule)).value, expected)
+            self.assertGreater(len(rule.checks), 0)
+            for weight, exact in rule.checks:
+                self.assertAlmostEqual(weight, exact)
+
+    def test_ratio_tests(self):
+        column = [1, 2, 1e-3, -1]
+        values = [2, 4, 0.002, 5]
+        self.assertEqual(pivot_rules.first_smallest_ratio(column, values, 0), 0)
+        self.assertEqual(pivot_rules.bland_ratio(column, values, 0, [7, 3, 9, 1]), 1)
+        self.assertEqual(pivot_rules.harris_ratio(column, values, 0), 1)
+        self.assertIsNone(pivot_rules.harris_ratio([-1, 0], [1, 1], 0))
+
+    def test_negative_values_clamped(self):
+        column = [1, 2]
+        values = [-1e-12, -1e-9]
+        self.assertEqual(pivot_rules.first_smallest_ratio(column, values, 0), 0)
+        self.assertEqual(pivot_rules.bland_ratio(column, values, 0, [2, 5]), 0)
+        self.assertEqual(pivot_rules.harris_ratio(column, [-1e-3, 0], 0), 1)
+
+    def test_stall_fallback(self):
+        selector = pivot_rules.PivotSelector(pivot_rules.Dantzig(), stall_limit=2)
+        selector.record_pivot(0, 1, None, [1], 0, lambda: [0, 1])
+        self.assertFalse(selector.use_bland)
+        selector.record_pivot(0, 1, None, [1], 0, lambda: [0, 1])
+        self.assertTrue(selector.use_bland)
+        self.assertEqual(selector.choose_entering([0, 1, 4], None, 0), 1)
+        selector.record_pivot(0.5, 1, None, [1], 0, lambda: [0, 1])
+        self.assertFalse(selector.use_bland)
+
+    def test_solvers(self):
+        selectors = [
+            pivot_rules.PivotSelector(),
+            pivot_rules.PivotSelector(pivot_rules.Dantzig(), pivot_rules.harris_ratio),
+            pivot_rules.PivotSelector(pivot_rules.Devex()),
+            pivot_rules.PivotSelector(pivot_rules.SteepestEdge(), stall_limit=1),
+        ]
+        for selector in selectors:
+            result = linear_programming.LinearProgramming(self.c, self.A, self.b, selector).run()
+            self.assertAlmostEqual(result.value, 28)
+            result = revised_simplex.RevisedSimplex(self.c, self.A, self.b, pivot_selector=selector).run()
+            self.assertAlmostEqual(result.value, 28)
+
+
+if __name__ == '__main__':
+    unittest.main()
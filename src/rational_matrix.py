@@ -0,0 +1,85 @@
+from fractions import Fraction
+
+from matrix import Matrix, get_unit_matrix, bareiss_eliminate
+
+
+def gcd(a, b):
+    while b:
+        a, b = b, a % b
+    return abs(a)
+
+
+def get_row_denominator(row):
+    denominator = 1
+    for element in row:
+        element_denominator = Fraction(element).denominator
+        denominator = denominator*element_denominator // gcd(denominator, element_denominator)
+    return denominator
+
+
+def to_integer_row(row):
+    # Scaling a row by the lcm of its denominators leaves the echelon structure, rank and solution set unchanged.
+    denominator = get_row_denominator(row)
+    return [(Fraction(element)*denominator).numerator for element in row]
+
+
+class RationalMatrix(Matrix):
+    # Exact arithmetic mode for integer and Fraction elements. Determinant, row echelon form, rank and
+    # solve run Bareiss elimination on integers and only form Fractions when the answer needs them.
+    def get_integer_rows(self):
+        return [to_integer_row(row) for row in self.elements]
+
+    def determinant(self):
+        assert self.row_count == self.col_count
+        denominator = 1
+        for row in self.elements:
+            denominator *= get_row_denominator(row)
+        rows = self.get_integer_rows()
+        rank, pivot_cols, sign = bareiss_eliminate(rows)
+        if rank < self.row_count:
+            return 0
+        result = Fraction(sign*rows[-1][-1], denominator)
+        return result.numerator if result.denominator == 1 else result
+
+    def is_singular(self):
+        return self.rank() < self.row_count
+
+    def rank(self):
+        return bareiss_eliminate(self.get_integer_rows())[0]
+
+    def row_echelon_form(self):
+        rows = self.get_integer_rows()
+        rank, pivot_cols, sign = bareiss_eliminate(rows)
+        for i, col in enumerate(pivot_cols):
+            pivot = rows[i][col]
+            rows[i] = [Fraction(element, pivot) for element in rows[i]]
+        return RationalMatrix(rows)
+
+    def get_scaled_row(self, factor, row_index):
+        return [Fraction(element)/factor for element in self.get_row(row_index)]
+
+    def solve_cols(self, cols):
+        cols = [list(col) for col in cols]
+        assert all(len(col) == self.row_count for col in cols)
+        rows = [to_integer_row(row + [col[i] for col in cols]) for i, row in enumerate(self.elements)]
+        rank, pivot_cols, sign = bareiss_eliminate(rows)
+        assert pivot_cols == list(range(self.col_count))
+        solution = [[None]*len(cols) for _ in range(self.col_count)]
+        for k in range(len(cols)):
+            for i in range(self.col_count-1, -1, -1):
+                row = rows[i]
+                total = row[self.col_count+k] - sum(row[j]*solution[j][k] for j in range(i+1, self.col_count))
+                solution[i][k] = Fraction(total)/row[i]
+        return solution
+
+    def solve(self, b):
+        assert self.row_count == self.col_count
+        if isinstance(b, Matrix):
+            assert b.row_count == self.row_count
+            return RationalMatrix(self.solve_cols(b.get_col(j) for j in range(b.col_count)))
+        else:
+            return [row[0] for row in self.solve_cols([b])]
+
+    def inverse(self):
+        assert not self.is_singular()
+        return self.solve(get_unit_matrix(self.row_count))
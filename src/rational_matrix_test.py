@@ -0,0 +1,72 @@
+from fractions import Fraction
+import matrix
+import rational_matrix
+import unittest
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.elements1 = [
+            [4,2,6],
+            [1,11,5],
+            [3,12,9]
+        ]
+        self.elements2 = [
+            [0,0,0,0,2,6],
+            [0,4,0,4,0,0],
+            [0,0,0,1,11,5],
+            [0,0,0,3,12,9]
+        ]
+        self.matrix1 = rational_matrix.RationalMatrix(self.elements1)
+        self.matrix2 = rational_matrix.RationalMatrix(self.elements2)
+
+    def test_bareiss_eliminate(self):
+        rows = [row[:] for row in self.elements1]
+        rank, pivot_cols, sign = rational_matrix.bareiss_eliminate(rows)
+        self.assertEqual((rank, pivot_cols, sign), (3, [0,1,2], 1))
+        self.assertEqual(rows[-1][-1], 42)
+
+    def test_determinant(self):
+        self.assertEqual(self.matrix1.determinant(), 42)
+        self.assertEqual(rational_matrix.RationalMatrix([[0,1],[1,0]]).determinant(), -1)
+        self.assertEqual(rational_matrix.RationalMatrix([[1,2,3],[4,5,6],[7,8,9]]).determinant(), 0)
+        self.assertEqual(rational_matrix.RationalMatrix([[Fraction(1,2),1],[Fraction(1,3),1]]).determinant(), Fraction(1,6))
+
+    def test_determinant_large_integers(self):
+        vandermonde = [[x**j for j in range(10)] for x in range(1, 11)]
+        expected = 1
+        for i in range(1, 11):
+            for j in range(i+1, 11):
+                expected *= j - i
+        self.assertEqual(rational_matrix.RationalMatrix(vandermonde).determinant(), expected)
+        self.assertEqual(rational_matrix.RationalMatrix([[10**30, 1],[1, 10**30]]).determinant(), 10**60 - 1)
+
+    def test_rank(self):
+        self.assertEqual(self.matrix1.rank(), 3)
+        self.assertEqual(self.matrix2.rank(), 4)
+        self.assertEqual(rational_matrix.RationalMatrix([[1,2],[2,4],[3,6]]).rank(), 1)
+        self.assertTrue(rational_matrix.RationalMatrix([[1,2],[2,4]]).is_singular())
+        self.assertEqual(matrix.Matrix(self.elements1).rank(), 3)
+
+    def test_row_echelon_form(self):
+        echelon = self.matrix2.row_echelon_form()
+        for i, col in enumerate([1,3,4,5]):
+            self.assertEqual(echelon.elements[i][col], 1)
+            self.assertTrue(echelon.all_elements_zero_in_col(col, i+1))
+            self.assertTrue(echelon.all_elements_zero_in_row(i, 0) is False)
+            self.assertEqual(echelon.elements[i][:col], [0]*col)
+
+    def test_solve(self):
+        x = self.matrix1.solve([10, 28, 45])
+        for i in range(3):
+            self.assertEqual(sum(a*y for a, y in zip(self.elements1[i], x)), [10, 28, 45][i])
+        self.assertTrue(all(isinstance(y, Fraction) for y in x))
+
+    def test_inverse(self):
+        inverse = self.matrix1.inverse()
+        self.assertEqual(inverse.elements[0][0], Fraction(39, 42))
+        self.assertEqual(matrix.Matrix(self.elements1)*inverse, matrix.get_unit_matrix(3))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,256 @@
+from matrix import LUDecomposition
+from sparse_matrix import SparseMatrix, to_sparse
+from linear_programming_result import LinearProgrammingResult
+from pivot_rules import PivotSelector
+
+
+TOLERANCE = 1e-9
+REFACTOR_INTERVAL = 32
+
+
+def to_dense(indices, values, size):
+    vector = [0.0]*size
+    for i, value in zip(indices, values):
+        vector[i] = value
+    return vector
+
+
+def sparse_dot(vector, indices, values):
+    return sum(vector[i]*value for i, value in zip(indices, values))
+
+
+class BasisFactorisation(object):
+    # B^-1 in product form: the LU factors of the basis at the last refactorisation followed by one eta
+    # column per pivot since then. refactor() starts again from the current basis columns.
+    def __init__(self, size):
+        self.size = size
+        self.lu = None
+        self.etas = []
+
+    def refactor(self, columns):
+        elements = [[0.0]*self.size for _ in range(self.size)]
+        for k, (indices, values) in enumerate(columns):
+            for i, value in zip(indices, values):
+                elements[i][k] = value
+        self.lu = LUDecomposition(elements)
+        assert not self.lu.is_singular()
+        self.etas = []
+
+    def ftran(self, vector):
+        # B^-1 vector
+        x = self.lu.solve_vector(vector)
+        for row, eta in self.etas:
+            pivot_value = x[row]/eta[row]
+            if pivot_value != 0:
+                for i, value in eta.items():
+                    x[i] -= value*pivot_value
+            x[row] = pivot_value
+        return x
+
+    def btran(self, vector):
+        # vector^T B^-1
+        y = list(vector)
+        for row, eta in reversed(self.etas):
+            y[row] = (y[row] - sum(y[i]*value for i, value in eta.items() if i != row))/eta[row]
+        return self.lu.solve_transposed_vector(y)
+
+    def update(self, row, column):
+        self.etas.append((row, dict((i, value) for i, value in enumerate(column) if value != 0)))
+
+
+class RevisedSimplex(object):
+    # Two phase simplex for max c^T x, A x <= b, x >= 0 that keeps only the basis header, the basic values
+    # and a factorised basis. Reduced costs are priced from the columns of A when they are needed, so an
+    # iteration costs two solves with the basis and one pass over the non-zeros of A.
+    # Variables are numbered: structural 0..n-1, slacks n..n+m-1, then one artificial per row with b_i < 0.
+    def __init__(self, c, A, b, tolerance=TOLERANCE, refactor_interval=REFACTOR_INTERVAL, pivot_selector=None):
+        assert A.row_count == len(b)
+        assert A.col_count == len(c)
+        A = A if isinstance(A, SparseMatrix) else to_sparse(A)
+        self.row_count = A.row_count
+        self.col_count = A.col_count
+        self.c = c
+        self.b = [float(element) for element in b]
+        self.tolerance = tolerance
+        self.refactor_interval = refactor_interval
+        self.columns = [A.get_sparse_col(j) for j in range(self.col_count)]
+        self.artificial_rows = [i for i, element in enumerate(self.b) if element < 0]
+        self.variable_count = self.col_count + self.row_count + len(self.artificial_rows)
+        self.basis = [self.col_count + i for i in range(self.row_count)]
+        for k, i in enumerate(self.artificial_rows):
+            self.basis[i] = self.col_count + self.row_count + k
+        self.factorisation = BasisFactorisation(self.row_count)
+        self.x_basic = None
+        self.iterations = 0
+        self.pivot_selector = pivot_selector or PivotSelector()
+        self.pivot_selector.reset(self.variable_count)
+        self.refactor()
+
+    def is_artificial(self, j):
+        return j >= self.col_count + self.row_count
+
+    def get_column(self, j):
+        if j < self.col_count:
+            return self.columns[j]
+        elif j < self.col_count + self.row_count:
+            return [j - self.col_count], [1.0]
+        else:
+            return [self.artificial_rows[j - self.col_count - self.row_count]], [-1.0]
+
+    def get_phase_one_cost(self, j):
+        return -1.0 if self.is_artificial(j) else 0.0
+
+    def get_phase_two_cost(self, j):
+        return float(self.c[j]) if j < self.col_count else 0.0
+
+    def refactor(self):
+        self.factorisation.refactor([self.get_column(j) for j in self.basis])
+        self.x_basic = self.factorisation.ftran(self.b)
+
+    def ftran_column(self, j):
+        return self.factorisation.ftran(to_dense(self.get_column(j)[0], self.get_column(j)[1], self.row_count))
+
+    def get_reduced_cost(self, y, cost, j):
+        indices, values = self.get_column(j)
+        return cost(j) - sparse_dot(y, indices, values)
+
+    def get_pivot_row(self, row):
+        # Row of B^-1 A for every variable.
+        unit = [0.0]*self.row_count
+        unit[row] = 1.0
+        row_inverse = self.factorisation.btran(unit)
+        return [sparse_dot(row_inverse, *self.get_column(j)) for j in range(self.variable_count)]
+
+    def get_column_products(self, vector):
+        # vector^T B^-1 A: the dot product of vector with every column of the tableau.
+        y = self.factorisation.btran(vector)
+        return [sparse_dot(y, *self.get_column(j)) for j in range(self.variable_count)]
+
+    def choose_entering(self, cost, allow_artificial):
+        y = self.factorisation.btran([cost(j) for j in self.basis])
+        basic = set(self.basis)
+        reduced_costs = [0.0]*self.variable_count
+        for j in range(self.variable_count):
+            if j not in basic and (allow_artificial or not self.is_artificial(j)):
+                reduced_costs[j] = self.get_reduced_cost(y, cost, j)
+        return self.pivot_selector.choose_entering(reduced_costs, self.ftran_column, self.tolerance)
+
+    def choose_leaving(self, column):
+        return self.pivot_selector.choose_leaving(column, self.x_basic, self.tolerance, self.basis)
+
+    def pivot(self, row, entering, column):
+        step = self.x_basic[row]/column[row]
+        self.pivot_selector.record_pivot(step, entering, self.basis[row], column, row, lambda: self.get_pivot_row(row), self.get_column_products)
+        self.x_basic = [value - step*element for value, element in zip(self.x_basic, column)]
+        self.x_basic[row] = step
+        self.basis[row] = entering
+        self.factorisation.update(row, column)
+        self.iterations += 1
+        if len(self.factorisation.etas) >= self.refactor_interval:
+            self.refactor()
+
+    def primal(self, cost, allow_artificial):
+        # Returns False when the objective is unbounded.
+        while True:
+            entering = self.choose_entering(cost, allow_artificial)
+            if entering is None:
+                return True
+            column = self.ftran_column(entering)
+            row = self.choose_leaving(column)
+            if row is None:
+                return False
+            self.pivot(row, entering, column)
+
+    def dual(self, cost):
+        # Dual simplex from a basis whose reduced costs are all non-positive. The most negative basic value
+        # leaves; the entering variable keeps the reduced costs non-positive. Returns False when the row of
+        # the leaving variable has no negative element, which proves the problem infeasible.
+        while True:
+            row = None
+            smallest = -self.tolerance
+            for i, value in enumerate(self.x_basic):
+                if value < smallest:
+                    smallest = value
+                    row = i
+            if row is None:
+                return True
+            pivot_row = self.get_pivot_row(row)
+            y = self.factorisation.btran([cost(j) for j in self.basis])
+            basic = set(self.basis)
+            entering = None
+            minimum_ratio = float("inf")
+            for j, element in enumerate(pivot_row):
+                if element < -self.tolerance and j not in basic and not self.is_artificial(j):
+                    ratio = min(self.get_reduced_cost(y, cost, j), 0.0)/element
+                    if ratio < minimum_ratio:
+                        minimum_ratio = ratio
+                        entering = j
+            if entering is None:
+                return False
+            self.pivot(row, entering, self.ftran_column(entering))
+
+    def drop_artificials(self):
+        # Once phase one is over the artificials are never used again; dropping them lets slacks be appended.
+        assert not any(self.is_artificial(j) for j in self.basis)
+        self.artificial_rows = []
+        self.variable_count = self.col_count + self.row_count
+        self.pivot_selector.reset(self.variable_count)
+
+    def set_b(self, b):
+        assert len(b) == self.row_count and not self.artificial_rows
+        self.b = [float(element) for element in b]
+        self.x_basic = self.factorisation.ftran(self.b)
+
+    def add_row(self, indices, values, bound):
+        # Appends the constraint sum(values[k]*x[indices[k]]) <= bound with its slack in the basis, so the
+        # reduced costs do not change and the new basis stays dual feasible.
+        assert not self.artificial_rows
+        for j, value in zip(indices, values):
+            col_indices, col_values = self.columns[j]
+            self.columns[j] = list(col_indices) + [self.row_count], list(col_values) + [value]
+        self.b.append(float(bound))
+        self.basis.append(self.col_count + self.row_count)
+        self.row_count += 1
+        self.variable_count += 1
+        self.factorisation = BasisFactorisation(self.row_count)
+        self.pivot_selector.reset(self.variable_count)
+        self.refactor()
+
+    def remove_artificials(self):
+        # Artificials left in the basis after phase one are at zero; they are pivoted out against any
+        # non-artificial column with a non-zero element in their row. A row without one is redundant.
+        for row, j in enumerate(self.basis):
+            if not self.is_artificial(j):
+                continue
+            unit = [0.0]*self.row_count
+            unit[row] = 1.0
+            row_inverse = self.factorisation.btran(unit)
+            basic = set(self.basis)
+            for k in range(self.col_count + self.row_count):
+                if k not in basic and abs(sparse_dot(row_inverse, *self.get_column(k))) > self.tolerance:
+                    self.pivot(row, k, self.ftran_column(k))
+                    break
+
+    def get_x_values(self):
+        x_values = [0]*self.col_count
+        for j, value in zip(self.basis, self.x_basic):
+            if j < self.col_count:
+                x_values[j] = value
+        return x_values
+
+    def get_result(self, status="SUCCESSFUL"):
+        x_values = self.get_x_values()
+        result = LinearProgrammingResult(sum(c*x for c, x in zip(self.c, x_values)), x_values, self.c)
+        result.set_status(status)
+        return result
+
+    def run(self):
+        if self.artificial_rows:
+            self.primal(self.get_phase_one_cost, True)
+            infeasibility = sum(value for j, value in zip(self.basis, self.x_basic) if self.is_artificial(j))
+            if infeasibility > self.tolerance*max(1.0, max(map(abs, self.b))):
+                return self.get_result("UNFEASIBLE")
+            self.remove_artificials()
+        if not self.primal(self.get_phase_two_cost, False):
+            return self.get_result("UNBOUNDED")
+        return self.get_result()
@@ -0,0 +1,61 @@
+import linear_programming
+import matrix
+import revised_simplex
+import sparse_matrix
+import unittest
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.A = matrix.Matrix([
+            [2, -1],
+            [1, 2],
+            [-1, 2]
+        ])
+        self.b = [4, 9, 3]
+        self.c = [2, 5]
+
+    def test_success(self):
+        result = revised_simplex.RevisedSimplex(self.c, self.A, self.b).run()
+        self.assertEqual(result.status, "SUCCESSFUL")
+        self.assertAlmostEqual(result.value, 21)
+        for element, expected in zip(result.x_values, [3, 3]):
+            self.assertAlmostEqual(element, expected)
+
+    def test_sparse(self):
+        A = sparse_matrix.to_sparse(self.A)
+        result = revised_simplex.RevisedSimplex(self.c, A, self.b, refactor_interval=1).run()
+        self.assertAlmostEqual(result.value, 21)
+
+    def test_negative_b(self):
+        A = matrix.Matrix([
+            [-1,0,-1,0,0],
+            [-1,0,0,-1,0],
+            [-1,-1,0,0,-1],
+            [0,-1,0,0,0],
+            [0,-1,0,0,0]
+        ]).transposed()
+        lp = linear_programming.LinearProgramming([-1]*5, A, [-1]*5)
+        result = lp.run_revised()
+        self.assertEqual(result.status, "SUCCESSFUL")
+        self.assertAlmostEqual(result.value, -3)
+
+    def test_unbounded_and_unfeasible(self):
+        lp = linear_programming.LinearProgramming([2, 1], matrix.Matrix([[-1, 1], [1, -2]]), [1, 2])
+        self.assertEqual(lp.run_revised().status, "UNBOUNDED")
+        lp = linear_programming.LinearProgramming([-1, 2, -2], matrix.Matrix([[1, 1, 1], [-1, -1, 1]]), [-5, -5])
+        self.assertEqual(lp.run_revised().status, "UNFEASIBLE")
+
+    def test_factorisation(self):
+        factorisation = revised_simplex.BasisFactorisation(2)
+        factorisation.refactor([([0], [1.0]), ([1], [1.0])])
+        factorisation.update(0, [2.0, 1.0])
+        # The basis is now [[2, 0], [1, 1]].
+        for element, expected in zip(factorisation.ftran([4.0, 3.0]), [2, 1]):
+            self.assertAlmostEqual(element, expected)
+        for element, expected in zip(factorisation.btran([4.0, 3.0]), [0.5, 3]):
+            self.assertAlmostEqual(element, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,326 @@
+import bisect
+import operator
+
+from matrix import Matrix, IndexElementPair, wrap_elements
+
+
+def to_sparse(matrix):
+    builder = CooBuilder(matrix.row_count, matrix.col_count)
+    for i, row in enumerate(matrix.elements):
+        for j, element in enumerate(row):
+            builder.add(i, j, element)
+    return builder.to_csr()
+
+
+def from_rows(rows, col_count):
+    # rows is a list of {col_index: value} dicts.
+    values = []
+    col_indices = []
+    row_pointers = [0]
+    for row in rows:
+        for j in sorted(row):
+            if row[j] != 0:
+                col_indices.append(j)
+                values.append(row[j])
+        row_pointers.append(len(values))
+    return SparseMatrix(len(rows), col_count, values, col_indices, row_pointers)
+
+
+class CooBuilder(object):
+    # Collects (row, col, value) triplets in any order; duplicates are summed when converting to CSR.
+    def __init__(self, row_count, col_count):
+        assert row_count > 0 and col_count > 0
+        self.row_count = row_count
+        self.col_count = col_count
+        self.rows = []
+        self.cols = []
+        self.values = []
+
+    def add(self, i, j, value):
+        assert 0 <= i < self.row_count and 0 <= j < self.col_count
+        if value != 0:
+            self.rows.append(i)
+            self.cols.append(j)
+            self.values.append(value)
+
+    def to_csr(self):
+        rows = [{} for _ in range(self.row_count)]
+        for i, j, value in zip(self.rows, self.cols, self.values):
+            rows[i][j] = rows[i].get(j, 0) + value
+        return from_rows(rows, self.col_count)
+
+
+class SparseMatrix(Matrix):
+    # Compressed sparse row storage. Costs of arithmetic, transposition and elimination scale with
+    # the number of non-zero elements. elements, get_row and get_col return dense lists.
+    def __init__(self, row_count, col_count, values, col_indices, row_pointers):
+        assert row_count > 0 and col_count > 0
+        assert len(row_pointers) == row_count + 1
+        assert len(values) == len(col_indices) == row_pointers[-1]
+        self.row_count = row_count
+        self.col_count = col_count
+        self.values = list(values)
+        self.col_indices = list(col_indices)
+        self.row_pointers = list(row_pointers)
+        self.csc = None
+        self.lu_decomposition = None
+        self.eigen_decomposition = None
+
+    @property
+    def elements(self):
+        return [self.get_row(i) for i in range(self.row_count)]
+
+    def nonzero_count(self):
+        return len(self.values)
+
+    def normalise_index(self, i, count):
+        return i + count if i < 0 else i
+
+    def get_sparse_row(self, i):
+        i = self.normalise_index(i, self.row_count)
+        start, end = self.row_pointers[i], self.row_pointers[i+1]
+        return self.col_indices[start:end], self.values[start:end]
+
+    def get_sparse_col(self, j):
+        return self.get_csc().get_sparse_row(j)
+
+    def get_row_dict(self, i):
+        return dict(zip(*self.get_sparse_row(i)))
+
+    def get_row_dicts(self):
+        return [self.get_row_dict(i) for i in range(self.row_count)]
+
+    def get_row(self, i):
+        row = [0]*self.col_count
+        for j, value in zip(*self.get_sparse_row(i)):
+            row[j] = value
+        return row
+
+    def get_col(self, j):
+        return self.get_csc().get_row(j)
+
+    def get_element(self, i, j):
+        indices, values = self.get_sparse_row(i)
+        j = self.normalise_index(j, self.col_count)
+        position = bisect.bisect_left(indices, j)
+        if position < len(indices) and indices[position] == j:
+            return values[position]
+        return 0
+
+    def get_csc(self):
+        if self.csc is None:
+            self.csc = self.transposed()
+        return self.csc
+
+    def invalidate_decomposition(self):
+        self.csc = None
+        self.lu_decomposition = None
+        self.eigen_decomposition = None
+
+    def set_rows(self, rows, col_count):
+        new = from_rows(rows, col_count)
+        self.row_count = new.row_count
+        self.col_count = new.col_count
+        self.values = new.values
+        self.col_indices = new.col_indices
+        self.row_pointers = new.row_pointers
+        self.invalidate_decomposition()
+
+    def write_row(self, i, row):
+        self.set_row(i, row)
+
+    def set_row(self, i, elements):
+        assert len(elements) == self.col_count
+        i = self.normalise_index(i, self.row_count)
+        start, end = self.row_pointers[i], self.row_pointers[i+1]
+        new_indices = [j for j, element in enumerate(elements) if element != 0]
+        self.col_indices[start:end] = new_indices
+        self.values[start:end] = [element for element in elements if element != 0]
+        shift = len(new_indices) - (end - start)
+        for k in range(i+1, self.row_count+1):
+            self.row_pointers[k] += shift
+        self.invalidate_decomposition()
+
+    def set_col(self, j, elements):
+        assert len(elements) == self.row_count
+        j = self.normalise_index(j, self.col_count)
+        rows = self.get_row_dicts()
+        for row, element in zip(rows, elements):
+            row[j] = element
+        self.set_rows(rows, self.col_count)
+
+    def delete_row(self, i):
+        i = self.normalise_index(i, self.row_count)
+        start, end = self.row_pointers[i], self.row_pointers[i+1]
+        del self.col_indices[start:end]
+        del self.values[start:end]
+        del self.row_pointers[i+1]
+        for k in range(i+1, self.row_count):
+            self.row_pointers[k] -= end - start
+        self.row_count -= 1
+        self.invalidate_decomposition()
+
+    def delete_col(self, j):
+        j = self.normalise_index(j, self.col_count)
+        rows = [dict((k if k < j else k-1, value) for k, value in row.items() if k != j) for row in self.get_row_dicts()]
+        self.set_rows(rows, self.col_count-1)
+
+    def to_dense(self):
+        return wrap_elements(self.elements)
+
+    def transposed(self):
+        counts = [0]*(self.col_count+1)
+        for j in self.col_indices:
+            counts[j+1] += 1
+        for j in range(self.col_count):
+            counts[j+1] += counts[j]
+        row_pointers = list(counts)
+        values = [None]*len(self.values)
+        row_indices = [None]*len(self.values)
+        for i in range(self.row_count):
+            for k in range(self.row_pointers[i], self.row_pointers[i+1]):
+                position = counts[self.col_indices[k]]
+                values[position] = self.values[k]
+                row_indices[position] = i
+                counts[self.col_indices[k]] += 1
+        return SparseMatrix(self.col_count, self.row_count, values, row_indices, row_pointers)
+
+    def combine(self, other, op):
+        self.check_matrix_size(other)
+        if isinstance(other, SparseMatrix):
+            rows = self.get_row_dicts()
+            for i, row in enumerate(rows):
+                for j, value in zip(*other.get_sparse_row(i)):
+                    row[j] = op(row.get(j, 0), value)
+            return from_rows(rows, self.col_count)
+        else:
+            other_elements = other.elements
+            result = [[op(0, element) for element in row] for row in other_elements]
+            for i, row in enumerate(result):
+                for j, value in zip(*self.get_sparse_row(i)):
+                    row[j] = op(value, other_elements[i][j])
+            return wrap_elements(result)
+
+    def __add__(self, other):
+        return self.combine(other, operator.add)
+
+    def __radd__(self, other):
+        return self.combine(other, operator.add)
+
+    def __sub__(self, other):
+        return self.combine(other, operator.sub)
+
+    def __rsub__(self, other):
+        return self.combine(other, lambda a, b: b - a)
+
+    def scalar_muliplication(self, scalar, out=None):
+        if out is self:
+            return self.scale(scalar)
+        if out is not None:
+            return Matrix.scalar_muliplication(self, scalar, out)
+        result = SparseMatrix(self.row_count, self.col_count, [value*scalar for value in self.values], self.col_indices, self.row_pointers)
+        if scalar == 0:
+            return from_rows(result.get_row_dicts(), self.col_count)
+        return result
+
+    def scale(self, scalar):
+        # In place; scaling by zero drops every stored element.
+        if scalar == 0:
+            self.values = []
+            self.col_indices = []
+            self.row_pointers = [0]*(self.row_count + 1)
+        else:
+            values = self.values
+            for k in range(len(values)):
+                values[k] *= scalar
+        self.invalidate_decomposition()
+        return self
+
+    def __mul__(self, other):
+        assert self.col_count == other.row_count
+        if isinstance(other, SparseMatrix):
+            rows = []
+            for i in range(self.row_count):
+                row = {}
+                for k, a in zip(*self.get_sparse_row(i)):
+                    for j, b in zip(*other.get_sparse_row(k)):
+                        row[j] = row.get(j, 0) + a*b
+                rows.append(row)
+            return from_rows(rows, other.col_count)
+        else:
+            other_elements = other.elements
+            result = []
+            for i in range(self.row_count):
+                row = [0]*other.col_count
+                for k, a in zip(*self.get_sparse_row(i)):
+                    row = list(map(operator.add, row, [a*b for b in other_elements[k]]))
+                result.append(row)
+            return wrap_elements(result)
+
+    def __rmul__(self, other):
+        assert other.col_count == self.row_count
+        result = []
+        for other_row in other.elements:
+            row = [0]*self.col_count
+            for k, a in enumerate(other_row):
+                if a != 0:
+                    for j, b in zip(*self.get_sparse_row(k)):
+                        row[j] += a*b
+            result.append(row)
+        return wrap_elements(result)
+
+    def __eq__(self, other):
+        if isinstance(other, SparseMatrix):
+            return (self.row_count, self.col_count) == (other.row_count, other.col_count) and self.get_row_dicts() == other.get_row_dicts()
+        return Matrix.__eq__(self, other)
+
+    __hash__ = None
+
+    def get_first_non_zero_element_in_col(self, col, start_row=0):
+        row_indices, values = self.get_sparse_col(col)
+        position = bisect.bisect_left(row_indices, start_row)
+        if position < len(row_indices):
+            return IndexElementPair(row_indices[position], values[position])
+
+    def all_elements_zero_in_row(self, i, start_col=0):
+        indices, values = self.get_sparse_row(i)
+        return self.all_elements_zero(values[bisect.bisect_left(indices, start_col):])
+
+    def all_elements_zero_in_col(self, i, start_row=0):
+        return self.get_first_non_zero_element_in_col(i, start_row) is None
+
+    def row_echelon_form(self):
+        # Same steps as Matrix.row_echelon_form, but only rows with a non-zero element in the current
+        # column are touched, and each row operation costs the non-zeros of the rows involved.
+        rows = self.get_row_dicts()
+        col_rows = [set() for _ in range(self.col_count)]
+        for i, row in enumerate(rows):
+            for j in row:
+                col_rows[j].add(i)
+
+        def add_scaled_row(target, source, factor):
+            target_row = rows[target]
+            for j, value in rows[source].items():
+                new_value = target_row.get(j, 0) + factor*value
+                if new_value == 0:
+                    target_row.pop(j, None)
+                    col_rows[j].discard(target)
+                else:
+                    target_row[j] = new_value
+                    col_rows[j].add(target)
+
+        rank = 0
+        for col in range(self.col_count):
+            candidates = [i for i in col_rows[col] if i >= rank]
+            if not candidates:
+                continue
+            pivot_index = min(candidates)
+            if pivot_index != rank:
+                add_scaled_row(rank, pivot_index, 1)
+            factor = float(rows[rank][col])
+            rows[rank] = dict((j, value/factor) for j, value in rows[rank].items())
+            for i in sorted(col_rows[col]):
+                if i > rank:
+                    add_scaled_row(i, rank, -rows[i][col])
+            rank += 1
+        return from_rows(rows, self.col_count)
@@ -0,0 +1,105 @@
+import matrix
+import sparse_matrix
+import unittest
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.elements1 = [
+            [0,2,6],
+            [4,0,0],
+            [1,11,5],
+            [3,12,9]
+        ]
+        self.elements2 = [
+            [0,0,0,0,2,6],
+            [0,4,0,4,0,0],
+            [0,0,0,1,11,5],
+            [0,0,0,3,12,9]
+        ]
+        self.dense1 = matrix.Matrix(self.elements1)
+        self.dense2 = matrix.Matrix(self.elements2)
+        self.sparse1 = sparse_matrix.to_sparse(self.dense1)
+        self.sparse2 = sparse_matrix.to_sparse(self.dense2)
+
+    def assertMatrixAlmostEqual(self, matrix1, matrix2):
+        self.assertEqual((matrix1.row_count, matrix1.col_count), (matrix2.row_count, matrix2.col_count))
+        for row1, row2 in zip(matrix1.elements, matrix2.elements):
+            for element1, element2 in zip(row1, row2):
+                self.assertAlmostEqual(element1, element2)
+
+    def test_conversion(self):
+        self.assertEqual(self.sparse2.nonzero_count(), 10)
+        self.assertEqual(self.sparse2.to_dense(), self.dense2)
+        self.assertEqual(self.sparse2, self.dense2)
+        self.assertEqual(str(self.sparse2), str(self.dense2))
+
+    def test_coo_builder(self):
+        builder = sparse_matrix.CooBuilder(2, 3)
+        builder.add(1, 2, 5)
+        builder.add(0, 1, 1)
+        builder.add(1, 2, 2)
+        builder.add(0, 0, 0)
+        sparse = builder.to_csr()
+        self.assertEqual(sparse.elements, [[0,1,0],[0,0,7]])
+        self.assertEqual(sparse.nonzero_count(), 2)
+
+    def test_access(self):
+        self.assertEqual(self.sparse1.get_row(2), self.elements1[2])
+        self.assertEqual(self.sparse1.get_col(1), self.dense1.get_col(1))
+        self.assertEqual(self.sparse1.get_element(3, -1), 9)
+        self.assertEqual(self.sparse2.get_first_non_zero_element_in_col(3, 2).index, 2)
+        self.assertIsNone(self.sparse2.get_first_non_zero_element_in_col(0))
+        self.assertTrue(self.sparse2.all_elements_zero_in_col(2))
+        self.assertTrue(self.sparse2.all_elements_zero_in_row(0, 0) is False)
+        self.assertTrue(self.sparse2.all_elements_zero_in_row(1, 4))
+
+    def test_mutation(self):
+        self.sparse1.set_row(1, [0,7,0])
+        self.dense1.set_row(1, [0,7,0])
+        self.sparse1.set_col(0, [1,0,0,2])
+        self.dense1.set_col(0, [1,0,0,2])
+        self.assertEqual(self.sparse1, self.dense1)
+        self.sparse1.delete_row(0)
+        self.dense1.delete_row(0)
+        self.sparse1.delete_col(1)
+        self.dense1.delete_col(1)
+        self.assertEqual(self.sparse1, self.dense1)
+
+    def test_arithmetic(self):
+        self.assertEqual(self.sparse1 + self.sparse1, self.dense1 + self.dense1)
+        self.assertEqual(self.sparse1 - self.dense1, matrix.Matrix([[0]*3]*4))
+        self.assertEqual(self.dense1 + self.sparse1, self.dense1 + self.dense1)
+        self.assertEqual(self.dense1 - self.sparse1.scalar_muliplication(2), self.dense1 - self.dense1.scalar_muliplication(2))
+        self.assertEqual((self.sparse1 - self.sparse1).nonzero_count(), 0)
+        self.assertEqual(self.sparse2.transposed(), self.dense2.transposed())
+
+    def test_in_place_scaling(self):
+        values = self.sparse1.values
+        self.sparse1 *= 2
+        self.assertIs(self.sparse1.values, values)
+        self.assertEqual(self.sparse1, self.dense1.scalar_muliplication(2))
+        self.sparse1.scale(3)
+        self.assertEqual(self.sparse1, self.dense1.scalar_muliplication(6))
+        out = matrix.Matrix([[0]*3]*4)
+        self.assertIs(self.sparse1.scalar_muliplication(0.5, out=out), out)
+        self.assertEqual(out, self.dense1.scalar_muliplication(3.0))
+        self.sparse1 *= 0
+        self.assertEqual(self.sparse1.nonzero_count(), 0)
+        self.assertEqual(self.sparse1.row_pointers, [0]*5)
+        self.assertEqual(self.sparse1, matrix.Matrix([[0]*3]*4))
+
+    def test_products(self):
+        expected = self.dense2.transposed()*self.dense1
+        self.assertEqual(self.sparse2.transposed()*self.sparse1, expected)
+        self.assertIsInstance(self.sparse2.transposed()*self.sparse1, sparse_matrix.SparseMatrix)
+        self.assertEqual(self.sparse2.transposed()*self.dense1, expected)
+        self.assertEqual(self.dense2.transposed()*self.sparse1, expected)
+
+    def test_row_echelon_form(self):
+        self.assertMatrixAlmostEqual(self.sparse1.row_echelon_form(), self.dense1.row_echelon_form())
+        self.assertMatrixAlmostEqual(self.sparse2.row_echelon_form(), self.dense2.row_echelon_form())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+try:
+    from collections.abc import Sequence
+except ImportError:
+    from collections import Sequence
+
+
+class VectorView(Sequence):
+    # Strided window into a flat buffer. Reads and writes go to the buffer, nothing is copied.
+    def __init__(self, data, offset, stride, length, buffer=None):
+        self.data = data
+        self.offset = offset
+        self.stride = stride
+        self.length = length
+        self.buffer = buffer
+
+    def __len__(self):
+        return self.length
+
+    def get_index(self, i):
+        if i < 0:
+            i += self.length
+        if not 0 <= i < self.length:
+            raise IndexError("vector index out of range")
+        return self.offset + i*self.stride
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            start, stop, step = i.indices(self.length)
+            return VectorView(self.data, self.offset + start*self.stride, self.stride*step, len(range(start, stop, step)), self.buffer)
+        return self.data[self.get_index(i)]
+
+    def __setitem__(self, i, value):
+        self.data[self.get_index(i)] = value
+        if self.buffer is not None:
+            self.buffer.version += 1
+
+    def __iter__(self):
+        data = self.data
+        for k in range(self.length):
+            yield data[self.offset + k*self.stride]
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def __eq__(self, other):
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class IndexedView(VectorView):
+    # Window into a row (or any sequence) through an index map. Writes call owner.invalidate_decomposition,
+    # so a matrix whose row is written through a view drops its cached decomposition.
+    def __init__(self, data, indices, owner=None):
+        VectorView.__init__(self, data, 0, 1, len(indices))
+        self.indices = indices
+        self.owner = owner
+
+    def get_index(self, i):
+        return self.indices[i]
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return IndexedView(self.data, self.indices[i], self.owner)
+        return self.data[self.indices[i]]
+
+    def __setitem__(self, i, value):
+        self.data[self.indices[i]] = value
+        if self.owner is not None:
+            self.owner.invalidate_decomposition()
+
+    def __iter__(self):
+        data = self.data
+        for index in self.indices:
+            yield data[index]
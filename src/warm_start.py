@@ -0,0 +1,87 @@
+from sparse_matrix import SparseMatrix, to_sparse, from_rows
+from revised_simplex import RevisedSimplex, TOLERANCE, REFACTOR_INTERVAL
+
+
+class WarmStartSolver(object):
+    # Keeps the basis of the last solve between edits of the model. A new c leaves the basis primal feasible,
+    # so primal simplex continues from it; a new b or an appended row leaves it dual feasible, so dual simplex
+    # restores feasibility. When the basis is neither, the model is solved again with both phases.
+    # dual_c is the objective the basis is dual feasible for, so after update with both a new c and a new b
+    # dual simplex still runs against it before primal simplex takes the new c, in one re-optimisation.
+    # pivots is the number of pivots the last solve or re-optimisation took.
+    def __init__(self, c, A, b, tolerance=TOLERANCE, refactor_interval=REFACTOR_INTERVAL, pivot_selector=None):
+        assert A.row_count == len(b)
+        assert A.col_count == len(c)
+        self.c = list(c)
+        self.A = A if isinstance(A, SparseMatrix) else to_sparse(A)
+        self.b = list(b)
+        self.tolerance = tolerance
+        self.refactor_interval = refactor_interval
+        self.pivot_selector = pivot_selector
+        self.simplex = None
+        self.primal_feasible = False
+        self.dual_feasible = False
+        self.dual_c = None
+        self.result = None
+        self.pivots = 0
+
+    def solve(self):
+        self.simplex = RevisedSimplex(self.c, self.A, self.b, self.tolerance, self.refactor_interval, self.pivot_selector)
+        self.result = self.simplex.run()
+        self.pivots = self.simplex.iterations
+        self.primal_feasible = self.result.status != "UNFEASIBLE"
+        self.dual_feasible = self.result.status == "SUCCESSFUL"
+        self.dual_c = self.c
+        if self.primal_feasible:
+            self.simplex.drop_artificials()
+        return self.result
+
+    def reoptimise(self):
+        if self.simplex is None or not (self.primal_feasible or self.dual_feasible):
+            return self.solve()
+        start = self.simplex.iterations
+        self.simplex.c = self.c
+        if not self.primal_feasible:
+            self.primal_feasible = self.simplex.dual(self.get_dual_cost)
+        if not self.primal_feasible:
+            self.result = self.simplex.get_result("UNFEASIBLE")
+        else:
+            self.dual_feasible = self.simplex.primal(self.simplex.get_phase_two_cost, False)
+            self.dual_c = self.c
+            self.result = self.simplex.get_result("SUCCESSFUL" if self.dual_feasible else "UNBOUNDED")
+        self.pivots = self.simplex.iterations - start
+        return self.result
+
+    def get_dual_cost(self, j):
+        return float(self.dual_c[j]) if j < len(self.dual_c) else 0.0
+
+    def update(self, c=None, b=None):
+        # Applies a new c, a new b or both and re-optimises once.
+        if c is not None:
+            assert len(c) == len(self.c)
+            self.c = list(c)
+        if b is not None:
+            assert len(b) == len(self.b)
+            self.b = list(b)
+            if self.dual_feasible:
+                self.simplex.set_b(self.b)
+            self.primal_feasible = False
+        return self.reoptimise()
+
+    def set_c(self, c):
+        return self.update(c=c)
+
+    def set_b(self, b):
+        return self.update(b=b)
+
+    def add_constraint(self, coefficients, bound):
+        # Appends coefficients^T x <= bound.
+        assert len(coefficients) == len(self.c)
+        row = dict((j, element) for j, element in enumerate(coefficients) if element != 0)
+        self.A = from_rows(self.A.get_row_dicts() + [row], len(self.c))
+        self.b.append(bound)
+        if self.dual_feasible:
+            indices = sorted(row)
+            self.simplex.add_row(indices, [row[j] for j in indices], bound)
+        self.primal_feasible = False
+        return self.reoptimise()
@@ -0,0 +1,99 @@
+import linear_programming
+import matrix
+import random
+import revised_simplex
+import warm_start
+import unittest
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.A = matrix.Matrix([
+            [2, -1],
+            [1, 2],
+            [-1, 2]
+        ])
+        self.b = [4, 9, 3]
+        self.c = [2, 5]
+        self.solver = linear_programming.LinearProgramming(self.c, self.A, self.b).warm_start_solver()
+        self.solver.solve()
+
+    def assertSameAsFresh(self, result, c, A, b):
+        fresh = revised_simplex.RevisedSimplex(c, A, b).run()
+        self.assertEqual(result.status, fresh.status)
+        self.assertAlmostEqual(result.value, fresh.value)
+        for element, expected in zip(result.x_values, fresh.x_values):
+            self.assertAlmostEqual(element, expected)
+
+    def test_solve(self):
+        self.assertAlmostEqual(self.solver.result.value, 21)
+        self.assertEqual(self.solver.pivots, 3)
+
+    def test_set_c(self):
+        result = self.solver.set_c([3, 1])
+        self.assertSameAsFresh(result, [3, 1], self.A, self.b)
+        self.assertLessEqual(self.solver.pivots, 1)
+        result = self.solver.set_c([2, 1])
+        self.assertSameAsFresh(result, [2, 1], self.A, self.b)
+        self.assertEqual(self.solver.pivots, 0)
+
+    def test_set_b(self):
+        result = self.solver.set_b([4, 6, 3])
+        self.assertSameAsFresh(result, self.c, self.A, [4, 6, 3])
+        self.assertLessEqual(self.solver.pivots, 1)
+        result = self.solver.set_b([-1, -1, 3])
+        self.assertEqual(result.status, "UNFEASIBLE")
+        result = self.solver.set_b([4, 9, 3])
+        self.assertAlmostEqual(result.value, 21)
+
+    def test_update(self):
+        result = self.solver.update([3, 1], [4, 6, 3])
+        self.assertSameAsFresh(result, [3, 1], self.A, [4, 6, 3])
+        result = self.solver.update([1, 1], [-1, -1, 3])
+        self.assertEqual(result.status, "UNFEASIBLE")
+        solves = []
+        self.solver.solve = lambda: solves.append(None)
+        result = self.solver.update([1, 3], [5, 9, 4])
+        self.assertSameAsFresh(result, [1, 3], self.A, [5, 9, 4])
+        self.assertEqual(solves, [])
+
+    def test_update_random(self):
+        generator = random.Random(2)
+        A = matrix.Matrix([[generator.randint(-3, 6) for _ in range(5)] for _ in range(6)])
+        solver = warm_start.WarmStartSolver([1]*5, A, [10]*6)
+        solver.solve()
+        for _ in range(30):
+            c = [generator.randint(-3, 8) for _ in range(5)]
+            b = [generator.randint(-2, 20) for _ in range(6)]
+            # Optima need not be unique, so only the status and value are compared.
+            result, fresh = solver.update(c, b), revised_simplex.RevisedSimplex(c, A, b).run()
+            self.assertEqual(result.status, fresh.status)
+            if fresh.status == "SUCCESSFUL":
+                self.assertAlmostEqual(result.value, fresh.value)
+
+    def test_add_constraint(self):
+        result = self.solver.add_constraint([0, 1], 2)
+        A = matrix.Matrix([[2, -1], [1, 2], [-1, 2], [0, 1]])
+        self.assertSameAsFresh(result, self.c, A, [4, 9, 3, 2])
+        self.assertLessEqual(self.solver.pivots, 2)
+        result = self.solver.add_constraint([1, 1], -1)
+        self.assertEqual(result.status, "UNFEASIBLE")
+
+    def test_unbounded(self):
+        solver = warm_start.WarmStartSolver([2, 1], matrix.Matrix([[-1, 1], [1, -2]]), [1, 2])
+        self.assertEqual(solver.solve().status, "UNBOUNDED")
+        result = solver.set_c([-1, 1])
+        self.assertSameAsFresh(result, [-1, 1], matrix.Matrix([[-1, 1], [1, -2]]), [1, 2])
+        result = solver.set_b([1, 1])
+        self.assertSameAsFresh(result, [-1, 1], matrix.Matrix([[-1, 1], [1, -2]]), [1, 1])
+
+    def test_unfeasible_start(self):
+        A = matrix.Matrix([[1, 1, 1], [-1, -1, 1]])
+        solver = warm_start.WarmStartSolver([-1, 2, -2], A, [-5, -5])
+        self.assertEqual(solver.solve().status, "UNFEASIBLE")
+        result = solver.set_b([5, -5])
+        self.assertSameAsFresh(result, [-1, 2, -2], A, [5, -5])
+
+
+if __name__ == '__main__':
+    unittest.main()